@@ -5,6 +5,11 @@ Evaluates tselect against real PyTorch PRs.
 
 Usage:
     python3 evaluate.py
+    python3 evaluate.py --repo-root ~/pytorch --graph ./dependency_graph.json
+
+Selection goes through tselect.api.SelectionSession: the graph is loaded
+once, every PR's changed symbols are extracted once, and each condition
+re-selects all PRs with select_many().
 
 Output:
     For each PR:
@@ -15,18 +20,20 @@ Output:
     Summary table across all PRs.
 """
 
+import argparse
 import json
 import sys
 from pathlib import Path
 
-sys.path.insert(0, '/Users/nihalkumar/Desktop/nbaworks/tselect')
+sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from tselect.core.graph_selector import select_tests_from_graph
+from tselect.api import SelectionSession
 
 # ── config ────────────────────────────────────────────────────────────────────
+# defaults — override with --repo-root / --graph
 
-GRAPH_FILE  = '/Users/nihalkumar/pytorch/.graph/tselect/dependency_graph.json'
 REPO_ROOT   = Path('/Users/nihalkumar/pytorch')
+GRAPH_FILE  = Path('.graph/tselect/dependency_graph.json')   # relative to the repo root
 
 # The 2 PRs we collected
 PRS = [
@@ -34,7 +41,7 @@ PRS = [
         "pr_number":     178239,
         "run_id":        23475293782,
         "artifact_id":   6074130554,
-        "td_file":       "/Users/nihalkumar/pytorch/td_6074130554/td_results.json",
+        "td_file":       "td_6074130554/td_results.json",   # relative to the repo root
         "changed_files": [
             "test/higher_order_ops/test_invoke_subgraph.py",
             "torch/_dynamo/variables/invoke_subgraph.py",
@@ -48,7 +55,7 @@ PRS = [
         "pr_number":     178199,
         "run_id":        23474882722,
         "artifact_id":   6073989664,
-        "td_file":       "/Users/nihalkumar/pytorch/td_6073989664/td_results.json",
+        "td_file":       "td_6073989664/td_results.json",
         "changed_files": [
             "torch/distributed/tensor/experimental/_context_parallel/_load_balancer.py",
         ],
@@ -77,9 +84,9 @@ CONDITIONS = {
 
 # ── helpers ───────────────────────────────────────────────────────────────────
 
-def load_graph():
-    print(f"Loading graph from {GRAPH_FILE}...")
-    with open(GRAPH_FILE) as f:
+def load_graph(graph_file):
+    print(f"Loading graph from {graph_file}...")
+    with open(graph_file) as f:
         graph = json.load(f)
     print(f"  Keys: {list(graph.keys())}")
     return graph
@@ -91,17 +98,13 @@ def load_td_baseline(td_file):
     original = set(data["_original_tests"])
     return selected, original
 
-def run_condition(pr, graph, condition_name, config):
-    try:
-        selected, total_methods = select_tests_from_graph(
-            changed_files = pr["changed_files"],
-            graph         = graph,
-            repo_root     = REPO_ROOT,
-            config        = config,
-        )
-        return selected, total_methods, None
-    except Exception as e:
-        import traceback; return {}, 0, traceback.format_exc()
+def run_condition(session, config):
+    """All PRs under one condition — [(selected, total_methods, error)] in PR order."""
+    session.config = config
+    results = session.select_many([
+        {"id": pr["pr_number"], "changed_files": pr["changed_files"]} for pr in PRS
+    ])
+    return [(r["selected"], r["total_tests"], r["error"]) for r in results]
 
 def compare_with_baseline(selected_files, baseline_selected):
     our_set      = set(selected_files.keys())
@@ -132,15 +135,30 @@ def compare_with_baseline(selected_files, baseline_selected):
 # ── main ──────────────────────────────────────────────────────────────────────
 
 def main():
-    graph = load_graph()
-    
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repo-root", default=str(REPO_ROOT),
+                        help="PyTorch checkout the graph was built for")
+    parser.add_argument("--graph", default=None,
+                        help=f"Dependency graph (default: <repo-root>/{GRAPH_FILE})")
+    args = parser.parse_args()
+
+    repo_root = Path(args.repo_root).expanduser().resolve()
+    graph     = load_graph(Path(args.graph) if args.graph else repo_root / GRAPH_FILE)
+
+    # one session: changed symbols are extracted once and shared by every condition
+    session   = SelectionSession(repo_root, graph=graph, config={})
+    by_condition = {
+        condition_name: run_condition(session, config)
+        for condition_name, config in CONDITIONS.items()
+    }
+
     print("\n" + "="*80)
-    print("TSELECT EVALUATION — 2 PRs")
+    print(f"TSELECT EVALUATION — {len(PRS)} PRs")
     print("="*80)
     
     all_results = []
     
-    for pr in PRS:
+    for i, pr in enumerate(PRS):
         print(f"\n{'─'*80}")
         print(f"PR #{pr['pr_number']} — {pr['description']}")
         print(f"Changed files:")
@@ -148,7 +166,7 @@ def main():
             print(f"  {f}")
         
         # load baseline from td_results.json
-        baseline_selected, baseline_original = load_td_baseline(pr["td_file"])
+        baseline_selected, baseline_original = load_td_baseline(repo_root / pr["td_file"])
         print(f"\nBaseline (td_results.json): {len(baseline_selected)}/{len(baseline_original)} selected")
         
         print(f"\n{'CONDITION':<35} {'SELECTED':>10} {'OVERLAP%':>10} {'ONLY OURS':>10} {'ONLY BASE':>10}")
@@ -156,8 +174,8 @@ def main():
         
         pr_results = {"pr": pr["pr_number"], "conditions": {}}
         
-        for condition_name, config in CONDITIONS.items():
-            selected, total_methods, error = run_condition(pr, graph, condition_name, config)
+        for condition_name, results in by_condition.items():
+            selected, total_methods, error = results[i]
             
             if error:
                 print(f"{condition_name:<35} ERROR: {error}")
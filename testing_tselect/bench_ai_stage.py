@@ -0,0 +1,230 @@
+"""
+bench_ai_stage.py
+-----------------
+Offline benchmark of the AI stage — no network, no API key.
+
+Runs PreFilter and PostAnalyzer against the local stand-in provider
+(ai.provider: local) on synthetic selections of 10, 100 and 1,000
+candidates and reports, per scenario:
+    wall time, requests, prompt / completion tokens (chars/4),
+    candidates removed, candidates failed open
+
+Scenarios:
+    sequential     max_concurrency 1, no batching, no cache
+    concurrent     max_concurrency 8
+    batched        concurrent + batch_size 8
+    cached         batched, second run against a warm decision cache
+    flaky          concurrent, 30% transient errors (retried)
+    outage         concurrent, every call fails (circuit breaker)
+    post-analysis  300 failures in 4 failure modes → clustered requests
+
+Usage:
+    python3 testing_tselect/bench_ai_stage.py
+    python3 testing_tselect/bench_ai_stage.py --sizes 10 100 --latency 0.05
+    python3 testing_tselect/bench_ai_stage.py --json results.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tselect.ai.decision_cache import DecisionCache
+from tselect.ai.llm_client import LLMClient
+from tselect.ai.post_analyzer import PostAnalyzer
+from tselect.ai.pre_filter import PreFilter
+
+CHANGED_FILES   = ["pkg/ops/arith.py"]
+CHANGED_SYMBOLS = {"pkg/ops/arith.py": {"add", "Scaler.mul"}}
+
+# sequential runs above this many candidates are skipped unless --full
+SEQUENTIAL_LIMIT = 100
+
+
+# ─────────────────────────────────────────────
+# Synthetic inputs
+# ─────────────────────────────────────────────
+
+def make_selection(n: int) -> dict:
+    """n candidate test files — every 4th tests a changed symbol."""
+    selected = {}
+    for i in range(n):
+        test_file = f"test/ops/test_case_{i:04d}.py"
+        topic     = "add" if i % 4 == 0 else f"reduce{i % 7}"
+        classes   = {}
+        for c in range(2):
+            cls = f"Test{topic.capitalize()}{c}"
+            classes[cls] = {
+                "test_count": 12,
+                "node_ids":   [f"{test_file}::{cls}::test_{topic}_{m}" for m in range(12)],
+            }
+        selected[test_file] = {
+            "triggered_by":    CHANGED_FILES,
+            "matched_symbols": [],
+            "selection_mode":  "file",
+            "classes":         classes,
+        }
+    return selected
+
+
+def make_failures(n: int = 300) -> tuple:
+    """n failed node ids spread over 4 distinct failure modes."""
+    modes = [
+        ("KeyError",       "pkg/ops/arith.py", "add"),
+        ("AssertionError", "pkg/ops/arith.py", "mul"),
+        ("TypeError",      "pkg/ops/lower.py", "lower_add"),
+        ("RuntimeError",   "pkg/ops/fuse.py",  "fuse"),
+    ]
+    failed, tracebacks = [], {}
+    for i in range(n):
+        exc, path, func = modes[i % len(modes)]
+        node_id = f"test/ops/test_case_{i % 40:04d}.py::TestOps::test_p[{i}]"
+        failed.append(node_id)
+        tracebacks[node_id] = (
+            f"    def test_p(self):\n>       run({i})\n\ntest/ops/test_case_{i % 40:04d}.py:9: \n"
+            f"_ _ _ _\n\n    def {func}(x):\n>       raise {exc}(x)\nE       {exc}: {i}\n\n"
+            f"{path}:42: {exc}"
+        )
+    return failed, tracebacks
+
+
+# ─────────────────────────────────────────────
+# Runs
+# ─────────────────────────────────────────────
+
+def _config(latency: float, **ai) -> dict:
+    base = {
+        "provider":            "local",
+        "timeout":             max(1.0, latency * 20),
+        "retry_backoff":       0.01,
+        "requests_per_minute": 0,        # measure the stage, not the rate limit
+        "deadline":            600,
+        "gate_tiers":          None,
+        "token_budget":        0,
+        "local": {"latency": latency, "jitter": latency / 4, "seed": 0},
+    }
+    local = {**base["local"], **ai.pop("local", {})}
+    base.update(ai, local=local)
+    return {"ai": base}
+
+
+def run_prefilter(selected: dict, config: dict, cache=None) -> dict:
+    llm = LLMClient(config)
+    pf  = PreFilter(llm, config, cache=cache)
+
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        filtered, decisions = pf.filter(selected, CHANGED_FILES, CHANGED_SYMBOLS)
+    wall = time.perf_counter() - t0
+
+    return {
+        "candidates":        len(selected),
+        "wall_seconds":      round(wall, 3),
+        "requests":          llm.stats["requests"],
+        "failed_requests":   llm.stats["failures"],
+        "prompt_tokens":     llm.stats["prompt_tokens"],
+        "completion_tokens": llm.stats["completion_tokens"],
+        "removed":           len(selected) - len(filtered),
+        "failed_open":       sum(1 for d in decisions if d["reason"] == "AI unavailable — kept by default"),
+    }
+
+
+def run_postanalysis(config: dict) -> dict:
+    failed, tracebacks = make_failures()
+    llm                = LLMClient(config)
+    analyzer           = PostAnalyzer(llm)
+
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        analysis = analyzer.analyze(
+            failed_tests    = failed,
+            changed_files   = CHANGED_FILES,
+            changed_symbols = CHANGED_SYMBOLS,
+            failed          = len(failed),
+            tracebacks      = tracebacks,
+        )
+    wall = time.perf_counter() - t0
+
+    return {
+        "failures":      len(failed),
+        "clusters":      len((analysis or {}).get("clusters", [])),
+        "wall_seconds":  round(wall, 3),
+        "requests":      llm.stats["requests"],
+        "prompt_tokens": llm.stats["prompt_tokens"],
+    }
+
+
+def run_suite(sizes: list, latency: float, full: bool) -> dict:
+    results = {"latency": latency, "prefilter": [], "post_analysis": None}
+
+    for n in sizes:
+        selected  = make_selection(n)
+        scenarios = []
+        if n <= SEQUENTIAL_LIMIT or full:
+            scenarios.append(("sequential", _config(latency, max_concurrency=1)))
+        scenarios += [
+            ("concurrent", _config(latency, max_concurrency=8)),
+            ("batched",    _config(latency, max_concurrency=8, batch_size=8)),
+            ("flaky",      _config(latency, max_concurrency=8, local={"error_rate": 0.3})),
+            ("outage",     _config(latency, max_concurrency=8, local={"error_rate": 1.0})),
+        ]
+        for name, config in scenarios:
+            results["prefilter"].append({"scenario": name, **run_prefilter(selected, config)})
+
+        # warm the cache with one batched run, then measure the repeat
+        with tempfile.TemporaryDirectory() as tmp:
+            config = _config(latency, max_concurrency=8, batch_size=8)
+            cache  = DecisionCache(Path(tmp) / "ai_decisions.json")
+            run_prefilter(selected, config, cache=cache)
+            results["prefilter"].append(
+                {"scenario": "cached", **run_prefilter(selected, config, cache=cache)}
+            )
+
+    results["post_analysis"] = run_postanalysis(_config(latency, max_concurrency=8))
+    return results
+
+
+def print_results(results: dict) -> None:
+    print(f"\nAI stage benchmark — local provider, {results['latency'] * 1000:.0f} ms/call")
+    print("─" * 92)
+    print(f"{'scenario':<12} {'cands':>6} {'wall s':>8} {'reqs':>6} {'failed':>7} "
+          f"{'prompt tok':>11} {'compl tok':>10} {'removed':>8} {'fail-open':>10}")
+    print("─" * 92)
+    for r in results["prefilter"]:
+        print(f"{r['scenario']:<12} {r['candidates']:>6} {r['wall_seconds']:>8.2f} "
+              f"{r['requests']:>6} {r['failed_requests']:>7} {r['prompt_tokens']:>11} "
+              f"{r['completion_tokens']:>10} {r['removed']:>8} {r['failed_open']:>10}")
+    pa = results["post_analysis"]
+    print("─" * 92)
+    print(f"post-analysis: {pa['failures']} failures → {pa['clusters']} clusters, "
+          f"{pa['requests']} requests, {pa['prompt_tokens']} prompt tokens, "
+          f"{pa['wall_seconds']:.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline AI-stage benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--latency", type=float, default=0.05,
+                        help="Simulated seconds per LLM call")
+    parser.add_argument("--full", action="store_true",
+                        help=f"Also run sequential above {SEQUENTIAL_LIMIT} candidates")
+    parser.add_argument("--json", help="Write raw results to this file")
+    args = parser.parse_args()
+
+    results = run_suite(args.sizes, args.latency, args.full)
+    print_results(results)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
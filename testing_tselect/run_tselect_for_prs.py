@@ -1,13 +1,16 @@
 """
 run_tselect_for_prs.py
 -----------------------
-Runs tselect for each PR using the actual Python API:
-    select_tests_from_graph(changed_files, graph, repo_root, config)
+Runs tselect for each PR using the batch Python API:
+    SelectionSession(repo_root, config=CONFIG).select_many(changesets)
+
+The graph is loaded once and all PRs are selected in one call.
 
 Usage:
     python3 run_tselect_for_prs.py
     python3 run_tselect_for_prs.py --pr 152993
     python3 run_tselect_for_prs.py --all
+    python3 run_tselect_for_prs.py --repo-root ~/pytorch --results-dir ./out
 """
 
 import json
@@ -17,14 +20,14 @@ import argparse
 import urllib.request
 from pathlib import Path
 
-sys.path.insert(0, '/Users/nihalkumar/Desktop/nbaworks/tselect')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from tselect.core.graph_selector import select_tests_from_graph
+from tselect.api import SelectionSession
 
 # ── Config ────────────────────────────────────────────────────
-GRAPH_FILE  = '/Users/nihalkumar/pytorch/.graph/tselect/dependency_graph.json'
+# defaults — override with --repo-root / --results-dir
 REPO_ROOT   = Path('/Users/nihalkumar/pytorch')
-RESULTS_DIR = Path('/Users/nihalkumar/Desktop/nbaworks/tselect/tselect_test')
+RESULTS_DIR = Path(__file__).resolve().parent.parent / 'tselect_test'
 
 CONFIG = {
     "graph": {"fanout_threshold": 30, "transitive_depth": 1}
@@ -109,46 +112,39 @@ def fetch_changed_files_from_github(pr_number: str) -> list[str]:
         return []
 
 
-def run_pr(pr_info: dict, graph: dict, use_github: bool = True) -> dict:
-    pr = pr_info["pr"]
-    print(f"\n{'─'*60}")
-    print(f"PR #{pr} — {pr_info['desc']} [{pr_info['category']}]")
-
+def resolve_changed_files(pr_info: dict, use_github: bool = True) -> list[str]:
     # Try GitHub first, fall back to hardcoded
     changed_files = []
     if use_github:
-        changed_files = fetch_changed_files_from_github(pr)
+        changed_files = fetch_changed_files_from_github(pr_info["pr"])
 
     if not changed_files:
-        changed_files = pr_info["changed_files"]
-        print(f"  Using hardcoded changed files")
-    else:
-        print(f"  Fetched {len(changed_files)} changed files from GitHub")
+        print(f"  PR #{pr_info['pr']}: using hardcoded changed files")
+        return pr_info["changed_files"]
+
+    print(f"  PR #{pr_info['pr']}: fetched {len(changed_files)} changed files from GitHub")
+    return changed_files
+
+
+def write_pr(pr_info: dict, changed_files: list, result: dict, results_dir: Path) -> dict:
+    pr = pr_info["pr"]
+    print(f"\n{'─'*60}")
+    print(f"PR #{pr} — {pr_info['desc']} [{pr_info['category']}]")
 
     print(f"  Changed files:")
     for f in changed_files:
         print(f"    {f}")
 
-    # Run tselect
-    try:
-        selected, total_methods = select_tests_from_graph(
-            changed_files=changed_files,
-            graph=graph,
-            repo_root=REPO_ROOT,
-            config=CONFIG,
-        )
-        error = None
-    except Exception as e:
-        import traceback
-        selected = {}
-        total_methods = 0
-        error = traceback.format_exc()
-        print(f"  ERROR: {e}")
+    selected      = result["selected"]
+    total_methods = result["total_tests"]
+    error         = result["error"]
+    if error:
+        print(f"  ERROR: {error}")
 
     print(f"  Selected tests: {len(selected)}")
 
     # Save results
-    out_dir = RESULTS_DIR / pr
+    out_dir = results_dir / pr
     out_dir.mkdir(parents=True, exist_ok=True)
 
     # Write selected_tests.txt
@@ -196,20 +192,25 @@ def main():
     parser.add_argument("--all", action="store_true", default=True)
     parser.add_argument("--no-github", action="store_true",
                         help="Skip GitHub API, use hardcoded files only")
+    parser.add_argument("--repo-root", default=str(REPO_ROOT),
+                        help="Repository with .graph/tselect/dependency_graph.json")
+    parser.add_argument("--results-dir", default=str(RESULTS_DIR),
+                        help="Where per-PR results are written")
     args = parser.parse_args()
 
-    # Load graph
-    print(f"Loading dependency graph from {GRAPH_FILE}...")
-    if not Path(GRAPH_FILE).exists():
-        print(f"ERROR: Graph file not found: {GRAPH_FILE}")
-        print("Run tselect graph build first.")
-        sys.exit(1)
+    repo_root   = Path(args.repo_root).expanduser()
+    results_dir = Path(args.results_dir).expanduser()
 
-    with open(GRAPH_FILE) as f:
-        graph = json.load(f)
-    print(f"  Graph loaded. Keys: {list(graph.keys())[:5]}...")
+    # Load graph once
+    print(f"Loading dependency graph from {repo_root}...")
+    try:
+        session = SelectionSession(repo_root, config=CONFIG)
+    except RuntimeError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+    print(f"  Graph loaded. Keys: {list(session.graph.keys())[:5]}...")
 
-    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    results_dir.mkdir(parents=True, exist_ok=True)
 
     prs_to_run = PRS
     if args.pr:
@@ -218,10 +219,16 @@ def main():
             print(f"PR #{args.pr} not in slate")
             sys.exit(1)
 
-    results = []
-    for pr_info in prs_to_run:
-        result = run_pr(pr_info, graph, use_github=not args.no_github)
-        results.append(result)
+    changesets = [
+        {"id": p["pr"], "changed_files": resolve_changed_files(p, use_github=not args.no_github)}
+        for p in prs_to_run
+    ]
+    selections = session.select_many(changesets)
+
+    results = [
+        write_pr(pr_info, cs["changed_files"], sel, results_dir)
+        for pr_info, cs, sel in zip(prs_to_run, changesets, selections)
+    ]
 
     # Summary
     print(f"\n{'═'*60}")
@@ -234,7 +241,7 @@ def main():
         print(f"#{r['pr']:<9} {pr_info['category']:<16} "
               f"{len(r['selected']):>10} {len(r['changed_files']):>15}")
 
-    print(f"\nResults saved to: {RESULTS_DIR}")
+    print(f"\nResults saved to: {results_dir}")
 
 
 if __name__ == "__main__":
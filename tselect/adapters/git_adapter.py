@@ -1,4 +1,7 @@
+import atexit
 import subprocess
+import threading
+from pathlib import Path
 
 def get_changed_files(base="upstream/main", target="HEAD"):
     try:
@@ -34,3 +37,97 @@ def get_changed_files(base="upstream/main", target="HEAD"):
     except Exception as e:
         print("Failed to detect changed files from git:", e)
         return []
+
+
+# ─────────────────────────────────────────────
+# Base-revision blob reader
+# ─────────────────────────────────────────────
+
+class GitBlobReader:
+    """
+    Reads files at a revision through one long-lived `git cat-file --batch`
+    process instead of one `git show` per file.
+
+        reader = get_blob_reader(repo_root)
+        source = reader.read(merge_base, "torch/optim/sgd.py")   # None if absent
+
+    Thread-safe (requests are serialized on the pipe). If the process dies
+    it is restarted once per read; a reader that can't start returns None.
+    """
+
+    def __init__(self, repo_root):
+        self.repo_root = str(repo_root)
+        self._proc     = None
+        self._lock     = threading.Lock()
+
+    def _start(self):
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=self.repo_root,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        )
+
+    def _request(self, spec: bytes):
+        if self._proc is None or self._proc.poll() is not None:
+            self._start()
+        self._proc.stdin.write(spec + b"\n")
+        self._proc.stdin.flush()
+
+        header = self._proc.stdout.readline()
+        if not header:
+            raise OSError("git cat-file exited")
+        parts = header.split()
+        if len(parts) != 3:                       # "<spec> missing" / "ambiguous"
+            return None
+        size = int(parts[2])
+        data = self._proc.stdout.read(size)
+        self._proc.stdout.read(1)                 # trailing newline
+        return data if parts[1] == b"blob" else None
+
+    def read(self, rev: str, rel_path: str):
+        """File contents at rev as text, or None (missing, not a blob, git error)."""
+        spec = f"{rev}:{Path(rel_path).as_posix()}".encode()
+        with self._lock:
+            for _ in range(2):
+                try:
+                    data = self._request(spec)
+                    break
+                except (OSError, ValueError):
+                    self._close()
+            else:
+                return None
+        return data.decode("utf-8", errors="ignore") if data is not None else None
+
+    def _close(self):
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except Exception:
+            proc.kill()
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+
+_readers      = {}
+_readers_lock = threading.Lock()
+
+
+def get_blob_reader(repo_root) -> GitBlobReader:
+    """The process-wide reader for repo_root — started on first read."""
+    key = str(Path(repo_root).resolve())
+    with _readers_lock:
+        reader = _readers.get(key)
+        if reader is None:
+            reader = _readers[key] = GitBlobReader(key)
+        return reader
+
+
+@atexit.register
+def _close_readers():
+    for reader in list(_readers.values()):
+        reader.close()
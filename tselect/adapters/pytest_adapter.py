@@ -7,15 +7,50 @@ Strategy:
   - Pass TEST FILES to pytest (not individual node IDs)
   - 20 files fit easily in subprocess args — no OS limit
   - --continue-on-collection-errors — skip broken files, run the rest
-  - Failed tests are visible in live output + parsed for summary
+  - Failed tests are visible in live output
+  - Per-test results (node id, outcome, duration, traceback, worker) come
+    from tselect.adapters.pytest_plugin, streamed as JSON lines and parsed
+    incrementally into a RunResults — no scraping of terminal output
   - If a test file has a broken import, pytest skips it and moves on
+  - start_command()/wait_command() run a second pytest in the background
+    with its output in a log file (tiered stage 2)
+
+Batched mode (runner.batch_size > 0):
+  - Runs node IDs in subprocess batches, each with its own timeout
+  - A batch that dies on a signal (SIGABRT, SIGSEGV) or times out is
+    bisected until the offending node ID is isolated; the rest still run
+  - Finished batches are persisted to BATCH_PROGRESS_FILE so --resume
+    skips them after an interrupted run; a plan is dropped once all its
+    batches finish, and at most MAX_SAVED_PLANS unfinished ones are kept
+  - With a WarmWorkerPool (runner.preload) batches run in forked workers
+    that already have the heavy imports loaded
 """
 
-import re
+import atexit
+import hashlib
+import json
+import os
 import subprocess
 import sys
+import tempfile
+import time
+from collections import deque
 from pathlib import Path
 
+from tselect.adapters.run_results import RunResults, ResultsReader
+
+BATCH_PROGRESS_FILE   = ".tselect_batch_progress.json"
+DEFAULT_BATCH_TIMEOUT = 900
+MAX_SAVED_PLANS       = 8      # unfinished batch plans kept for --resume
+PLUGIN_MODULE         = "tselect.adapters.pytest_plugin"
+
+# --tselect-select files written by node_filter_args, removed at exit
+_filter_files: list = []
+
+# terminal lines kept per run — only to report a plugin that failed to
+# load, so memory stays bounded on giant runs
+OUTPUT_TAIL_LINES = 50
+
 
 def build_pytest_command(node_ids: list[str], extra_args: list[str] = None) -> list[str]:
     """
@@ -58,7 +93,35 @@ def build_pytest_command_from_classes(selected_classes: list[str]) -> list[str]:
     )
 
 
-def execute_command(cmd: list[str]) -> tuple[int, int, int, int]:
+def with_results_plugin(cmd: list[str], results_path: Path) -> list[str]:
+    """Append the tselect results plugin to a pytest command."""
+    return list(cmd) + ["-p", PLUGIN_MODULE, f"--tselect-results={results_path}"]
+
+
+def node_filter_args(node_ids: list[str]) -> list[str]:
+    """
+    Args that narrow a file-level command to exactly these node IDs
+    (via the plugin's --tselect-select). Used when running one CI shard.
+    The node list file lives until tselect exits.
+    """
+    fd, path = tempfile.mkstemp(prefix="tselect-select-", suffix=".txt")
+    with os.fdopen(fd, "w") as f:
+        f.write("\n".join(sorted(set(node_ids))) + "\n")
+    if not _filter_files:
+        atexit.register(_remove_filter_files)
+    _filter_files.append(path)
+    return [f"--tselect-select={path}"]
+
+
+def _remove_filter_files() -> None:
+    while _filter_files:
+        try:
+            os.unlink(_filter_files.pop())
+        except OSError:
+            pass
+
+
+def execute_command(cmd: list[str]) -> RunResults:
     """
     Execute pytest via subprocess with live output.
 
@@ -67,35 +130,331 @@ def execute_command(cmd: list[str]) -> tuple[int, int, int, int]:
       - distributed tests that need CUDA → skip, run the rest
       - user sees exactly which files were skipped and why
 
-    Returns: (return_code, passed, failed, skipped)
+    Per-test results are read from the plugin's results file while pytest
+    runs. Only the last OUTPUT_TAIL_LINES of terminal output are kept.
+
+    Returns: RunResults (return_code, passed/failed/skipped, per-test records)
     """
     if not cmd:
         print("No tests to run.")
-        return 0, 0, 0, 0
+        return RunResults()
+
+    results_path = _new_results_path()
+    results      = RunResults()
+    reader       = ResultsReader(results_path, results)
 
     process = subprocess.Popen(
-        cmd,
+        with_results_plugin(cmd, results_path),
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         text=True,
         cwd=str(Path.cwd()),
     )
 
-    output_lines = []
+    tail = deque(maxlen=OUTPUT_TAIL_LINES)
     for line in process.stdout:
         print(line, end="", flush=True)
-        output_lines.append(line)
+        tail.append(line)
+        reader.poll()
+
+    process.wait()
+    return _finish(results, reader, process.returncode, "".join(tail), results_path)
+
+
+def start_command(cmd: list[str], log_path: Path) -> subprocess.Popen | None:
+    """
+    Start pytest in the background, writing all output to log_path.
+
+    Used for the tiered run's stage 2 when it runs alongside stage 1 —
+    live output would interleave with the foreground run, so it goes to
+    a log file that wait_command() parses once the process exits.
+    """
+    if not cmd:
+        return None
+
+    log_path = Path(log_path)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    log_file     = open(log_path, "w")
+    results_path = _new_results_path()
+
+    process = subprocess.Popen(
+        with_results_plugin(cmd, results_path),
+        stdout=log_file,
+        stderr=subprocess.STDOUT,
+        text=True,
+        cwd=str(Path.cwd()),
+    )
+    process.log_file     = log_file
+    process.results_path = results_path
+    return process
+
+
+def wait_command(process: subprocess.Popen | None, log_path: Path) -> RunResults:
+    """Wait for a start_command() process and collect its results."""
+    if process is None:
+        return RunResults()
 
     process.wait()
-    output = "".join(output_lines)
+    process.log_file.close()
+
+    results = RunResults()
+    reader  = ResultsReader(process.results_path, results)
+    tail    = _read_tail(Path(log_path))
+    return _finish(results, reader, process.returncode, tail, process.results_path)
+
+
+def _new_results_path() -> Path:
+    fd, path = tempfile.mkstemp(prefix="tselect-results-", suffix=".jsonl")
+    os.close(fd)
+    return Path(path)
+
+
+def _finish(
+    results: RunResults,
+    reader: ResultsReader,
+    return_code: int,
+    output_tail: str,
+    results_path: Path,
+) -> RunResults:
+    """Drain the results file; say so if the plugin never loaded."""
+    reader.poll()
+    results.return_code = return_code
+    results_path.unlink(missing_ok=True)
+
+    # killed by a signal (SIGABRT, SIGSEGV) or timed out
+    if return_code < 0 or return_code > 5:
+        results.mark_crashed_in_flight()
+
+    # pytest aborts before running anything when -p can't import the plugin
+    marker = f'Error importing plugin "{PLUGIN_MODULE}"'
+    if not results.records and marker in output_tail:
+        reason = next(
+            (line.strip() for line in output_tail.splitlines() if marker in line), marker
+        )
+        print(f"\n  ⚠️  tselect's pytest plugin could not load in the test interpreter "
+              f"— no tests ran:\n     {reason}")
+    return results
+
+
+def _read_tail(path: Path) -> str:
+    try:
+        with open(path, "r", errors="ignore") as f:
+            return "".join(deque(f, maxlen=OUTPUT_TAIL_LINES))
+    except OSError:
+        return ""
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Batched, crash-isolating execution
+# ─────────────────────────────────────────────────────────────────────────────
+
+def execute_batched(
+    node_ids: list[str],
+    batch_size: int,
+    timeout: int = DEFAULT_BATCH_TIMEOUT,
+    extra_args: list[str] = None,
+    progress_path: Path = None,
+    resume: bool = False,
+    pool = None,
+) -> RunResults:
+    """
+    Run node IDs in subprocess batches of batch_size.
+
+    A batch that crashes (killed by a signal) or exceeds timeout seconds is
+    bisected until the offending node ID is isolated. Crashed node IDs are
+    reported and counted as failed; every other test still gets its result.
+
+    Progress (including per-test results) is saved after each batch.
+    With resume=True, batches already finished for the same node ID list
+    are skipped and their saved results reused.
+
+    pool: optional WarmWorkerPool — batches run in forked warm workers
+          instead of fresh subprocesses.
+    """
+    if not node_ids:
+        print("No tests to run.")
+        return RunResults()
+
+    node_ids      = sorted(set(node_ids))
+    progress_path = Path(progress_path or Path.cwd() / BATCH_PROGRESS_FILE)
+    batches       = [
+        node_ids[i:i + batch_size]
+        for i in range(0, len(node_ids), batch_size)
+    ]
+
+    plan_key = _plan_key(node_ids, batch_size)
+    progress = _load_progress(progress_path)
+    plan     = progress["plans"].get(plan_key) if resume else None
+    if plan is None:
+        plan = {"done": {}}
+    # most recent last — the oldest unfinished plans are dropped first
+    progress["plans"].pop(plan_key, None)
+    progress["plans"][plan_key] = plan
+    while len(progress["plans"]) > MAX_SAVED_PLANS:
+        del progress["plans"][next(iter(progress["plans"]))]
+
+    if pool is not None:
+        pool.start()
+
+    total = len(batches)
+    print(f"  Batched run: {len(node_ids)} tests in {total} batches "
+          f"of {batch_size} (timeout {timeout}s per batch)")
+    if resume and plan["done"]:
+        print(f"  Resuming — {len(plan['done'])}/{total} batches already done")
+    print()
+
+    for i, batch in enumerate(batches, 1):
+        if str(i) in plan["done"]:
+            print(f"  [{i:3}/{total}]  skip (already done)")
+            continue
+
+        print(f"  [{i:3}/{total}]  {len(batch)} tests ...", end="", flush=True)
+        t0      = time.time()
+        result  = _run_isolating(batch, timeout, extra_args, pool)
+        elapsed = time.time() - t0
+
+        icon = "✅" if not result.failed else "⚠️ "
+        print(f"  {icon} {elapsed:.0f}s  "
+              f"{result.passed} passed, {result.failed - len(result.crashed)} failed, "
+              f"{result.skipped} skipped"
+              + (f", {len(result.crashed)} crashed" if result.crashed else ""))
+        for nid in result.failed_node_ids():
+            mark = "💥" if nid in result.crashed else "FAILED"
+            print(f"           {mark} {nid}")
+
+        plan["done"][str(i)] = result.to_dict()
+        _save_progress(progress_path, progress)
+
+    # every batch finished — nothing left to resume for this plan
+    del progress["plans"][plan_key]
+    if progress["plans"]:
+        _save_progress(progress_path, progress)
+    elif progress_path.exists():
+        progress_path.unlink()
+
+    results = RunResults()
+    for data in plan["done"].values():
+        results.merge(RunResults.from_dict(data))
+
+    if results.crashed:
+        print()
+        print(f"  💥 {len(results.crashed)} test(s) crashed the interpreter or timed out:")
+        for nid in results.crashed:
+            print(f"     {nid}")
+
+    results.return_code = 1 if results.failed else next(
+        (
+            data.get("return_code", 0) for data in plan["done"].values()
+            if data.get("return_code", 0) not in (0, 5)
+        ),
+        0,
+    )
+    return results
+
+
+def _run_isolating(
+    batch: list[str],
+    timeout: int,
+    extra_args: list[str] = None,
+    pool = None,
+) -> RunResults:
+    """
+    Run one batch; on crash, bisect until single node IDs are isolated.
+    Isolated node IDs end up in RunResults.crashed.
+    """
+    crashed_run, results = _run_batch(batch, timeout, extra_args, pool)
+    if not crashed_run:
+        return results
+
+    if len(batch) == 1:
+        isolated         = RunResults(results.return_code)
+        isolated.crashed = list(batch)
+        return isolated
+
+    mid    = len(batch) // 2
+    merged = RunResults()
+    for half in (batch[:mid], batch[mid:]):
+        merged.merge(_run_isolating(half, timeout, extra_args, pool))
+    return merged
+
+
+def _run_batch(
+    batch: list[str],
+    timeout: int,
+    extra_args: list[str] = None,
+    pool = None,
+) -> tuple[bool, RunResults]:
+    """
+    Run pytest on one batch of node IDs in a fresh subprocess,
+    or in a forked warm worker when a pool is given.
+
+    Returns: (crashed, results)
+      crashed — killed by a signal or timed out; pytest's own exit codes
+                (0-5) mean the interpreter survived
+    """
+    results_path = _new_results_path()
+    args = with_results_plugin(
+        batch
+        + ["--continue-on-collection-errors", "--tb=short", "--no-header", "-q"]
+        + (extra_args or []),
+        results_path,
+    )
+
+    if pool is not None:
+        crashed, return_code, output = pool.run(args, timeout=timeout)
+    else:
+        cmd = [sys.executable, "-m", "pytest"] + args
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                cwd=str(Path.cwd()),
+                timeout=timeout,
+            )
+            return_code = result.returncode
+            output      = result.stdout
+            crashed     = return_code < 0 or return_code > 5
+        except subprocess.TimeoutExpired:
+            crashed, return_code, output = True, -1, ""
+
+    results = RunResults()
+    reader  = ResultsReader(results_path, results)
+    tail    = "\n".join(output.splitlines()[-OUTPUT_TAIL_LINES:])
+    return crashed, _finish(results, reader, return_code, tail, results_path)
+
+
+def execute_node_ids(
+    node_ids: list[str],
+    pool = None,
+    timeout: int = DEFAULT_BATCH_TIMEOUT,
+    extra_args: list[str] = None,
+) -> RunResults:
+    """
+    Run exactly these node IDs quietly — in a forked warm worker when a
+    pool is given, else a fresh subprocess. A crash is bisected down to
+    the node IDs that caused it. Used by tselect watch.
+    """
+    return _run_isolating(list(node_ids), timeout, extra_args, pool)
+
+
+def _plan_key(node_ids: list[str], batch_size: int) -> str:
+    digest = hashlib.sha1("\n".join(node_ids).encode("utf-8")).hexdigest()
+    return f"{digest[:16]}-{batch_size}"
 
-    passed  = _parse_count(output, r"(\d+) passed")
-    failed  = _parse_count(output, r"(\d+) failed")
-    skipped = _parse_count(output, r"(\d+) skipped")
 
-    return process.returncode, passed, failed, skipped
+def _load_progress(path: Path) -> dict:
+    if path.exists():
+        try:
+            data = json.loads(path.read_text())
+            if isinstance(data.get("plans"), dict):
+                return data
+        except Exception:
+            pass
+    return {"plans": {}}
 
 
-def _parse_count(text: str, pattern: str) -> int:
-    match = re.search(pattern, text)
-    return int(match.group(1)) if match else 0
\ No newline at end of file
+def _save_progress(path: Path, progress: dict) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(progress, indent=2))
+    tmp.replace(path)
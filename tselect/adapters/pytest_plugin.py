@@ -0,0 +1,159 @@
+"""
+pytest_plugin.py
+----------------
+pytest plugin tselect injects into every run it launches:
+
+    python -m pytest -p tselect.adapters.pytest_plugin --tselect-results=PATH ...
+
+Writes one JSON line per finished test to PATH as soon as its teardown
+completes, so the parent can parse results incrementally instead of
+scraping pytest's terminal output:
+
+    {"nodeid": "test/test_optim.py::TestOptimCPU::test_sgd",
+     "outcome": "failed", "duration": 0.41,
+     "traceback": "...", "worker": "gw0"}
+
+Outcomes: passed, failed, skipped, error, xfailed, xpassed.
+Collection errors are written with "when": "collect". A test still in
+flight when pytest shuts down (-x, KeyboardInterrupt) is written as "error".
+A {"outcome": "running"} line is written when each test starts, so if the
+interpreter dies mid-test the parent knows which test took it down.
+
+Only in-flight tests are buffered (setup → call → teardown), so memory
+stays flat no matter how large the run is.
+
+--tselect-select=FILE restricts the run to the node IDs listed in FILE
+(one per line, parametrization ignored). tselect passes test FILES on
+the command line to stay under the OS arg limit, and this narrows
+collection back down to exactly the selected tests (e.g. one CI shard).
+"""
+
+import json
+import os
+
+# longest traceback kept per failure — enough for the innermost frames
+MAX_TRACEBACK_CHARS = 4000
+
+INTERRUPTED_TRACEBACK = "interrupted before teardown finished"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--tselect-results", default=None,
+        help="tselect: write per-test results as JSON lines to this path",
+    )
+
+    parser.addoption(
+        "--tselect-select", default=None,
+        help="tselect: only run node IDs listed in this file (one per line)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    path = config.getoption("--tselect-select", default=None)
+    if not path:
+        return
+
+    with open(path, "r") as f:
+        allowed = {line.strip() for line in f if line.strip()}
+
+    keep, drop = [], []
+    for item in items:
+        base = item.nodeid.split("[", 1)[0]
+        (keep if base in allowed or item.nodeid in allowed else drop).append(item)
+
+    if drop:
+        config.hook.pytest_deselected(items=drop)
+        items[:] = keep
+
+
+def pytest_configure(config):
+    path = config.getoption("--tselect-results", default=None)
+    # under pytest-xdist the controller receives every report — workers stay quiet
+    if not path or os.environ.get("PYTEST_XDIST_WORKER"):
+        return
+    config.pluginmanager.register(_ResultsWriter(path), "tselect-results-writer")
+
+
+class _ResultsWriter:
+    def __init__(self, path: str):
+        self._file    = open(path, "a", buffering=1)
+        self._pending = {}
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        self._write({"nodeid": nodeid, "outcome": "running"})
+
+    def pytest_runtest_logreport(self, report):
+        rec = self._pending.setdefault(report.nodeid, {
+            "nodeid":    report.nodeid,
+            "outcome":   "passed",
+            "duration":  0.0,
+            "traceback": "",
+            "worker":    _worker_id(report),
+        })
+        rec["duration"] += getattr(report, "duration", 0.0) or 0.0
+
+        if report.when == "setup":
+            if report.failed:
+                rec["outcome"] = "error"
+            elif report.skipped:
+                rec["outcome"] = "skipped"
+
+        elif report.when == "call":
+            wasxfail = hasattr(report, "wasxfail")
+            if report.failed:
+                rec["outcome"] = "failed"
+            elif report.skipped:
+                rec["outcome"] = "xfailed" if wasxfail else "skipped"
+            else:
+                rec["outcome"] = "xpassed" if wasxfail else "passed"
+
+        elif report.when == "teardown" and report.failed:
+            if rec["outcome"] in ("passed", "xpassed"):
+                rec["outcome"] = "error"
+
+        if report.failed and not rec["traceback"]:
+            rec["traceback"] = _traceback(report)
+
+        if report.when == "teardown":
+            self._write(self._pending.pop(report.nodeid))
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self._write({
+                "nodeid":    report.nodeid,
+                "outcome":   "error",
+                "when":      "collect",
+                "duration":  0.0,
+                "traceback": _traceback(report),
+                "worker":    _worker_id(report),
+            })
+
+    def pytest_unconfigure(self, config):
+        # tests interrupted mid-flight (-x, KeyboardInterrupt, worker crash)
+        # still get a line — never the optimistic "passed" they started with
+        for rec in self._pending.values():
+            rec["outcome"]   = "error"
+            rec["traceback"] = rec["traceback"] or INTERRUPTED_TRACEBACK
+            self._write(rec)
+        self._pending.clear()
+        self._file.close()
+
+    def _write(self, rec: dict) -> None:
+        self._file.write(json.dumps(rec) + "\n")
+
+
+def _worker_id(report) -> str:
+    node = getattr(report, "node", None)
+    gateway = getattr(node, "gateway", None)
+    if gateway is not None:
+        return gateway.id
+    return f"pid-{os.getpid()}"
+
+
+def _traceback(report) -> str:
+    try:
+        text = report.longreprtext
+    except Exception:
+        text = str(getattr(report, "longrepr", "") or "")
+    return text[-MAX_TRACEBACK_CHARS:]
@@ -0,0 +1,198 @@
+"""
+run_results.py
+--------------
+Structured per-test results of a tselect execution.
+
+Filled from the JSON lines written by tselect.adapters.pytest_plugin —
+node id, outcome, duration, traceback and worker for every test — so the
+summary, AI post-analysis and duration history get exact data instead
+of regex counts scraped from pytest's terminal output.
+
+    results = execute_command(cmd)
+    results.return_code        → 1
+    results.passed             → 120
+    results.failed_node_ids()  → ["test/test_optim.py::TestOptimCPU::test_sgd"]
+    results.tracebacks()       → {node_id: traceback_text}
+    results.durations()        → {node_id: seconds}
+"""
+
+import json
+from pathlib import Path
+
+PASSED_OUTCOMES  = ("passed", "xpassed")
+FAILED_OUTCOMES  = ("failed", "error")
+SKIPPED_OUTCOMES = ("skipped", "xfailed")
+# reused from the result cache — passed last time, inputs unchanged, not re-run
+CACHED_OUTCOMES  = ("cached-pass",)
+
+
+class TestRecord:
+    """One test's result. Slotted — giant runs hold one of these per test."""
+
+    __slots__ = ("nodeid", "outcome", "duration", "traceback", "worker")
+    __test__  = False   # not a pytest test class
+
+    def __init__(self, nodeid, outcome, duration=0.0, traceback="", worker=""):
+        self.nodeid    = nodeid
+        self.outcome   = outcome
+        self.duration  = duration
+        self.traceback = traceback
+        self.worker    = worker
+
+    def to_dict(self) -> dict:
+        return {
+            "nodeid":    self.nodeid,
+            "outcome":   self.outcome,
+            "duration":  self.duration,
+            "traceback": self.traceback,
+            "worker":    self.worker,
+        }
+
+
+class RunResults:
+    def __init__(self, return_code: int = 0):
+        self.return_code       = return_code
+        self.records           = {}
+        self.collection_errors = []
+        self.crashed           = []
+        self._running          = set()
+
+    # ── building ────────────────────────────────────────────────────────────
+
+    def add(self, data: dict) -> None:
+        if data.get("when") == "collect":
+            self.collection_errors.append(data.get("nodeid", ""))
+            return
+
+        nodeid = data["nodeid"]
+        if data.get("outcome") == "running":
+            self._running.add(nodeid)
+            return
+        self._running.discard(nodeid)
+
+        existing = self.records.get(nodeid)
+        # a node id can appear twice (parametrized duplicates, reruns) —
+        # a failure is never overwritten by a later pass
+        if existing is not None and existing.outcome in FAILED_OUTCOMES:
+            return
+
+        traceback = data.get("traceback", "") if data.get("outcome") in FAILED_OUTCOMES else ""
+        self.records[nodeid] = TestRecord(
+            nodeid    = nodeid,
+            outcome   = data.get("outcome", "passed"),
+            duration  = float(data.get("duration", 0.0)),
+            traceback = traceback,
+            worker    = data.get("worker", ""),
+        )
+
+    def mark_crashed_in_flight(self) -> None:
+        """The interpreter died — tests that started but never finished crashed it."""
+        self.crashed.extend(sorted(self._running - set(self.crashed)))
+        self._running.clear()
+
+    def merge(self, other: "RunResults") -> None:
+        for rec in other.records.values():
+            self.add(rec.to_dict())
+        self.collection_errors.extend(other.collection_errors)
+        self.crashed.extend(other.crashed)
+        self.return_code = self.return_code or other.return_code
+
+    # ── counts ──────────────────────────────────────────────────────────────
+
+    def _count(self, outcomes: tuple) -> int:
+        return sum(1 for r in self.records.values() if r.outcome in outcomes)
+
+    @property
+    def passed(self) -> int:
+        return self._count(PASSED_OUTCOMES)
+
+    @property
+    def failed(self) -> int:
+        return self._count(FAILED_OUTCOMES) + len(self.crashed)
+
+    @property
+    def skipped(self) -> int:
+        return self._count(SKIPPED_OUTCOMES)
+
+    @property
+    def cached(self) -> int:
+        return self._count(CACHED_OUTCOMES)
+
+    # ── downstream views ────────────────────────────────────────────────────
+
+    def failed_node_ids(self) -> list:
+        failed = [r.nodeid for r in self.records.values() if r.outcome in FAILED_OUTCOMES]
+        return sorted(failed) + sorted(self.crashed)
+
+    def tracebacks(self) -> dict:
+        tbs = {
+            r.nodeid: r.traceback
+            for r in self.records.values()
+            if r.outcome in FAILED_OUTCOMES and r.traceback
+        }
+        for nid in self.crashed:
+            tbs.setdefault(nid, "crashed the interpreter (signal) or timed out")
+        return tbs
+
+    def durations(self) -> dict:
+        return {
+            r.nodeid: r.duration
+            for r in self.records.values()
+            if r.outcome not in CACHED_OUTCOMES
+        }
+
+    # ── persistence (batched --resume) ──────────────────────────────────────
+
+    def to_dict(self) -> dict:
+        return {
+            "return_code":       self.return_code,
+            "records":           [r.to_dict() for r in self.records.values()],
+            "collection_errors": self.collection_errors,
+            "crashed":           self.crashed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RunResults":
+        results = cls(data.get("return_code", 0))
+        for rec in data.get("records", []):
+            results.add(rec)
+        results.collection_errors = list(data.get("collection_errors", []))
+        results.crashed           = list(data.get("crashed", []))
+        return results
+
+
+class ResultsReader:
+    """
+    Incrementally parse a results file while pytest is still writing it.
+    poll() consumes only complete lines, so a half-written record is
+    picked up on the next call.
+    """
+
+    def __init__(self, path: Path, results: RunResults):
+        self.path    = Path(path)
+        self.results = results
+        self._offset = 0
+        self._buffer = ""
+
+    def poll(self) -> None:
+        try:
+            with open(self.path, "r") as f:
+                f.seek(self._offset)
+                chunk        = f.read()
+                self._offset = f.tell()
+        except FileNotFoundError:
+            return
+
+        if not chunk:
+            return
+
+        data         = self._buffer + chunk
+        lines        = data.split("\n")
+        self._buffer = lines.pop()
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                self.results.add(json.loads(line))
+            except (json.JSONDecodeError, KeyError):
+                continue
@@ -0,0 +1,154 @@
+"""
+worker_pool.py
+--------------
+Warm pytest worker pool — pay for heavy imports once, not per batch.
+
+Every `python -m pytest` subprocess re-imports torch from scratch
+(5-15s each). Batched collection, batched execution and crash-isolation
+reruns launch many of them.
+
+Strategy (forkserver-style):
+  - The parent imports runner.preload once (e.g. [torch, torch._inductor])
+  - Each batch runs in a fork()ed child that calls pytest.main() in-process
+    — the child inherits the already-imported modules copy-on-write
+  - Child stdout/stderr go to a temp file the parent reads back
+  - A child killed by a signal or past its timeout is reported as crashed,
+    exactly like a crashed subprocess, so batch bisection keeps working
+
+Config (tselect.yaml):
+    runner:
+      preload: [torch, torch._inductor]
+
+Pool is only used when preload is non-empty and os.fork exists (POSIX).
+"""
+
+import importlib
+import os
+import signal
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from tselect.utils.logger import setup_logger
+
+logger = setup_logger()
+
+# how often the parent polls a running worker — keeps per-batch overhead in ms
+POLL_INTERVAL = 0.005
+
+# (cwd, preload) → pool; the parent's imports are shared by all of them
+_pools = {}
+
+
+class WarmWorkerPool:
+    def __init__(self, preload: list[str], cwd: Path = None):
+        self.preload = list(preload)
+        self.cwd     = str(cwd or Path.cwd())
+        self._warm   = False
+
+    def start(self) -> None:
+        """Import pytest + the preload modules once in the parent process."""
+        if self._warm:
+            return
+
+        t0 = time.time()
+        if self.cwd not in sys.path:
+            sys.path.insert(0, self.cwd)
+
+        for name in ["pytest"] + self.preload:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                print(f"  ⚠️  Could not preload '{name}': {e}")
+
+        self._warm = True
+        logger.info(f"Worker pool warm in {time.time() - t0:.2f}s "
+                    f"(preloaded: {', '.join(self.preload) or 'pytest'})")
+
+    def run(self, args: list[str], timeout: int = None) -> tuple[bool, int, str]:
+        """
+        Run pytest.main(args) in a forked child.
+
+        Returns: (crashed, return_code, output) — same contract as
+        pytest_adapter._run_batch so callers can use either.
+        """
+        self.start()
+
+        fd, out_path = tempfile.mkstemp(prefix="tselect-worker-", suffix=".log")
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        pid = os.fork()
+        if pid == 0:
+            _worker_main(fd, self.cwd, args)
+
+        os.close(fd)
+        try:
+            status, timed_out = _wait(pid, timeout)
+            output = Path(out_path).read_text(errors="ignore")
+        finally:
+            os.unlink(out_path)
+
+        if timed_out:
+            return True, -1, output
+        if os.WIFSIGNALED(status):
+            return True, -os.WTERMSIG(status), output
+
+        return_code = os.WEXITSTATUS(status)
+        return return_code > 5, return_code, output
+
+
+def get_worker_pool(config: dict, repo_root: Path = None) -> WarmWorkerPool | None:
+    """
+    Return the process-wide pool if runner.preload is configured, else None.
+    One pool per process (and repo root) so the preload cost is paid once.
+
+    repo_root: where the workers run pytest — the directory the
+    subprocess path would use as cwd (default: the current directory).
+    """
+    preload = config.get("runner", {}).get("preload") or []
+    if not preload or not hasattr(os, "fork"):
+        return None
+
+    cwd = str(Path(repo_root or Path.cwd()).resolve())
+    key = (cwd, tuple(preload))
+    if key not in _pools:
+        _pools[key] = WarmWorkerPool(preload, cwd)
+    return _pools[key]
+
+
+def _worker_main(fd: int, cwd: str, args: list[str]) -> None:
+    """Child side: redirect output, run pytest in-process, exit with its code."""
+    code = 3
+    try:
+        os.dup2(fd, 1)
+        os.dup2(fd, 2)
+        os.chdir(cwd)
+
+        import pytest
+        code = int(pytest.main(list(args)))
+    except BaseException:
+        import traceback
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+def _wait(pid: int, timeout: int = None) -> tuple[int, bool]:
+    """Wait for a worker; SIGKILL it past timeout. Returns (status, timed_out)."""
+    deadline = time.monotonic() + timeout if timeout else None
+
+    while True:
+        done, status = os.waitpid(pid, os.WNOHANG)
+        if done:
+            return status, False
+
+        if deadline is not None and time.monotonic() > deadline:
+            os.kill(pid, signal.SIGKILL)
+            _, status = os.waitpid(pid, 0)
+            return status, True
+
+        time.sleep(POLL_INTERVAL)
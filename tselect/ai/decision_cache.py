@@ -0,0 +1,123 @@
+"""
+tselect/ai/decision_cache.py
+----------------------------
+Persistent cache of parsed LLM decisions.
+
+Re-running tselect on the same PR (flaky failure, second CI job) builds
+byte-identical prompts — same truncated diff, same candidate test file,
+same class/method summary. The parsed decision is stored under a hash of
+(kind, model, prompt), so a repeat run skips the network entirely.
+
+Stored in .tselect/ai_decisions.json:
+    {
+        "<sha256>": {"kind": "pre_filter", "decision": {...},
+                     "created": 1718000000.0, "used": 1718000500.0},
+        ...
+    }
+
+Bounds (tselect.yaml, ai:):
+    cache:           true     # false → always ask the model
+    cache_ttl_hours: 168      # entries older than this are ignored + dropped
+    cache_size:      2000     # entries kept, least recently used evicted
+
+Only parsed, valid decisions are cached — failures and timeouts are
+retried next run.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+
+DECISION_CACHE_FILE = Path(".tselect") / "ai_decisions.json"
+
+DEFAULT_TTL_HOURS = 168
+DEFAULT_SIZE      = 2000
+
+
+class DecisionCache:
+    def __init__(self, path: Path, ttl_hours: float = DEFAULT_TTL_HOURS, max_entries: int = DEFAULT_SIZE):
+        self.path        = Path(path)
+        self.ttl         = float(ttl_hours) * 3600
+        self.max_entries = int(max_entries)
+        self.hits        = 0
+        self.misses      = 0
+        self._lock       = threading.Lock()
+        self._dirty      = False
+        self._entries    = self._load()
+
+    @staticmethod
+    def key(kind: str, model: str, prompt: str) -> str:
+        return hashlib.sha256(f"{kind}\0{model}\0{prompt}".encode()).hexdigest()
+
+    def get(self, kind: str, model: str, prompt: str) -> dict | None:
+        k = self.key(kind, model, prompt)
+        with self._lock:
+            entry = self._entries.get(k)
+            if entry is None or time.time() - entry["created"] > self.ttl:
+                self.misses += 1
+                return None
+            entry["used"] = time.time()
+            self._dirty   = True
+            self.hits    += 1
+            return entry["decision"]
+
+    def put(self, kind: str, model: str, prompt: str, decision: dict) -> None:
+        now = time.time()
+        with self._lock:
+            self._entries[self.key(kind, model, prompt)] = {
+                "kind":     kind,
+                "decision": decision,
+                "created":  now,
+                "used":     now,
+            }
+            self._dirty = True
+
+    def save(self) -> None:
+        """Drop expired entries, evict LRU beyond max_entries, write atomically."""
+        with self._lock:
+            if not self._dirty:
+                return
+            now     = time.time()
+            entries = {
+                k: e for k, e in self._entries.items()
+                if now - e["created"] <= self.ttl
+            }
+            if len(entries) > self.max_entries:
+                newest  = sorted(entries.items(), key=lambda kv: kv[1]["used"], reverse=True)
+                entries = dict(newest[:self.max_entries])
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            with open(tmp, "w") as f:
+                json.dump(entries, f)
+            tmp.replace(self.path)
+            self._entries = entries
+            self._dirty   = False
+
+    def report(self) -> str | None:
+        lookups = self.hits + self.misses
+        if not lookups:
+            return None
+        return (f"AI decision cache: {self.hits}/{lookups} hits "
+                f"({self.hits / lookups:.0%}), {self.misses} model calls needed")
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+
+def get_decision_cache(repo_root: Path, config: dict) -> DecisionCache | None:
+    """The repo's decision cache, or None when ai.cache is off."""
+    ai_cfg = config.get("ai", {})
+    if not ai_cfg.get("cache", True):
+        return None
+    return DecisionCache(
+        Path(repo_root) / DECISION_CACHE_FILE,
+        ttl_hours   = ai_cfg.get("cache_ttl_hours", DEFAULT_TTL_HOURS),
+        max_entries = ai_cfg.get("cache_size", DEFAULT_SIZE),
+    )
@@ -0,0 +1,173 @@
+"""
+tselect/ai/failure_clusters.py
+------------------------------
+Groups failed tests by how they failed, before AI post-analysis.
+
+One broken lowering can fail 300 parametrized tests with the same
+traceback. Post-analysis asks the LLM once per cluster — about one
+representative — and fans the answer back out to every member, so its
+cost follows the number of distinct failure modes, not failed tests.
+
+Signature of one failure (no LLM, pure text):
+  - exception type         — from the `E   Foo: ...` line / last frame
+                             (the message is ignored: it carries values)
+  - innermost repo frames  — up to SIGNATURE_FRAMES (file, function)
+                             pairs inside the repo, source files
+                             preferred over test files, so different
+                             tests hitting the same broken helper share
+                             a cluster
+  - changed symbol         — the first changed symbol that appears as a
+                             frame, when there is one
+
+Understands pytest's long / short tracebacks (`path:123: in func`,
+`path:123: KeyError`) and native ones (`File "path", line 123, in func`).
+Failures without a traceback (timeouts, crashed workers) form one cluster.
+"""
+
+import re
+from pathlib import Path
+
+# innermost in-repo frames kept in a signature
+SIGNATURE_FRAMES = 3
+
+# clusters sent to the LLM — largest first, the rest get no analysis
+MAX_CLUSTERS = 5
+
+_NATIVE_FRAME = re.compile(r'^\s*File "([^"]+)", line (\d+), in (\S+)')
+_PYTEST_FRAME = re.compile(r"^(\S[^\s:]*\.py):(\d+):(?: in (\S+)| (\w[\w.]*))?\s*$")
+_PYTEST_DEF   = re.compile(r"^\s*(?:async\s+)?def (\w+)\(")
+_ERROR_LINE   = re.compile(r"^E\s+([A-Za-z_][\w.]*):(?:\s|$)")
+_NATIVE_ERROR = re.compile(r"^([A-Za-z_][\w.]*(?:Error|Exception|Exit|Interrupt|Warning))\b")
+
+NO_TRACEBACK = "<no traceback>"
+
+
+def _is_test_path(path: str) -> bool:
+    name  = Path(path).name
+    parts = Path(path).parts
+    return (name.startswith("test_") or name.endswith("_test.py") or name == "conftest.py"
+            or "test" in parts or "tests" in parts)
+
+
+def _repo_relative(path: str, repo_root: Path | None) -> str | None:
+    """Repo-relative path, or None for frames outside the repo."""
+    p = Path(path)
+    if not p.is_absolute():
+        return None if "site-packages" in p.parts else p.as_posix()
+    if repo_root is None:
+        return None
+    try:
+        rel = p.resolve().relative_to(repo_root)
+    except (ValueError, OSError):
+        return None
+    return None if "site-packages" in rel.parts else rel.as_posix()
+
+
+def parse_traceback(text: str, repo_root: Path | None = None) -> tuple:
+    """
+    (exception type, [(rel_path, function), ...] in-repo frames, outermost first).
+    """
+    frames       = []
+    exception    = None
+    frame_raised = None     # `path:123: KeyError` — pytest's own verdict wins
+    last_def     = None
+
+    for line in text.splitlines():
+        m = _NATIVE_FRAME.match(line)
+        if m:
+            rel = _repo_relative(m.group(1), repo_root)
+            if rel:
+                frames.append((rel, m.group(3)))
+            continue
+
+        m = _PYTEST_DEF.match(line)
+        if m:
+            last_def = m.group(1)
+            continue
+
+        m = _PYTEST_FRAME.match(line)
+        if m:
+            rel = _repo_relative(m.group(1), repo_root)
+            if rel:
+                frames.append((rel, m.group(3) or last_def or f"line {m.group(2)}"))
+            if m.group(4):
+                frame_raised = m.group(4)
+            last_def = None
+            continue
+
+        m = _ERROR_LINE.match(line) or _NATIVE_ERROR.match(line)
+        if m:
+            exception = m.group(1)
+
+    return frame_raised or exception or "UnknownError", frames
+
+
+def failure_signature(text: str, repo_root: Path | None = None,
+                      changed_symbols: dict = None) -> tuple:
+    """Hashable signature of one failure — see module docstring."""
+    if not text or not text.strip():
+        return (NO_TRACEBACK,)
+
+    exception, frames = parse_traceback(text, repo_root)
+    source_frames     = [f for f in frames if not _is_test_path(f[0])]
+    key_frames        = tuple((source_frames or frames[-1:])[-SIGNATURE_FRAMES:])
+
+    changed = None
+    for rel, func in reversed(frames):
+        for sym in (changed_symbols or {}).get(rel, ()):
+            if sym.startswith("__"):
+                continue
+            if sym == func or sym.rsplit(".", 1)[-1] == func:
+                changed = f"{rel}::{sym}"
+                break
+        if changed:
+            break
+
+    return (exception, key_frames, changed)
+
+
+def describe_signature(signature: tuple) -> str:
+    """One line for reports: `KeyError in mypkg/ops.py::lower ← changed SGD.step`."""
+    if signature == (NO_TRACEBACK,):
+        return "no traceback (timeout or crash)"
+    exception, frames, changed = signature
+    where = f" in {frames[-1][0]}::{frames[-1][1]}" if frames else ""
+    extra = f"  ← changed {changed.split('::', 1)[1]}" if changed else ""
+    return f"{exception}{where}{extra}"
+
+
+def cluster_failures(
+    failed_tests: list,
+    tracebacks: dict,
+    repo_root: Path | None = None,
+    changed_symbols: dict = None,
+) -> list:
+    """
+    Group failed node IDs by signature, largest cluster first.
+
+    Returns:
+        [
+            {"signature": (...), "description": "KeyError in ...",
+             "representative": "test/a.py::T::test_x",
+             "node_ids": [...]},
+            ...
+        ]
+    """
+    repo_root = Path(repo_root).resolve() if repo_root else None
+    groups    = {}
+    for node_id in failed_tests:
+        sig = failure_signature((tracebacks or {}).get(node_id, ""), repo_root, changed_symbols)
+        groups.setdefault(sig, []).append(node_id)
+
+    clusters = []
+    for sig, node_ids in groups.items():
+        # representative: the one with the most informative (longest) traceback
+        rep = max(node_ids, key=lambda n: (len((tracebacks or {}).get(n, "")), n))
+        clusters.append({
+            "signature":      sig,
+            "description":    describe_signature(sig),
+            "representative": rep,
+            "node_ids":       node_ids,
+        })
+    clusters.sort(key=lambda c: (-len(c["node_ids"]), c["representative"]))
+    return clusters
@@ -0,0 +1,87 @@
+"""
+tselect/ai/gating.py
+--------------------
+Which candidates are worth an LLM call.
+
+The pre-filter only ever removes tests, so a call is only worth making
+where a removal is plausible and would save time:
+
+  1. Tier gate — only low-precision tiers are sent (ai.gate_tiers,
+     default file, proximity, re-export). `self` and `function` hits
+     are kept without asking; the model almost never removes them.
+  2. Ranking — gated candidates are ordered by expected savings:
+     the estimated seconds of their tests (test count × duration
+     history, unknown tests cost the median / 1s).
+  3. Budget — candidates are taken in that order until the run's
+     estimated prompt tokens reach ai.token_budget; the rest are kept
+     without asking. Requests go out in the same order, so when
+     ai.deadline cuts the stage short it is the least valuable
+     candidates that go unanswered.
+
+    ai:
+      gate_tiers:   [file, proximity, re-export]   # null → send every tier
+      token_budget: 60000                          # 0 → unlimited
+"""
+
+from tselect.core.sharding import estimate_costs, DEFAULT_TEST_SECONDS
+
+DEFAULT_GATE_TIERS   = ("file", "proximity", "re-export")
+DEFAULT_TOKEN_BUDGET = 60000
+
+
+def split_by_tier(selected: dict, tiers) -> tuple:
+    """(sent to the LLM, kept without asking) by selection_mode."""
+    if tiers is None:
+        return dict(selected), {}
+    tiers    = set(tiers)
+    gated    = {}
+    bypassed = {}
+    for test_file, data in selected.items():
+        if data.get("selection_mode") in tiers:
+            gated[test_file] = data
+        else:
+            bypassed[test_file] = data
+    return gated, bypassed
+
+
+def expected_savings(selected: dict, durations: dict) -> dict:
+    """{test_file: estimated seconds saved if the LLM removes it}."""
+    node_ids = [
+        nid
+        for data in selected.values()
+        for cls_data in data.get("classes", {}).values()
+        for nid in cls_data.get("node_ids", [])
+    ]
+    costs   = estimate_costs(node_ids, durations or {})
+    savings = {}
+    for test_file, data in selected.items():
+        seconds = 0.0
+        for cls_data in data.get("classes", {}).values():
+            ids = cls_data.get("node_ids", [])
+            seconds += sum(costs[n] for n in ids) if ids else DEFAULT_TEST_SECONDS
+        savings[test_file] = seconds
+    return savings
+
+
+def rank_by_savings(test_files, savings: dict) -> list:
+    """Highest expected savings first; ties by path for a stable order."""
+    return sorted(test_files, key=lambda f: (-savings.get(f, 0.0), f))
+
+
+def take_within_budget(ranked: list, tokens: dict, budget: int) -> tuple:
+    """
+    (taken, over_budget) — walk `ranked`, taking candidates while their
+    estimated tokens fit. A candidate that doesn't fit is skipped and
+    smaller ones after it may still be taken. budget <= 0 → take all.
+    """
+    if budget <= 0:
+        return list(ranked), []
+    taken, over, used = [], [], 0
+    for test_file in ranked:
+        cost = tokens[test_file]
+        if used + cost > budget:
+            over.append(test_file)
+            continue
+        taken.append(test_file)
+        used += cost
+    return taken, over
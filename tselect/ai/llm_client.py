@@ -1,28 +1,166 @@
 """
 tselect/ai/llm_client.py
 ------------------------
-Groq API client using the official groq package.
+LLM client with pluggable providers:
+    groq   — Groq API via the official groq package (default)
+    local  — LocalProvider, a deterministic rule-based stand-in with
+             configurable latency and error injection, for offline
+             benchmarks and CI without network
 Reads config from tselect.yaml:
     ai:
+      provider: groq                   # optional — groq | local
       groq_api_key: gsk_xxxx
       model: llama-3.3-70b-versatile   # optional
       timeout: 15                      # optional
+      max_retries: 2                   # optional — transient errors only
+      breaker_threshold: 3             # optional — consecutive failures
+      local:                           # optional — provider: local only
+        latency: 0.2                   # seconds per call
+        jitter: 0.05                   # + up to this much, seeded
+        error_rate: 0.0                # transient (503-like) errors
+        timeout_rate: 0.0              # calls that hang until the timeout
+        seed: 0
+One client per run (get_llm_client): every AI stage shares its pooled
+HTTP connection and its circuit breaker, so once the provider is known
+to be down the rest of the run skips AI calls instead of waiting out a
+timeout per candidate.
 """
-from groq import Groq
+import hashlib
+import json
+import random
+import re
+import threading
+import time
 from tselect.utils.logger import setup_logger
 logger = setup_logger()
-DEFAULT_MODEL   = "llama-3.3-70b-versatile"
-DEFAULT_TIMEOUT = 15
+DEFAULT_PROVIDER   = "groq"
+DEFAULT_MODEL      = "llama-3.3-70b-versatile"
+DEFAULT_TIMEOUT    = 15
+DEFAULT_MAX_TOKENS = 512
+DEFAULT_MAX_RETRIES       = 2
+DEFAULT_RETRY_BACKOFF     = 0.5    # seconds, doubled per attempt, full jitter
+DEFAULT_BREAKER_THRESHOLD = 3      # consecutive failures before the breaker opens
+DEFAULT_BREAKER_COOLDOWN  = 300    # seconds open before one trial call is let through
+CHARS_PER_TOKEN           = 4      # token volume estimate for stats
+_shared_clients = {}
+_shared_lock    = threading.Lock()
 class LLMClientError(Exception):
     pass
-class LLMClient:
-    def __init__(self, config: dict):
-        ai_cfg       = config.get("ai", {})
-        # support both new (groq_api_key) and old (api_key) field names
-        self.api_key = ai_cfg.get("groq_api_key") or ai_cfg.get("api_key", "")
-        self.model   = ai_cfg.get("model", DEFAULT_MODEL)
-        self.timeout = ai_cfg.get("timeout", DEFAULT_TIMEOUT)
-        if not self.api_key:
+class CircuitOpenError(LLMClientError):
+    """Call refused without trying — the circuit breaker is open."""
+def _is_transient(error: Exception, provider) -> bool:
+    """
+    Retried with backoff: connection errors, 429, 5xx. Timeouts are not —
+    a provider that just took the full timeout will not answer faster a
+    second later.
+    """
+    if isinstance(error, (TimeoutError,) + provider.timeout_errors):
+        return False
+    if provider.transient_errors and isinstance(error, provider.transient_errors):
+        return True
+    status = getattr(error, "status_code", None)
+    return status == 429 or (isinstance(status, int) and status >= 500)
+class CircuitBreaker:
+    """
+    Opens after `threshold` consecutive failures; while open, callers are
+    refused immediately. After `cooldown` seconds one trial call is let
+    through (half-open) — success closes it, failure re-opens it.
+    """
+    def __init__(self, threshold: int = DEFAULT_BREAKER_THRESHOLD,
+                 cooldown: float = DEFAULT_BREAKER_COOLDOWN):
+        self.threshold = max(1, int(threshold))
+        self.cooldown  = float(cooldown)
+        self.failures  = 0
+        self.opened_at = None
+        self.trial     = False
+        self.lock      = threading.Lock()
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+    @property
+    def refusing(self) -> bool:
+        """Open and still cooling down — a call now would be refused."""
+        opened = self.opened_at
+        return opened is not None and (self.trial or time.monotonic() - opened < self.cooldown)
+    def allow(self) -> bool:
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if not self.trial and time.monotonic() - self.opened_at >= self.cooldown:
+                self.trial = True
+                return True
+            return False
+    def record_success(self) -> None:
+        with self.lock:
+            self.failures  = 0
+            self.opened_at = None
+            self.trial     = False
+    def record_failure(self) -> bool:
+        """Returns True when this failure opened the breaker."""
+        with self.lock:
+            self.failures += 1
+            if self.trial:
+                self.trial     = False
+                self.opened_at = time.monotonic()
+                return False
+            if self.opened_at is None and self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+                return True
+            return False
+class TokenBucket:
+    """
+    Thread-safe token bucket — at most `rate_per_minute` requests per
+    minute on average, with bursts of up to `burst` back to back.
+    rate_per_minute <= 0 disables limiting.
+    """
+    def __init__(self, rate_per_minute: float, burst: int = None):
+        self.rate     = float(rate_per_minute) / 60.0
+        self.capacity = float(burst or max(1, int(rate_per_minute // 6) or 1))
+        self.tokens   = self.capacity
+        self.updated  = time.monotonic()
+        self.lock     = threading.Lock()
+    def acquire(self, deadline: float = None) -> bool:
+        """
+        Take one token, sleeping until one is available.
+        Returns False if none would be available before `deadline`
+        (a time.monotonic() value).
+        """
+        if self.rate <= 0:
+            return True
+        while True:
+            with self.lock:
+                now          = time.monotonic()
+                self.tokens  = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+class LLMProvider:
+    """
+    One completion backend. complete() returns the response text or
+    raises; retries, circuit breaking and stats live in LLMClient.
+    """
+    name             = "provider"
+    transient_errors = ()
+    timeout_errors   = ()
+    def complete(self, prompt: str, model: str, max_tokens: int, timeout: float) -> str:
+        raise NotImplementedError
+class GroqProvider(LLMProvider):
+    name = "Groq"
+    def __init__(self, api_key: str, timeout: float):
+        try:
+            import groq
+        except ImportError:
+            raise LLMClientError(
+                "\n  ❌ The groq package is not installed.\n"
+                "  Install it with: pip install groq\n"
+                "  (or set ai.provider: local for the offline stand-in)\n"
+            )
+        if not api_key:
             raise LLMClientError(
                 "\n  ❌ Groq API key not found.\n"
                 "  Add to tselect.yaml:\n"
@@ -30,30 +168,204 @@ class LLMClient:
                 "        groq_api_key: gsk_xxxx\n"
                 "  Get a free key at: https://console.groq.com\n"
             )
-        self.client = Groq(api_key=self.api_key)
-    def complete(self, prompt: str) -> str:
+        self.transient_errors = tuple(
+            cls for cls in (
+                getattr(groq, "APIConnectionError", None),
+                getattr(groq, "RateLimitError", None),
+                getattr(groq, "InternalServerError", None),
+            ) if isinstance(cls, type)
+        )
+        self.timeout_errors = tuple(
+            cls for cls in (getattr(groq, "APITimeoutError", None),) if isinstance(cls, type)
+        )
+        # one Groq client = one pooled HTTP connection, shared by all threads;
+        # the SDK's own retries are off — LLMClient owns retrying
+        self.client = groq.Groq(api_key=api_key, timeout=timeout, max_retries=0)
+    def complete(self, prompt: str, model: str, max_tokens: int, timeout: float) -> str:
+        response = self.client.chat.completions.create(
+            model       = model,
+            messages    = [{"role": "user", "content": prompt}],
+            temperature = 0.1,
+            max_tokens  = max_tokens,
+            timeout     = timeout,
+        )
+        return response.choices[0].message.content
+class LocalProviderError(Exception):
+    """Injected transient failure — looks like an HTTP 503 to the retry policy."""
+    status_code = 503
+class LocalProvider(LLMProvider):
+    """
+    Offline stand-in. Answers the tselect prompts by rule — a candidate
+    runs when a changed symbol name appears in its test file / class /
+    method names; a failure analysis blames the first changed file —
+    after `latency` (+ seeded `jitter`) seconds. `error_rate` and
+    `timeout_rate` inject transient errors and hangs. Every random draw
+    is seeded by (seed, prompt, attempt), so a run is reproducible
+    regardless of thread scheduling.
+    """
+    name = "Local"
+    def __init__(self, latency: float = 0.2, jitter: float = 0.05, error_rate: float = 0.0,
+                 timeout_rate: float = 0.0, seed: int = 0):
+        self.latency      = float(latency)
+        self.jitter       = float(jitter)
+        self.error_rate   = float(error_rate)
+        self.timeout_rate = float(timeout_rate)
+        self.seed         = seed
+        self.attempts     = {}
+        self.lock         = threading.Lock()
+    def _rng(self, prompt: str) -> random.Random:
+        digest = hashlib.sha256(prompt.encode()).hexdigest()
+        with self.lock:
+            attempt = self.attempts.get(digest, 0)
+            self.attempts[digest] = attempt + 1
+        return random.Random(f"{self.seed}:{digest}:{attempt}")
+    def complete(self, prompt: str, model: str, max_tokens: int, timeout: float) -> str:
+        rng  = self._rng(prompt)
+        roll = rng.random()
+        if roll < self.timeout_rate:
+            time.sleep(timeout)
+            raise TimeoutError(f"local provider timed out after {timeout}s")
+        time.sleep(self.latency + rng.random() * self.jitter)
+        if roll < self.timeout_rate + self.error_rate:
+            raise LocalProviderError("local provider: injected 503")
+        return _local_answer(prompt)
+def _changed_names(prompt: str) -> set:
+    """Lower-cased changed symbol names (last dotted part) named in a prompt."""
+    names = set()
+    for group in re.findall(r"(?:changed symbols: |\(changed: )([^\n)]+)", prompt):
+        for sym in group.split(","):
+            sym = sym.strip().rsplit(".", 1)[-1].lower()
+            if sym and not sym.startswith("__"):
+                names.add(sym)
+    return names
+def _local_judgement(test_file: str, block: str, names: set) -> dict:
+    text = block.lower()
+    hits = sorted(n for n in names if n in text)
+    if hits:
+        return {"test_file": test_file, "should_run": True, "confidence": 0.9,
+                "reason": f"tests mention changed symbol {hits[0]}", "relevant_classes": []}
+    return {"test_file": test_file, "should_run": False, "confidence": 0.85,
+            "reason": "no changed symbol appears in its tests", "relevant_classes": []}
+def _local_answer(prompt: str) -> str:
+    names = _changed_names(prompt)
+    batch = list(re.finditer(r"^CANDIDATE (\d+): (\S+)$", prompt, re.MULTILINE))
+    if batch:
+        end     = prompt.find("\nQUESTION:")
+        answers = []
+        for i, m in enumerate(batch):
+            stop = batch[i + 1].start() if i + 1 < len(batch) else (end if end > 0 else len(prompt))
+            answers.append(_local_judgement(m.group(2), prompt[m.start():stop], names))
+        return json.dumps(answers)
+    single = re.search(r"^CANDIDATE TEST FILE: (\S+)$", prompt, re.MULTILINE)
+    if single:
+        end      = prompt.find("\nQUESTION:")
+        decision = _local_judgement(single.group(1), prompt[single.start():end], names)
+        decision.pop("test_file")
+        return json.dumps(decision)
+    if "FAILED TESTS:" in prompt:
+        changed = re.search(r"^  - (\S+)", prompt, re.MULTILINE)
+        return json.dumps({
+            "root_cause_file":   changed.group(1) if changed else "unknown",
+            "root_cause_symbol": sorted(names)[0] if names else "unknown",
+            "failure_pattern":   "local stand-in analysis",
+            "explanation":       "Rule-based answer from the offline local provider.",
+            "suggested_fix":     "Inspect the changed code exercised by the failing tests.",
+            "confidence":        0.5,
+        })
+    return "{}"
+def make_provider(config: dict) -> LLMProvider:
+    ai_cfg = config.get("ai", {})
+    kind   = ai_cfg.get("provider", DEFAULT_PROVIDER)
+    if kind == "local":
+        local = ai_cfg.get("local") or {}
+        return LocalProvider(
+            latency      = local.get("latency", 0.2),
+            jitter       = local.get("jitter", 0.05),
+            error_rate   = local.get("error_rate", 0.0),
+            timeout_rate = local.get("timeout_rate", 0.0),
+            seed         = local.get("seed", 0),
+        )
+    if kind == "groq":
+        # support both new (groq_api_key) and old (api_key) field names
+        api_key = ai_cfg.get("groq_api_key") or ai_cfg.get("api_key", "")
+        return GroqProvider(api_key, ai_cfg.get("timeout", DEFAULT_TIMEOUT))
+    raise LLMClientError(f"Unknown ai.provider '{kind}' — expected groq or local")
+class LLMClient:
+    def __init__(self, config: dict, provider: LLMProvider = None):
+        ai_cfg       = config.get("ai", {})
+        self.model   = ai_cfg.get("model", DEFAULT_MODEL)
+        self.timeout = ai_cfg.get("timeout", DEFAULT_TIMEOUT)
+        self.max_retries   = max(0, int(ai_cfg.get("max_retries", DEFAULT_MAX_RETRIES)))
+        self.retry_backoff = float(ai_cfg.get("retry_backoff", DEFAULT_RETRY_BACKOFF))
+        self.breaker       = CircuitBreaker(
+            ai_cfg.get("breaker_threshold", DEFAULT_BREAKER_THRESHOLD),
+            ai_cfg.get("breaker_cooldown", DEFAULT_BREAKER_COOLDOWN),
+        )
+        self.provider      = provider or make_provider(config)
+        self.stats         = {"requests": 0, "failures": 0, "prompt_tokens": 0, "completion_tokens": 0}
+        self._stats_lock   = threading.Lock()
+    def _count(self, prompt: str, answer: str | None) -> None:
+        with self._stats_lock:
+            self.stats["requests"]      += 1
+            self.stats["prompt_tokens"] += len(prompt) // CHARS_PER_TOKEN
+            if answer is None:
+                self.stats["failures"] += 1
+            else:
+                self.stats["completion_tokens"] += len(answer) // CHARS_PER_TOKEN
+    def complete(self, prompt: str, max_tokens: int = DEFAULT_MAX_TOKENS) -> str:
         """
-        Send prompt to Groq, return response string.
-        Raises LLMClientError on failure.
+        Send prompt to the provider, return response string.
+        Transient errors (connection, 429, 5xx) are retried with jittered
+        exponential backoff. Raises LLMClientError on failure, and
+        immediately while the circuit breaker is open.
         """
-        try:
-            response = self.client.chat.completions.create(
-                model       = self.model,
-                messages    = [{"role": "user", "content": prompt}],
-                temperature = 0.1,
-                max_tokens  = 512,
-                timeout     = self.timeout,
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            raise LLMClientError(f"Groq error: {e}") from e
-    def safe_complete(self, prompt: str) -> str | None:
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"{self.provider.name} circuit open — skipping call")
+        attempt = 0
+        while True:
+            try:
+                answer = self.provider.complete(prompt, self.model, max_tokens, self.timeout)
+                self._count(prompt, answer)
+                self.breaker.record_success()
+                return answer
+            except Exception as e:
+                self._count(prompt, None)
+                if attempt < self.max_retries and _is_transient(e, self.provider) and not self.breaker.is_open:
+                    attempt += 1
+                    time.sleep(random.uniform(0, self.retry_backoff * 2 ** (attempt - 1)))
+                    continue
+                if self.breaker.record_failure():
+                    logger.warning(
+                        f"{self.provider.name} failed {self.breaker.failures} times in a row — "
+                        f"skipping AI calls for the next {self.breaker.cooldown:.0f}s"
+                    )
+                raise LLMClientError(f"{self.provider.name} error: {e}") from e
+    def safe_complete(self, prompt: str, max_tokens: int = DEFAULT_MAX_TOKENS) -> str | None:
         """
         Like complete() but returns None instead of raising.
         Use when you want graceful fallback.
         """
         try:
-            return self.complete(prompt)
+            return self.complete(prompt, max_tokens=max_tokens)
+        except CircuitOpenError:
+            return None     # already reported when the breaker opened
         except LLMClientError as e:
             logger.warning(f"LLM call failed (skipping AI filter): {e}")
-            return None
\ No newline at end of file
+            return None
+def get_llm_client(config: dict) -> LLMClient:
+    """
+    The run's shared LLMClient for this provider / api key / model /
+    timeout — created on first use, then reused by every AI stage.
+    """
+    ai_cfg = config.get("ai", {})
+    key    = (
+        ai_cfg.get("provider", DEFAULT_PROVIDER),
+        ai_cfg.get("groq_api_key") or ai_cfg.get("api_key", ""),
+        ai_cfg.get("model", DEFAULT_MODEL),
+        ai_cfg.get("timeout", DEFAULT_TIMEOUT),
+    )
+    with _shared_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = _shared_clients[key] = LLMClient(config)
+        return client
\ No newline at end of file
@@ -9,10 +9,17 @@ Takes failed test names + changed files + tracebacks and asks:
   - What is the suggested fix?
 
 This is the high-value layer — saves developer time when something breaks.
+
+Failures are clustered first (failure_clusters.py): one request per
+distinct failure signature, about its representative, and the answer
+applies to every test in the cluster.
 """
 
 import json
 import re
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from tselect.ai.failure_clusters import cluster_failures, MAX_CLUSTERS
 from tselect.ai.llm_client import LLMClient
 from tselect.utils.logger import setup_logger
 
@@ -22,6 +29,12 @@ SYSTEM_PROMPT = """You are a test failure analyst for a Python codebase.
 Given changed files and failed test names, identify the root cause.
 Respond ONLY in valid JSON. No text outside the JSON object."""
 
+# failed node ids listed besides the representative, per cluster
+MAX_LISTED_PER_CLUSTER = 10
+
+# the representative's traceback is the only one sent — give it room
+REPRESENTATIVE_TB_CHARS = 1500
+
 ANALYSIS_PROMPT_TEMPLATE = """
 CHANGED FILES AND SYMBOLS:
 {changed_summary}
@@ -37,6 +50,8 @@ FAILED TESTS:
 {traceback_section}
 
 Given the above, identify the most likely root cause of these failures.
+The failed tests listed share one failure signature ({signature}) —
+the traceback shown is representative of all of them.
 
 Respond ONLY in this exact JSON format:
 {{
@@ -53,7 +68,7 @@ def _build_changed_summary(changed_files: list, changed_symbols: dict) -> str:
     lines = []
     for f in changed_files:
         syms = changed_symbols.get(f, set())
-        clean_syms = {s for s in syms if s != "__module__"}
+        clean_syms = {s for s in syms if not s.startswith("__")}
         if clean_syms:
             sym_str = ", ".join(sorted(clean_syms)[:8])
             lines.append(f"  - {f}  (changed: {sym_str})")
@@ -62,17 +77,17 @@ def _build_changed_summary(changed_files: list, changed_symbols: dict) -> str:
     return "\n".join(lines)
 
 
-def _build_traceback_section(tracebacks: dict) -> str:
+def _build_traceback_section(tracebacks: dict, max_chars: int = 400) -> str:
     """
     tracebacks: {test_node_id: traceback_string}
-    Truncates each to 400 chars to stay within token budget.
+    Truncates each to max_chars to stay within token budget.
     """
     if not tracebacks:
         return ""
 
     lines = ["FAILURE TRACEBACKS (truncated):"]
     for test_id, tb in list(tracebacks.items())[:5]:  # max 5 tracebacks
-        short_tb = tb.strip()[:400].replace("\n", "\n  ")
+        short_tb = tb.strip()[:max_chars].replace("\n", "\n  ")
         lines.append(f"\n[{test_id}]\n  {short_tb}")
 
     return "\n".join(lines)
@@ -97,8 +112,10 @@ def _parse_analysis(raw: str) -> dict | None:
 
 
 class PostAnalyzer:
-    def __init__(self, llm: LLMClient):
-        self.llm = llm
+    def __init__(self, llm: LLMClient, cache=None):
+        self.llm   = llm
+        self.cache = cache    # DecisionCache or None
+        self.model = getattr(llm, "model", "")
 
     def analyze(
         self,
@@ -109,6 +126,7 @@ class PostAnalyzer:
         failed:          int = 0,
         skipped:         int = 0,
         tracebacks:      dict = None,
+        repo_root:       Path | None = None,
     ) -> dict | None:
         """
         Analyze test failures and return root cause + fix suggestion.
@@ -119,32 +137,76 @@ class PostAnalyzer:
             changed_symbols: {file: set(symbols)} from diff_parser
             passed/failed/skipped: test counts
             tracebacks:      {node_id: traceback_text} optional
+            repo_root:       Path to repo root (tells repo frames from library ones)
 
         Returns:
-            dict with root_cause_file, explanation, suggested_fix etc.
+            dict with root_cause_file, explanation, suggested_fix etc. for
+            the largest analysed cluster, plus "clusters": one entry per
+            cluster (description, node_ids, size, analysis or None) —
             or None if analysis fails
         """
         if not failed_tests:
             return None
 
-        changed_summary   = _build_changed_summary(changed_files, changed_symbols)
-        failed_tests_str  = "\n".join(f"  - {t}" for t in failed_tests[:20])
-        traceback_section = _build_traceback_section(tracebacks or {})
-
-        prompt = SYSTEM_PROMPT + ANALYSIS_PROMPT_TEMPLATE.format(
+        clusters = cluster_failures(failed_tests, tracebacks or {}, repo_root, changed_symbols)
+        asked    = clusters[:MAX_CLUSTERS]
+        if len(clusters) > 1 or len(failed_tests) > 1:
+            print(f"\n  🧩 {len(failed_tests)} failure(s) in {len(clusters)} cluster(s)"
+                  + (f" — analysing the {len(asked)} largest" if len(clusters) > len(asked) else ""))
+
+        changed_summary = _build_changed_summary(changed_files, changed_symbols)
+        prompts         = [
+            self._cluster_prompt(cluster, changed_summary, passed, failed, skipped, tracebacks or {})
+            for cluster in asked
+        ]
+        with ThreadPoolExecutor(max_workers=len(prompts)) as pool:
+            analyses = list(pool.map(self._analyze_one, prompts))
+
+        # fan each answer back out to every test in its cluster
+        reports = []
+        for cluster, analysis in zip(clusters, analyses + [None] * (len(clusters) - len(asked))):
+            reports.append({
+                "description":    cluster["description"],
+                "representative": cluster["representative"],
+                "node_ids":       cluster["node_ids"],
+                "size":           len(cluster["node_ids"]),
+                "analysis":       analysis,
+            })
+
+        # headline = the largest cluster that got an answer
+        headline = next((r["analysis"] for r in reports if r["analysis"]), None)
+        if headline is None:
+            logger.debug("Post-analysis parse failed — skipping")
+            return None
+        return {**headline, "clusters": reports}
+
+    def _cluster_prompt(self, cluster: dict, changed_summary: str,
+                        passed: int, failed: int, skipped: int, tracebacks: dict) -> str:
+        rep    = cluster["representative"]
+        others = [n for n in cluster["node_ids"] if n != rep]
+        lines  = [f"  - {rep}"] + [f"  - {t}" for t in others[:MAX_LISTED_PER_CLUSTER]]
+        if len(others) > MAX_LISTED_PER_CLUSTER:
+            lines.append(f"  ... and {len(others) - MAX_LISTED_PER_CLUSTER} more with the same signature")
+
+        # innermost frames are at the end — keep the tail
+        rep_tb = {rep: tracebacks[rep].strip()[-REPRESENTATIVE_TB_CHARS:]} if tracebacks.get(rep) else {}
+        return SYSTEM_PROMPT + ANALYSIS_PROMPT_TEMPLATE.format(
             changed_summary   = changed_summary,
             passed            = passed,
             failed            = failed,
             skipped           = skipped,
-            failed_tests      = failed_tests_str,
-            traceback_section = traceback_section,
+            failed_tests      = "\n".join(lines),
+            traceback_section = _build_traceback_section(rep_tb, max_chars=REPRESENTATIVE_TB_CHARS),
+            signature         = cluster["description"],
         )
 
-        raw      = self.llm.safe_complete(prompt)
-        analysis = _parse_analysis(raw)
-
-        if analysis is None:
-            logger.debug("Post-analysis parse failed — skipping")
-            return None
+    def _analyze_one(self, prompt: str) -> dict | None:
+        if self.cache:
+            cached = self.cache.get("post_analysis", self.model, prompt)
+            if cached is not None:
+                return cached
 
+        analysis = _parse_analysis(self.llm.safe_complete(prompt))
+        if analysis is not None and self.cache:
+            self.cache.put("post_analysis", self.model, prompt, analysis)
         return analysis
@@ -8,10 +8,21 @@ info) and asks Groq/Llama: "does this test actually need to run?"
 
 Design principles:
   - Never under-selects: if confidence < threshold, keep the test
+  - Only asks where a removal is likely and worth it: low-precision
+    tiers, highest expected savings first, within ai.token_budget
+    (gating.py) — self/function hits are kept without a call
   - If LLM fails entirely, keep ALL candidates (fail open)
+  - Candidates are asked concurrently, rate-limited, under one overall
+    deadline — the stage costs about one round-trip, not one per file
+  - ai.batch_size > 1 packs several candidates into one request (up to
+    ai.batch_max_tokens), so the diff context is sent once per batch;
+    the JSON array answer is validated per candidate and any candidate
+    missing from it fails open on its own
   - Sends 3 signals per candidate:
       1. git diff of changed files (truncated) — what actually changed
-      2. test method names (first 10 per class) — what the test actually tests
+      2. test method names (first 10 per class) — what the test actually tests,
+         taken from the graph's node ids; the file is parsed only for
+         classes the graph has none for
       3. file names + class names — structural context
     Together these give the LLM grounded evidence, not just names.
 
@@ -21,10 +32,21 @@ Output: filtered selected dict (same structure, subset of input)
 
 import ast
 import json
+import queue
 import re
 import subprocess
+import threading
+import time
 from pathlib import Path
-from tselect.ai.llm_client import LLMClient, LLMClientError
+from tselect.ai.llm_client import LLMClient, LLMClientError, TokenBucket, DEFAULT_MAX_TOKENS
+from tselect.ai.gating import (
+    DEFAULT_GATE_TIERS,
+    DEFAULT_TOKEN_BUDGET,
+    split_by_tier,
+    expected_savings,
+    rank_by_savings,
+    take_within_budget,
+)
 from tselect.utils.logger import setup_logger
 
 logger = setup_logger()
@@ -32,6 +54,8 @@ logger = setup_logger()
 # ── token budget constants ──────────────────────────────────────────────────
 MAX_DIFF_CHARS    = 1500   # ~375 tokens — enough to see what changed
 MAX_METHODS_CLASS = 10     # first 10 method names per class
+CHARS_PER_TOKEN   = 4      # rough estimate for packing batches
+TOKENS_PER_ANSWER = 80     # response tokens reserved per batched candidate
 
 SYSTEM_PROMPT = """You are a precise test selection assistant for a Python codebase.
 Your job is to determine if a test file DIRECTLY tests the changed functionality.
@@ -64,6 +88,45 @@ Respond ONLY in this exact JSON format:
   "relevant_classes": ["ClassName"] or []
 }}"""
 
+BATCH_SYSTEM_PROMPT = """You are a precise test selection assistant for a Python codebase.
+Your job is to determine, for EACH candidate test file, if it DIRECTLY tests the changed functionality.
+
+RULES:
+- Only return should_run: true if test classes DIRECTLY test the changed symbols
+- If the connection is indirect, coincidental, or just a shared import, return should_run: false
+- Use the git diff to understand WHAT changed, use method names to understand WHAT the test tests
+- Be precise, not conservative — false positives waste CI time
+- Judge every candidate independently
+Respond ONLY with a valid JSON array. No text outside the JSON array."""
+
+BATCH_HEADER_TEMPLATE = """
+CHANGED SOURCE FILES AND SYMBOLS:
+{changed_summary}
+"""
+
+BATCH_CANDIDATE_TEMPLATE = """
+CANDIDATE {index}: {test_file}
+TRIGGERED BY: {triggered_by}
+TEST CLASSES AND METHODS:
+{class_summary}
+"""
+
+BATCH_QUESTION_TEMPLATE = """
+QUESTION:
+For each of the {count} candidates above: do any of its test classes DIRECTLY
+test the changed symbols listed above?
+
+Respond ONLY with a JSON array holding one object per candidate, in order:
+[
+  {{
+    "test_file": "exact candidate path",
+    "should_run": true or false,
+    "confidence": true probability — use full range (0.95=almost certain, 0.7-0.9=reasonably confident, 0.5-0.7=uncertain, below 0.5=unlikely but not sure),
+    "reason": "one sentence max",
+    "relevant_classes": ["ClassName"] or []
+  }}
+]"""
+
 
 # ── diff extraction ─────────────────────────────────────────────────────────
 
@@ -128,9 +191,51 @@ def _strip_device_suffix(cls_name: str) -> str:
     return cls_name
 
 
+# instantiate_device_type_tests names methods test_foo_cpu, test_foo_cuda_float32
+_DEVICE_METHOD_SUFFIX = re.compile(
+    r"_(?:cpu|cuda|mps|xla|hpu|meta)(?:_(?:float|int|uint|bool|complex|bfloat|half|double)\w*)*$"
+)
+
+
+def _method_name(node_id: str, generated: bool) -> str:
+    """test/x.py::TestFooCPU::test_bar_cpu_float32[p0] → test_bar (generated class)."""
+    name = node_id.split("::")[-1].split("[", 1)[0]
+    return _DEVICE_METHOD_SUFFIX.sub("", name) if generated else name
+
+
+def _inventory_methods(test_file: str, classes: dict, test_inventory: dict | None) -> tuple:
+    """
+    Method names per class from node ids the graph already holds — the
+    candidate's own (what would run), else the graph's test_inventory,
+    which lists generated classes (CommonTemplate → CpuTests,
+    TestFoo → TestFooCPU) under the names pytest collected.
+
+    Returns ({class_name: [method_names]}, {classes with no node ids}).
+    """
+    inventory = (test_inventory or {}).get(test_file, {})
+    methods   = {}
+    missing   = {}
+    for cls_name, cls_data in classes.items():
+        node_ids = cls_data.get("node_ids") or inventory.get(cls_name, {}).get("node_ids", [])
+        if not node_ids:
+            missing[cls_name] = cls_data
+            continue
+        generated = _strip_device_suffix(cls_name) != cls_name
+        names     = []
+        for nid in node_ids:
+            name = _method_name(nid, generated)
+            if name not in names:
+                names.append(name)
+                if len(names) == MAX_METHODS_CLASS:
+                    break
+        methods[cls_name] = names
+    return methods, missing
+
+
 def _get_test_methods(test_file: str, repo_root: Path, classes: dict) -> dict:
     """
     Parse test file and extract first MAX_METHODS_CLASS method names per class.
+    Only used for classes the graph has no node ids for (see _inventory_methods).
     Returns {class_name: [method_names]}
 
     Handles PyTorch's dynamic test generation pattern:
@@ -194,7 +299,7 @@ def _build_changed_summary(
     for f in changed_files:
         syms  = changed_symbols.get(f, set())
         desc  = _module_description(f)
-        clean = {s for s in syms if s != "__module__"}
+        clean = {s for s in syms if not s.startswith("__")}
 
         header = f"  - {f}  ({desc})"
         if clean:
@@ -287,13 +392,82 @@ def _parse_decision(raw: str) -> dict | None:
         return None
 
 
+def _parse_batch_decisions(raw: str, test_files: list) -> dict:
+    """
+    Parse a batched answer → {test_file: decision}.
+
+    Each array item is validated on its own; items that are malformed or
+    name a file outside the batch are dropped, so only those candidates
+    fall back to fail open. A bare array, {"decisions": [...]} and a
+    single object (one-candidate batch) are all accepted.
+    """
+    if raw is None:
+        return {}
+    raw = re.sub(r"```(?:json)?", "", raw).strip()
+
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError:
+        match = re.search(r"\[.*\]", raw, re.DOTALL)
+        if not match:
+            return {}
+        try:
+            data = json.loads(match.group())
+        except json.JSONDecodeError:
+            return {}
+
+    if isinstance(data, dict):
+        data = data.get("decisions", [data])
+    if not isinstance(data, list):
+        return {}
+
+    wanted    = set(test_files)
+    decisions = {}
+    for position, item in enumerate(data):
+        if not isinstance(item, dict):
+            continue
+        if "should_run" not in item or "confidence" not in item:
+            continue
+        test_file = item.get("test_file")
+        if test_file is None and len(data) == len(test_files):
+            test_file = test_files[position]    # answered in order, path omitted
+        if test_file not in wanted or test_file in decisions:
+            continue
+        try:
+            float(item["confidence"])
+        except (TypeError, ValueError):
+            continue
+        decisions[test_file] = item
+    return decisions
+
+
 # ── main class ───────────────────────────────────────────────────────────────
 
+# defaults — override in tselect.yaml under ai:
+DEFAULT_MAX_CONCURRENCY     = 8
+DEFAULT_REQUESTS_PER_MINUTE = 30     # Groq free tier
+DEFAULT_DEADLINE            = 30     # seconds for the whole pre-filter stage
+DEFAULT_BATCH_SIZE          = 1      # candidates per request; 1 = one request each
+DEFAULT_BATCH_MAX_TOKENS    = 6000   # estimated prompt tokens per batched request
+
+
 class PreFilter:
-    def __init__(self, llm: LLMClient, config: dict):
-        self.llm       = llm
-        ai_cfg         = config.get("ai", {})
-        self.threshold = ai_cfg.get("confidence_threshold", 0.75)
+    def __init__(self, llm: LLMClient, config: dict, cache=None, test_inventory: dict = None):
+        self.llm             = llm
+        self.cache           = cache    # DecisionCache or None
+        self.inventory       = test_inventory    # graph["test_inventory"], method names for prompts
+        self.model           = getattr(llm, "model", "")
+        ai_cfg               = config.get("ai", {})
+        self.threshold       = ai_cfg.get("confidence_threshold", 0.75)
+        self.max_concurrency = max(1, int(ai_cfg.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)))
+        self.deadline        = float(ai_cfg.get("deadline", DEFAULT_DEADLINE))
+        self.batch_size      = max(1, int(ai_cfg.get("batch_size", DEFAULT_BATCH_SIZE)))
+        self.batch_tokens    = int(ai_cfg.get("batch_max_tokens", DEFAULT_BATCH_MAX_TOKENS))
+        self.limiter         = TokenBucket(
+            ai_cfg.get("requests_per_minute", DEFAULT_REQUESTS_PER_MINUTE)
+        )
+        self.gate_tiers      = ai_cfg.get("gate_tiers", list(DEFAULT_GATE_TIERS))
+        self.token_budget    = int(ai_cfg.get("token_budget", DEFAULT_TOKEN_BUDGET) or 0)
 
     def filter(
         self,
@@ -301,22 +475,41 @@ class PreFilter:
         changed_files: list,
         changed_symbols: dict,
         repo_root: Path | None = None,
+        durations: dict | None = None,
     ) -> tuple[dict, list]:
         """
         Filter candidate test files using LLM.
 
+        Only candidates from ai.gate_tiers are sent, highest expected
+        savings first, until ai.token_budget is spent (see gating.py);
+        the others are kept without asking. Candidates are sent concurrently (ai.max_concurrency threads),
+        throttled by a token bucket (ai.requests_per_minute). Candidates
+        still unanswered when ai.deadline expires are kept (fail open).
+        With ai.batch_size > 1, uncached candidates are packed several
+        per request (see _ask_batched).
+
         Args:
             selected:        output of select_tests_from_graph()
             changed_files:   list of changed source file paths
             changed_symbols: {file: set(symbols)} from diff_parser
             repo_root:       Path to repo root (for git diff + test parsing)
+            durations:       {node_id: seconds} history, ranks candidates
 
         Returns:
-            (filtered_selected, ai_decisions)
+            (filtered_selected, ai_decisions) — ai_decisions covers only
+            the candidates the gate let through
         """
         if not selected:
             return selected, []
 
+        gated, bypassed = split_by_tier(selected, self.gate_tiers)
+        if bypassed:
+            tiers = ", ".join(self.gate_tiers) or "none"
+            print(f"\n  🎯 AI gate: {len(gated)} of {len(selected)} candidate(s) in "
+                  f"low-precision tiers ({tiers}); {len(bypassed)} kept without asking")
+        if not gated:
+            return selected, []
+
         # ── enrich context ──
         diffs = {}
         if repo_root:
@@ -325,87 +518,281 @@ class PreFilter:
                 logger.debug(f"  Got diffs for {len(diffs)}/{len(changed_files)} files")
 
         changed_summary = _build_changed_summary(changed_files, changed_symbols, diffs)
-        filtered        = {}
-        ai_decisions    = []
-
-        print(f"\n  🤖 AI pre-filtering {len(selected)} candidate test files...")
 
+        print(f"\n  🤖 AI pre-filtering {len(gated)} candidate test files...")
+
+        # the single-candidate prompt is the cache key in both modes,
+        # so batched and unbatched runs share cached decisions
+        savings = expected_savings(gated, durations)
+        ranked  = rank_by_savings(gated, savings)
+        parts   = {
+            test_file: self._candidate_parts(test_file, gated[test_file], repo_root)
+            for test_file in ranked
+        }
+        prompts = {
+            test_file: self._build_prompt(test_file, changed_summary, *parts[test_file])
+            for test_file in ranked
+        }
+
+        # identical prompt + model → reuse the decision from a previous run
+        decisions = {}
+        to_ask    = {}
+        for test_file, prompt in prompts.items():
+            cached = self.cache.get("pre_filter", self.model, prompt) if self.cache else None
+            if cached is not None:
+                decisions[test_file] = cached
+            else:
+                to_ask[test_file] = prompt
+
+        if decisions:
+            print(f"  ♻️  {len(decisions)} decision(s) reused from the AI decision cache")
+
+        # cached answers are free — only new requests count against the budget
+        taken, over = take_within_budget(
+            list(to_ask),
+            {test_file: len(prompt) // CHARS_PER_TOKEN for test_file, prompt in to_ask.items()},
+            self.token_budget,
+        )
+        if over:
+            print(f"  💰 AI token budget ({self.token_budget}) reached — "
+                  f"{len(over)} lower-savings candidate(s) kept without asking")
+        to_ask = {test_file: to_ask[test_file] for test_file in taken}
+
+        if self.batch_size > 1 and len(to_ask) > 1:
+            answered = self._ask_batched(to_ask, parts, changed_summary)
+        else:
+            answered = {}
+            for test_file, raw in self._complete_all(to_ask).items():
+                decision = _parse_decision(raw)
+                if decision is not None:
+                    answered[test_file] = decision
+
+        for test_file, decision in answered.items():
+            decisions[test_file] = decision
+            if self.cache:
+                self.cache.put("pre_filter", self.model, to_ask[test_file], decision)
+
+        asked        = set(decisions) | set(to_ask)
+        filtered     = {}
+        ai_decisions = []
         for test_file, data in selected.items():
-            triggered_by  = data.get("triggered_by", [])
-            triggered_str = ", ".join(triggered_by) if isinstance(triggered_by, list) else str(triggered_by)
+            if test_file not in asked:
+                filtered[test_file] = data      # bypassed by the gate or the budget
+                continue
+            kept, record = self._decide(test_file, data, decisions.get(test_file))
+            if kept is not None:
+                filtered[test_file] = kept
+            ai_decisions.append(record)
 
-            # extract test method names for this candidate
-            methods = {}
-            if repo_root:
-                methods = _get_test_methods(test_file, repo_root, data.get("classes", {}))
+        removed = len(selected) - len(filtered)
+        if removed > 0:
+            print(f"\n  AI removed {removed} test file(s)")
 
-            class_summary = _build_class_summary(data.get("classes", {}), methods)
+        return filtered, ai_decisions
 
-            prompt = SYSTEM_PROMPT + CANDIDATE_PROMPT_TEMPLATE.format(
-                changed_summary = changed_summary,
-                test_file       = test_file,
-                triggered_by    = triggered_str,
-                class_summary   = class_summary,
-            )
+    # ── requests ────────────────────────────────────────────────────────────
 
-            raw      = self.llm.safe_complete(prompt)
-            decision = _parse_decision(raw)
-
-            if decision is None:
-                logger.debug(f"  AI parse failed for {test_file} — keeping (fail open)")
-                filtered[test_file] = data
-                ai_decisions.append({
-                    "test_file":   test_file,
-                    "should_run":  True,
-                    "confidence":  0.0,
-                    "reason":      "AI unavailable — kept by default",
-                    "ai_filtered": False,
-                })
-                continue
+    def _candidate_parts(self, test_file: str, data: dict, repo_root) -> tuple:
+        """(triggered_by string, class/method summary) for one candidate."""
+        triggered_by  = data.get("triggered_by", [])
+        triggered_str = ", ".join(triggered_by) if isinstance(triggered_by, list) else str(triggered_by)
 
-            should_run  = decision.get("should_run", True)
-            confidence  = float(decision.get("confidence", 0.0))
-            reason      = decision.get("reason", "")
-            rel_classes = decision.get("relevant_classes", [])
+        # method names from the graph; parse the file only for classes it lacks
+        methods, missing = _inventory_methods(test_file, data.get("classes", {}), self.inventory)
+        if missing and repo_root:
+            methods.update(_get_test_methods(test_file, repo_root, missing))
 
-            # safety rule: low confidence → keep test regardless
-            if not should_run and confidence < self.threshold:
-                logger.debug(
-                    f"  AI says skip {test_file} but confidence {confidence:.2f} "
-                    f"< threshold {self.threshold} — keeping"
-                )
-                should_run = True
-
-            if should_run:
-                # filter to only relevant classes if LLM identified them
-                if rel_classes:
-                    filtered_classes = {
-                        cls: cls_data
-                        for cls, cls_data in data.get("classes", {}).items()
-                        if cls in rel_classes
-                    }
-                    if filtered_classes:
-                        data = {**data, "classes": filtered_classes}
-
-                filtered[test_file] = data
-                print(f"  ✅ {test_file}")
-                print(f"     kept   (confidence: {confidence:.2f})")
-                print(f"     \"{reason}\"")
-            else:
-                print(f"  ❌ {test_file}")
-                print(f"     removed (confidence: {confidence:.2f})")
-                print(f"     \"{reason}\"")
-
-            ai_decisions.append({
-                "test_file":    test_file,
-                "should_run":   should_run,
-                "confidence":   confidence,
-                "reason":       reason,
-                "ai_filtered":  not should_run,
-            })
+        return triggered_str, _build_class_summary(data.get("classes", {}), methods)
 
-        removed = len(selected) - len(filtered)
-        if removed > 0:
-            print(f"\n  AI removed {removed} test file(s)")
+    def _build_prompt(self, test_file: str, changed_summary: str,
+                      triggered_str: str, class_summary: str) -> str:
+        return SYSTEM_PROMPT + CANDIDATE_PROMPT_TEMPLATE.format(
+            changed_summary = changed_summary,
+            test_file       = test_file,
+            triggered_by    = triggered_str,
+            class_summary   = class_summary,
+        )
+
+    def _pack_batches(self, test_files: list, blocks: dict, header_tokens: int) -> list:
+        """
+        Greedily pack candidates into batches of at most batch_size, with
+        the estimated prompt within batch_max_tokens. A candidate too big
+        for any batch goes alone.
+        """
+        batches, current, used = [], [], header_tokens
+        for test_file in test_files:
+            cost = len(blocks[test_file]) // CHARS_PER_TOKEN
+            if current and (len(current) >= self.batch_size or used + cost > self.batch_tokens):
+                batches.append(current)
+                current, used = [], header_tokens
+            current.append(test_file)
+            used += cost
+        if current:
+            batches.append(current)
+        return batches
+
+    def _ask_batched(self, to_ask: dict, parts: dict, changed_summary: str) -> dict:
+        """
+        {test_file: prompt} → {test_file: decision} with several candidates
+        per request. Candidates the model leaves out, or answers with a
+        malformed item, are simply absent (fail open individually).
+        """
+        def block(test_file, index):
+            return BATCH_CANDIDATE_TEMPLATE.format(
+                index         = index,
+                test_file     = test_file,
+                triggered_by  = parts[test_file][0],
+                class_summary = parts[test_file][1],
+            )
 
-        return filtered, ai_decisions
\ No newline at end of file
+        test_files = list(to_ask)
+        blocks     = {test_file: block(test_file, 0) for test_file in test_files}
+        header     = BATCH_SYSTEM_PROMPT + BATCH_HEADER_TEMPLATE.format(changed_summary=changed_summary)
+        batches    = self._pack_batches(test_files, blocks, len(header) // CHARS_PER_TOKEN)
+
+        prompts = {}
+        for i, batch in enumerate(batches):
+            if len(batch) == 1:
+                prompts[i] = to_ask[batch[0]]     # lone candidate → the ordinary prompt
+                continue
+            prompts[i] = (
+                header
+                + "".join(block(test_file, n) for n, test_file in enumerate(batch, 1))
+                + BATCH_QUESTION_TEMPLATE.format(count=len(batch))
+            )
+
+        print(f"  📦 {len(test_files)} candidate(s) packed into {len(batches)} request(s)")
+
+        max_tokens = {i: DEFAULT_MAX_TOKENS + TOKENS_PER_ANSWER * len(b) for i, b in enumerate(batches)}
+        answered   = {}
+        for i, raw in self._complete_all(prompts, max_tokens).items():
+            batch = batches[i]
+            if len(batch) == 1:
+                decision = _parse_decision(raw)
+                if decision is not None:
+                    answered[batch[0]] = decision
+                continue
+            parsed = _parse_batch_decisions(raw, batch)
+            if len(parsed) < len(batch):
+                logger.debug(f"  AI batch {i}: {len(batch) - len(parsed)}/{len(batch)} "
+                             f"candidate(s) unparsed — kept (fail open)")
+            answered.update(parsed)
+        return answered
+
+    def _complete_all(self, prompts: dict, max_tokens: dict = None) -> dict:
+        """
+        {key: prompt} → {key: raw response or None}.
+        Missing / None → fail open for that candidate (or batch).
+        max_tokens optionally gives a response budget per key.
+        """
+        if not prompts:
+            return {}
+
+        deadline = time.monotonic() + self.deadline
+
+        breaker  = getattr(self.llm, "breaker", None)
+
+        def _one(key, prompt):
+            if breaker is not None and breaker.refusing:
+                return None     # provider down — don't wait for a rate-limit slot
+            if not self.limiter.acquire(deadline):
+                return None     # no rate-limit slot before the deadline
+            if time.monotonic() > deadline:
+                return None
+            if max_tokens and key in max_tokens:
+                return self.llm.safe_complete(prompt, max_tokens=max_tokens[key])
+            return self.llm.safe_complete(prompt)
+
+        # daemon threads: a call still blocked on HTTP after the deadline
+        # must not keep the interpreter alive (executor workers would)
+        todo     = queue.SimpleQueue()
+        for item in prompts.items():
+            todo.put(item)
+        answers  = {}
+        lock     = threading.Lock()
+        all_done = threading.Event()
+
+        def _worker():
+            while True:
+                try:
+                    key, prompt = todo.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    answer = _one(key, prompt)
+                except Exception:
+                    answer = None
+                with lock:
+                    answers[key] = answer
+                    if len(answers) == len(prompts):
+                        all_done.set()
+
+        for _ in range(min(self.max_concurrency, len(prompts))):
+            threading.Thread(target=_worker, name="tselect-ai", daemon=True).start()
+        all_done.wait(timeout=max(0.0, deadline - time.monotonic()))
+
+        # don't block on stragglers — their answers are no longer wanted
+        with lock:
+            done = dict(answers)
+        pending = len(prompts) - len(done)
+        if pending:
+            print(f"  ⏱  AI deadline ({self.deadline:.0f}s) reached — "
+                  f"keeping {pending} unanswered candidate(s)")
+
+        return done
+
+    # ── decisions ───────────────────────────────────────────────────────────
+
+    def _decide(self, test_file: str, data: dict, decision: dict | None) -> tuple:
+        """Returns (kept_data or None, ai_decision record)."""
+        if decision is None:
+            logger.debug(f"  AI parse failed for {test_file} — keeping (fail open)")
+            return data, {
+                "test_file":   test_file,
+                "should_run":  True,
+                "confidence":  0.0,
+                "reason":      "AI unavailable — kept by default",
+                "ai_filtered": False,
+            }
+
+        should_run  = decision.get("should_run", True)
+        confidence  = float(decision.get("confidence", 0.0))
+        reason      = decision.get("reason", "")
+        rel_classes = decision.get("relevant_classes", [])
+
+        # safety rule: low confidence → keep test regardless
+        if not should_run and confidence < self.threshold:
+            logger.debug(
+                f"  AI says skip {test_file} but confidence {confidence:.2f} "
+                f"< threshold {self.threshold} — keeping"
+            )
+            should_run = True
+
+        kept = None
+        if should_run:
+            # filter to only relevant classes if LLM identified them
+            if rel_classes:
+                filtered_classes = {
+                    cls: cls_data
+                    for cls, cls_data in data.get("classes", {}).items()
+                    if cls in rel_classes
+                }
+                if filtered_classes:
+                    data = {**data, "classes": filtered_classes}
+
+            kept = data
+            print(f"  ✅ {test_file}")
+            print(f"     kept   (confidence: {confidence:.2f})")
+            print(f"     \"{reason}\"")
+        else:
+            print(f"  ❌ {test_file}")
+            print(f"     removed (confidence: {confidence:.2f})")
+            print(f"     \"{reason}\"")
+
+        return kept, {
+            "test_file":    test_file,
+            "should_run":   should_run,
+            "confidence":   confidence,
+            "reason":       reason,
+            "ai_filtered":  not should_run,
+        }
@@ -0,0 +1,206 @@
+"""
+api.py
+------
+Public Python API for batch selection — notebooks, CI bots, evaluation.
+
+    from tselect.api import SelectionSession
+
+    session = SelectionSession("/path/to/pytorch")
+    results = session.select_many([
+        {"id": "152993", "changed_files": ["torch/_inductor/scheduler.py"]},
+        {"id": "121953", "changed_files": ["torch/_inductor/ir.py"],
+         "changed_functions": {"torch/_inductor/ir.py": ["Buffer.realize"]}},
+        ["torch/_inductor/codecache.py"],          ← bare list of files works too
+    ])
+    results[0]["selected"], results[0]["node_ids"], results[0]["error"]
+
+One session = one graph load + shared caches:
+  - the graph is loaded once (json.load of a big graph dominates a CLI run)
+  - changed symbols are computed once per (file, base) and reused across
+    changesets — historical changesets should pass changed_functions
+    explicitly, since base...HEAD only describes the current checkout
+  - selection is silent (no per-file progress output)
+
+Concurrency: symbol extraction (git subprocesses) runs on a thread pool;
+selection itself is CPU-bound, so with workers > 1 it runs in forked
+processes that share the already-loaded graph copy-on-write. Results
+come back in input order.
+"""
+
+import contextlib
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from tselect.core.graph_loader import GraphLoader
+from tselect.core.graph_selector import select_tests_from_graph, get_pytest_node_ids
+from tselect.utils.config_loader import load_tselect_config
+
+# changesets per task sent to a worker process
+CHUNK_SIZE = 16
+
+# session used by forked workers — set in the parent before the pool forks
+_worker_session = None
+
+
+class SelectionSession:
+    def __init__(
+        self,
+        repo_root,
+        graph: dict = None,
+        config: dict = None,
+        base: str = "upstream/main",
+    ):
+        self.repo_root = Path(repo_root).resolve()
+        self.config    = config if config is not None else load_tselect_config(self.repo_root)
+        self.graph     = graph if graph is not None else GraphLoader(self.repo_root).load()
+        self.base      = base
+        self._symbols  = {}   # (rel, base) → set of changed symbols
+        self._kinds    = {}   # (rel, base) → {symbol: change kind}
+
+    # ─────────────────────────────────────────────
+    # Single changeset
+    # ─────────────────────────────────────────────
+
+    def select(self, changed_files: list, changed_functions: dict = None) -> dict:
+        """Select for one changeset. Same result shape as select_many() items."""
+        return self._select_one({
+            "changed_files":     changed_files,
+            "changed_functions": changed_functions,
+        })
+
+    def _select_one(self, changeset: dict) -> dict:
+        changed_files = [self._rel(f) for f in changeset["changed_files"]]
+        try:
+            selected, total = select_tests_from_graph(
+                changed_files,
+                self.graph,
+                self.repo_root,
+                self.config,
+                changed_functions = self._changed_functions(changeset, changed_files),
+                verbose           = False,
+                change_kinds      = self._change_kinds(changeset, changed_files),
+            )
+            error = None
+        except Exception as e:
+            selected, total, error = {}, 0, f"{type(e).__name__}: {e}"
+
+        return {
+            "id":          changeset.get("id"),
+            "selected":    selected,
+            "total_tests": total,
+            "node_ids":    get_pytest_node_ids(selected),
+            "error":       error,
+        }
+
+    # ─────────────────────────────────────────────
+    # Many changesets
+    # ─────────────────────────────────────────────
+
+    def select_many(self, changesets: list, workers: int = None) -> list:
+        """
+        Select for many changesets. Each changeset is a list of changed
+        files, or a dict with "changed_files" and optionally "id" and
+        "changed_functions" ({rel_path: [symbols]}).
+
+        workers: processes for selection (default: CPU count; 1 = in-process).
+        """
+        changesets = [self._as_changeset(cs, i) for i, cs in enumerate(changesets)]
+        workers    = workers or os.cpu_count() or 1
+
+        self._prefetch_symbols(changesets, workers)
+
+        if workers <= 1 or len(changesets) <= CHUNK_SIZE or not hasattr(os, "fork"):
+            return [self._select_one(cs) for cs in changesets]
+
+        global _worker_session
+        _worker_session = self
+        try:
+            ctx = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+                return list(pool.map(_select_in_worker, changesets, chunksize=CHUNK_SIZE))
+        finally:
+            _worker_session = None
+
+    # ─────────────────────────────────────────────
+    # Changed symbols (shared cache)
+    # ─────────────────────────────────────────────
+
+    def _changed_functions(self, changeset: dict, changed_files: list) -> dict:
+        given = changeset.get("changed_functions")
+        if given is not None:
+            return {self._rel(f): set(syms) for f, syms in given.items()}
+        return {
+            rel: self._symbols[(rel, self.base)]
+            for rel in changed_files
+            if (rel, self.base) in self._symbols
+        }
+
+    def _change_kinds(self, changeset: dict, changed_files: list) -> dict:
+        if changeset.get("changed_functions") is not None:
+            return {}
+        return {
+            rel: self._kinds[(rel, self.base)]
+            for rel in changed_files
+            if (rel, self.base) in self._kinds
+        }
+
+    def _prefetch_symbols(self, changesets: list, workers: int) -> None:
+        """git diff + parse each distinct file once, on a thread pool."""
+        from tselect.core.diff_parser import get_changed_functions
+
+        if not self.graph.get("function_reverse_graph"):
+            return
+
+        todo = sorted({
+            self._rel(f)
+            for cs in changesets if cs.get("changed_functions") is None
+            for f in cs["changed_files"]
+            if (self._rel(f), self.base) not in self._symbols
+        })
+        if not todo:
+            return
+
+        detect_noop = self.config.get("graph", {}).get("detect_noop", True)
+
+        def _one(rel):
+            kinds = {}
+            try:
+                symbols = get_changed_functions(
+                    self.repo_root, [rel], self.base, detect_noop=detect_noop,
+                    change_kinds=kinds,
+                ).get(rel, set())
+            except Exception:
+                symbols = set()
+            return rel, symbols, kinds.get(rel)
+
+        # diff warnings are per-file noise at this scale — keep the API silent
+        with contextlib.redirect_stdout(io.StringIO()):
+            with ThreadPoolExecutor(max_workers=min(workers * 4, 32)) as pool:
+                for rel, symbols, kinds in pool.map(_one, todo):
+                    self._symbols[(rel, self.base)] = symbols
+                    if kinds is not None:
+                        self._kinds[(rel, self.base)] = kinds
+
+    # ─────────────────────────────────────────────
+    # Helpers
+    # ─────────────────────────────────────────────
+
+    def _rel(self, path: str) -> str:
+        try:
+            return str(Path(path).relative_to(self.repo_root))
+        except ValueError:
+            # normpath drops a "./" prefix but keeps ".ci/", ".github/"
+            return os.path.normpath(str(path))
+
+    @staticmethod
+    def _as_changeset(changeset, index: int) -> dict:
+        if isinstance(changeset, dict):
+            return {"id": changeset.get("id", index), **changeset}
+        return {"id": index, "changed_files": list(changeset)}
+
+
+def _select_in_worker(changeset: dict) -> dict:
+    return _worker_session._select_one(changeset)
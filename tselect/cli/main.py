@@ -9,10 +9,22 @@ Commands:
   tselect run              → auto-detect changes, select + optionally run tests
   tselect run --execute    → select + run tests
   tselect run --coverage   → select + run tests + diff_cover confidence score
+  tselect run --execute --tiered → precise tiers first, broad tiers on demand
+  tselect run --execute --batch-size 30 [--resume] → crash-isolating batches
+  tselect run --execute --shard 2/4 → run only this CI node's slice
+  tselect plan --shards 4  → JSON shard plan for external schedulers
+  tselect run --execute --budget 10m → best selection that fits 10 minutes
+  tselect run --execute --no-cache   → ignore cached passes, run everything
+  tselect serve            → selection daemon with the graph kept hot
+  tselect run --via-daemon → select through the running daemon
+  tselect watch            → re-select and re-run affected tests on save
   tselect baseline --execute → record full suite baseline time
 """
 
 import argparse
+import contextlib
+import json
+import sys
 import time
 from pathlib import Path
 
@@ -24,14 +36,27 @@ from tselect.core.graph_selector import (
     select_tests_from_graph,
     get_pytest_node_ids,
     get_summary_info,
+    split_by_tier,
+    PRECISE_MODES,
+    BROAD_MODES,
 )
 from tselect.adapters.pytest_adapter import (
     build_pytest_command,
     build_pytest_command_from_classes,
     execute_command,
+    execute_batched,
+    node_filter_args,
+    start_command,
+    wait_command,
 )
 from tselect.reporting.summary import generate_summary
 from tselect.reporting.cache import load_cache, save_cache
+from tselect.reporting.history import load_durations, record_durations
+from tselect.reporting.result_cache import ResultCache
+from tselect.core.sharding import parse_shard, plan_shards, restrict_selection
+from tselect.core.budget import parse_budget, apply_budget, print_budget_report
+from tselect.adapters.run_results import RunResults
+from tselect.adapters.worker_pool import get_worker_pool
 from tselect.adapters.baseline_detector import detect_baseline_command
 from tselect.adapters.git_adapter import get_changed_files
 from tselect.core.diff_parser import get_changed_functions
@@ -39,6 +64,8 @@ from tselect.utils.logger import setup_logger
 
 logger = setup_logger()
 
+STAGE2_LOG = ".tselect_stage2.log"
+
 
 # ─────────────────────────────────────────────────────────
 # Helpers
@@ -78,17 +105,66 @@ def _filter_changed_files(changed_files: list, ignore_patterns: list) -> tuple[l
     return actionable, ignored
 
 
+def _resolve_changed_files(changed_arg, ignore_patterns):
+    """
+    Changed files from --changed or git diff, split into actionable/ignored.
+
+    Returns: (changed_files, ignored_files, source)
+    """
+    if changed_arg:
+        logger.info("Using manually provided changed files")
+        all_changed = changed_arg
+        source      = "manual"
+    else:
+        logger.info("Auto-detecting changed files via git diff")
+        all_changed = get_changed_files()
+        source      = "git diff"
+
+    changed_files, ignored_files = _filter_changed_files(all_changed, ignore_patterns)
+    return changed_files, ignored_files, source
+
+
+def _build_shard_plan(changed_files, graph, repo_root, config, num_shards,
+                      durations_file=None):
+    """
+    Deterministic shard plan for a changeset — same graph + changeset +
+    duration history → same plan on every CI node. No AI pre-filter:
+    its decisions are not reproducible across nodes.
+
+    durations_file: pinned history shared by all nodes (--durations);
+    sharded runs never write the local history, so it can't drift.
+    """
+    selected, _ = select_tests_from_graph(
+        changed_files, graph, repo_root,
+        detect_noop=config["graph"].get("detect_noop", True),
+    )
+    node_ids    = get_pytest_node_ids(selected)
+    durations   = load_durations(repo_root, durations_file)
+    shards      = plan_shards(node_ids, num_shards, durations)
+    return selected, {
+        "num_shards":        num_shards,
+        "changed_files":     list(changed_files),
+        "total_tests":       len(node_ids),
+        "duration_history":  bool(durations),
+        "estimated_seconds": round(sum(sh["estimated_seconds"] for sh in shards), 2),
+        "shards":            shards,
+    }
+
+
 def _is_ai_enabled(config: dict) -> bool:
     return config.get("ai", {}).get("enabled", True)
 
 
-def _run_ai_prefilter(selected, changed_files, repo_root, config):
-    from tselect.ai.llm_client import LLMClient, LLMClientError
+def _run_ai_prefilter(selected, changed_files, repo_root, config, graph=None):
+    from tselect.ai.llm_client import LLMClientError, get_llm_client
     from tselect.ai.pre_filter import PreFilter
+    from tselect.ai.decision_cache import get_decision_cache
 
     try:
-        llm             = LLMClient(config)
-        pf              = PreFilter(llm, config)
+        llm             = get_llm_client(config)
+        cache           = get_decision_cache(repo_root, config)
+        pf              = PreFilter(llm, config, cache=cache,
+                                    test_inventory=(graph or {}).get("test_inventory"))
         changed_symbols = get_changed_functions(repo_root, changed_files)
 
         filtered, ai_decisions = pf.filter(
@@ -96,7 +172,9 @@ def _run_ai_prefilter(selected, changed_files, repo_root, config):
             changed_files   = changed_files,
             changed_symbols = changed_symbols,
             repo_root       = repo_root,
+            durations       = load_durations(repo_root),
         )
+        _save_decision_cache(cache)
         return filtered, ai_decisions
 
     except LLMClientError as e:
@@ -111,26 +189,32 @@ def _run_ai_prefilter(selected, changed_files, repo_root, config):
 
 
 def _run_ai_postanalysis(failed_tests, changed_files, repo_root, config,
-                          passed, failed, skipped):
-    from tselect.ai.llm_client import LLMClient, LLMClientError
+                          passed, failed, skipped, tracebacks=None):
+    from tselect.ai.llm_client import LLMClientError, get_llm_client
     from tselect.ai.post_analyzer import PostAnalyzer
+    from tselect.ai.decision_cache import get_decision_cache
 
     if not failed_tests:
         return None
 
     try:
-        llm             = LLMClient(config)
-        analyzer        = PostAnalyzer(llm)
+        llm             = get_llm_client(config)
+        cache           = get_decision_cache(repo_root, config)
+        analyzer        = PostAnalyzer(llm, cache=cache)
         changed_symbols = get_changed_functions(repo_root, changed_files)
 
-        return analyzer.analyze(
+        analysis = analyzer.analyze(
             failed_tests    = failed_tests,
             changed_files   = changed_files,
             changed_symbols = changed_symbols,
             passed          = passed,
             failed          = failed,
             skipped         = skipped,
+            tracebacks      = tracebacks,
+            repo_root       = repo_root,
         )
+        _save_decision_cache(cache)
+        return analysis
 
     except LLMClientError as e:
         print(f"\n  ⚠️  AI post-analysis unavailable: {e}")
@@ -141,6 +225,151 @@ def _run_ai_postanalysis(failed_tests, changed_files, repo_root, config,
         return None
 
 
+def _save_decision_cache(cache) -> None:
+    if cache is None:
+        return
+    cache.save()
+    report = cache.report()
+    if report:
+        logger.info(report)
+
+
+def _stage_record(name, tiers, test_files, status, reason="",
+                  duration=0.0, results=None):
+    results = results or RunResults()
+    return {
+        "name":        name,
+        "tiers":       list(tiers),
+        "test_files":  test_files,
+        "status":      status,
+        "reason":      reason,
+        "duration":    duration,
+        "return_code": results.return_code,
+        "passed":      results.passed,
+        "failed":      results.failed,
+        "skipped":     results.skipped,
+    }
+
+
+def _execute(node_ids, cmd, config, coverage_args, resume=False, repo_root=None):
+    """
+    Run a selection: crash-isolating batches when runner.batch_size > 0,
+    otherwise one pytest process with live output. Warm workers
+    (runner.preload) run pytest from repo_root.
+
+    Returns: RunResults
+    """
+    batch_size = config["runner"].get("batch_size", 0)
+    if not batch_size or not node_ids:
+        return execute_command(cmd)
+
+    extra_args = list(config["runner"]["extra_args"])
+    if coverage_args:
+        extra_args += coverage_args + ["--cov-append"]
+
+    return execute_batched(
+        node_ids,
+        batch_size    = batch_size,
+        timeout       = config["runner"].get("batch_timeout", 900),
+        extra_args    = extra_args,
+        resume        = resume,
+        pool          = get_worker_pool(config, repo_root),
+    )
+
+
+def _run_tiered(selected, config, coverage_args, repo_root, resume=False, exact=False):
+    """
+    Tiered escalation run.
+
+    Stage 1 runs only the precise tiers (self, function, re-export).
+    Stage 2 runs the broad tiers (file, proximity):
+      runner.stage2: on_pass    → only if stage 1 passed
+      runner.stage2: background → alongside stage 1, output in STAGE2_LOG
+
+    exact: narrow each stage's file-level command to its node IDs (shards).
+
+    Returns: (results, stages) — results merged across the stages that ran
+    """
+    extra_args     = config["runner"]["extra_args"]
+    stage2_mode    = config["runner"].get("stage2", "on_pass")
+    precise, broad = split_by_tier(selected)
+
+    nodes1 = get_pytest_node_ids(precise)
+    nodes2 = get_pytest_node_ids(broad)
+    cmd1   = build_pytest_command(nodes1, extra_args=extra_args)
+    cmd2   = build_pytest_command(nodes2, extra_args=extra_args)
+
+    if exact:
+        cmd1 = cmd1 + node_filter_args(nodes1) if cmd1 else cmd1
+        cmd2 = cmd2 + node_filter_args(nodes2) if cmd2 else cmd2
+
+    if coverage_args:
+        cmd1 = cmd1 + coverage_args if cmd1 else cmd1
+        cmd2 = cmd2 + coverage_args + ["--cov-append"] if cmd2 else cmd2
+        if stage2_mode == "background":
+            print("  Coverage enabled — stage 2 runs after stage 1, not in background")
+            stage2_mode = "on_pass"
+
+    if config["runner"].get("batch_size", 0) and stage2_mode == "background":
+        print("  Batched mode — stage 2 runs after stage 1, not in background")
+        stage2_mode = "on_pass"
+
+    log_path   = repo_root / STAGE2_LOG
+    background = None
+    if stage2_mode == "background" and cmd2:
+        print(f"  Stage 2 started in background ({len(broad)} test files) → {STAGE2_LOG}")
+        t2_start   = time.time()
+        background = start_command(cmd2, log_path)
+
+    stages = []
+
+    _print_section(f"► Stage 1 — precise tiers ({len(precise)} test files)")
+    print()
+    t1_start = time.time()
+    results = _execute(nodes1, cmd1, config, coverage_args, resume, repo_root)
+    stages.append(_stage_record(
+        "Stage 1", PRECISE_MODES, len(precise), "ran",
+        duration=time.time() - t1_start, results=results,
+    ))
+
+    # pytest exit code 5 = nothing collected — not a failure for escalation
+    stage1_ok = results.return_code in (0, 5) and results.failed == 0
+    stage2    = None
+
+    if background is not None:
+        print()
+        print(f"  Waiting for background stage 2 ({len(broad)} test files)...")
+        stage2 = wait_command(background, log_path)
+        stages.append(_stage_record(
+            "Stage 2", BROAD_MODES, len(broad), "background",
+            duration=time.time() - t2_start, results=stage2,
+        ))
+    elif not cmd2:
+        stages.append(_stage_record(
+            "Stage 2", BROAD_MODES, 0, "skipped", reason="no broad-tier tests",
+        ))
+    elif not stage1_ok:
+        print()
+        print(f"  Stage 1 failed — skipping stage 2 ({len(broad)} test files)")
+        stages.append(_stage_record(
+            "Stage 2", BROAD_MODES, len(broad), "skipped", reason="stage 1 failed",
+        ))
+    else:
+        _print_section(f"► Stage 2 — broad tiers ({len(broad)} test files)")
+        print()
+        t2_start = time.time()
+        stage2 = _execute(nodes2, cmd2, config, coverage_args, resume, repo_root)
+        stages.append(_stage_record(
+            "Stage 2", BROAD_MODES, len(broad), "ran",
+            duration=time.time() - t2_start, results=stage2,
+        ))
+
+    if stage2 is not None:
+        results.merge(stage2)
+
+    return results, stages
+
+
 def main():
     parser = argparse.ArgumentParser(
         prog="tselect",
@@ -171,6 +400,78 @@ def main():
         "--coverage", action="store_true",
         help="Run with coverage and generate diff_cover confidence score",
     )
+    run_parser.add_argument(
+        "--tiered", action="store_true",
+        help="Run precise tiers (self/function/re-export) first, "
+             "broad tiers (file/proximity) only on demand",
+    )
+    run_parser.add_argument(
+        "--batch-size", type=int, default=None,
+        help="Run tests in subprocess batches of N, bisecting batches that "
+             "crash or time out (overrides runner.batch_size)",
+    )
+    run_parser.add_argument(
+        "--resume", action="store_true",
+        help="With batching: skip batches finished by a previous interrupted run",
+    )
+    run_parser.add_argument(
+        "--shard", default=None, metavar="i/N",
+        help="Run only shard i of N (1-based) of the selection — deterministic, "
+             "balanced by duration history",
+    )
+    run_parser.add_argument(
+        "--durations", default=None, metavar="FILE",
+        help="Duration history to balance --shard with (default: "
+             ".tselect_durations.json) — pin one file for every CI node",
+    )
+    run_parser.add_argument(
+        "--budget", default=None, metavar="TIME",
+        help="Wall-clock budget, e.g. 90s, 10m, 1h30m — keep the most valuable "
+             "tests that fit (overrides runner.budget)",
+    )
+    run_parser.add_argument(
+        "--via-daemon", action="store_true",
+        help="Ask a running 'tselect serve' daemon for the selection "
+             "(falls back to local selection if none is running)",
+    )
+    run_parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Re-run tests even if a cached pass with the same dependency "
+             "fingerprint exists",
+    )
+
+    # ── watch ──
+    watch_parser = subparsers.add_parser(
+        "watch", help="Re-run affected tests on every save"
+    )
+    watch_parser.add_argument(
+        "--no-run", action="store_true",
+        help="Only print the affected tests, don't run them",
+    )
+
+    # ── serve ──
+    subparsers.add_parser(
+        "serve", help="Selection daemon — keeps the graph and parsers hot"
+    )
+
+    # ── plan ──
+    plan_parser = subparsers.add_parser("plan", help="Export a JSON shard plan for CI")
+    plan_parser.add_argument(
+        "--shards", type=int, required=True,
+        help="Number of CI nodes to split the selection across",
+    )
+    plan_parser.add_argument(
+        "--changed", nargs="+", required=False,
+        help="Changed files (auto-detected from git diff if omitted)",
+    )
+    plan_parser.add_argument(
+        "--durations", default=None, metavar="FILE",
+        help="Duration history to balance shards with (default: .tselect_durations.json)",
+    )
+    plan_parser.add_argument(
+        "--output", default=None,
+        help="Write the plan to this file instead of stdout",
+    )
 
     # ── baseline ──
     baseline_parser = subparsers.add_parser("baseline", help="Record full suite baseline time")
@@ -187,6 +488,9 @@ def main():
     ignore_patterns = config["runner"]["ignore_changed_patterns"]
     rebuild_days    = config["graph"]["rebuild_after_days"]
 
+    if getattr(args, "batch_size", None):
+        config["runner"]["batch_size"] = args.batch_size
+
     # ─────────────────────────────────────────────
     # INIT
     # ─────────────────────────────────────────────
@@ -223,7 +527,7 @@ def main():
         layout = RepoLayoutInferer(repo_root, config).infer()
 
         try:
-            builder = GraphBuilder(layout)
+            builder = GraphBuilder(layout, config)
         except UnsupportedLanguageError as e:
             print(e)
             return
@@ -274,23 +578,30 @@ def main():
 
         _print_header("tselect — Targeted Test Selection")
 
-        # step 1: get changed files
-        if args.changed:
-            logger.info("Using manually provided changed files")
-            all_changed = args.changed
-            source      = "manual"
-        else:
-            logger.info("Auto-detecting changed files via git diff")
-            all_changed = get_changed_files()
-            source      = "git diff"
+        budget      = args.budget or config["runner"].get("budget")
+        budget_secs = None
+        if budget:
+            try:
+                budget_secs = parse_budget(budget)
+            except ValueError as e:
+                parser.error(str(e))
+
+        shard = None
+        if args.shard:
+            try:
+                shard = parse_shard(args.shard)
+            except ValueError as e:
+                parser.error(str(e))
+
+        # step 1 + 2: get changed files, filter
+        changed_files, ignored_files, source = _resolve_changed_files(
+            args.changed, ignore_patterns
+        )
 
-        if not all_changed:
+        if not changed_files and not ignored_files:
             print("\n  No changed files detected. Nothing to run.")
             return
 
-        # step 2: filter
-        changed_files, ignored_files = _filter_changed_files(all_changed, ignore_patterns)
-
         print(f"\n  Changed files ({source}):")
         for f in changed_files:
             print(f"    • {f}")
@@ -309,9 +620,26 @@ def main():
         graph_loader = GraphLoader(repo_root)
         ai_decisions = []
         ai_analysis  = None
+        selected     = None
+        stages       = None
+        result_cache = None
+        cached_files = {}
 
         if graph_loader.exists():
-            graph = graph_loader.load()
+            daemon_reply = None
+            if args.via_daemon and not shard:
+                from tselect.core.daemon import request_selection
+                daemon_reply = request_selection(repo_root, changed_files)
+                if daemon_reply is None:
+                    print()
+                    print("  ⚠️  No tselect daemon reachable — selecting locally.")
+                    print("     Start one with: tselect serve")
+
+            # the daemon holds the graph — only load it here when selecting locally
+            graph = (
+                {"built_at": daemon_reply["built_at"]} if daemon_reply
+                else graph_loader.load()
+            )
 
             if _is_graph_stale(graph, rebuild_days):
                 print()
@@ -320,18 +648,63 @@ def main():
 
             logger.info("Using auto-built dependency graph")
 
-            selected, total_tests = select_tests_from_graph(
-                changed_files, graph, repo_root
-            )
+            if daemon_reply:
+                print(daemon_reply["output"], end="")
+                selected    = daemon_reply["selected"]
+                total_tests = daemon_reply["total_tests"]
+                logger.info(f"Selection served by daemon in "
+                            f"{daemon_reply['elapsed_ms']:.1f} ms")
+
+            elif shard:
+                shard_index, num_shards = shard
+                selected, plan = _build_shard_plan(
+                    changed_files, graph, repo_root, config, num_shards,
+                    durations_file=args.durations,
+                )
+                mine     = plan["shards"][shard_index - 1]
+                selected = restrict_selection(selected, mine["node_ids"])
+                print()
+                print(f"  Shard {shard_index}/{num_shards}: {len(mine['node_ids'])} of "
+                      f"{plan['total_tests']} tests  "
+                      f"(~{mine['estimated_seconds']:.0f}s of "
+                      f"~{plan['estimated_seconds']:.0f}s total)")
+                if _is_ai_enabled(config):
+                    print("  AI pre-filter skipped — shards must select identically on every node")
+            else:
+                selected, total_tests = select_tests_from_graph(
+                    changed_files, graph, repo_root,
+                    detect_noop=config["graph"].get("detect_noop", True),
+                )
 
-            if _is_ai_enabled(config):
+            if _is_ai_enabled(config) and not shard:
                 selected, ai_decisions = _run_ai_prefilter(
                     selected      = selected,
                     changed_files = changed_files,
                     repo_root     = repo_root,
                     config        = config,
+                    graph         = graph,
                 )
 
+            # reuse passes whose test file + dependency closure are unchanged
+            if args.execute and config["runner"].get("result_cache") and not args.no_cache:
+                if daemon_reply:
+                    graph = graph_loader.load()
+                result_cache           = ResultCache(repo_root, graph, config)
+                selected, cached_files = result_cache.partition(selected)
+                if cached_files:
+                    n_cached = sum(len(ids) for ids in cached_files.values())
+                    print()
+                    print(f"  ♻️  Reusing cached passes for {len(cached_files)} test files "
+                          f"({n_cached} tests) — dependency fingerprint unchanged")
+
+            budget_cut = False
+            if budget_secs:
+                selected, budget_report = apply_budget(
+                    selected, budget_secs, load_durations(repo_root)
+                )
+                budget_cut = bool(budget_report["cut"])
+                print_budget_report(budget_report)
+
             node_ids                           = get_pytest_node_ids(selected)
             selected_classes, class_test_count = get_summary_info(selected)
             components                         = sorted(set(Path(f).stem for f in changed_files))
@@ -349,7 +722,7 @@ def main():
                 for cls_name, cls_data in data["classes"].items():
                     print(f"     • {cls_name} ({cls_data['test_count']} tests)")
 
-            if not node_ids:
+            if not node_ids and not cached_files:
                 print("\n  No runnable tests found for the changed files.")
                 print("  Possible reasons:")
                 print("    • Changed files have no tests in the dependency graph")
@@ -358,6 +731,15 @@ def main():
                 return
 
             cmd = build_pytest_command(node_ids, extra_args=config["runner"]["extra_args"])
+            # shard / budget kept only part of some files — run exactly those tests
+            exact = bool(shard) or budget_cut
+            if exact:
+                cmd = cmd + node_filter_args(node_ids)
+
+        elif shard or budget_secs:
+            print()
+            print("  ⚠️  --shard/--budget need the dependency graph. Run 'tselect build-graph' first.")
+            return
 
         else:
             print()
@@ -409,6 +791,7 @@ def main():
 
         # coverage setup — write .tselect_coveragerc, set env var, append cov args
         coverage_data = None
+        coverage_args = []
         if args.coverage:
             from tselect.reporting.coverage import prepare_coverage
             source_dir    = config.get("repo", {}).get("source_dirs", ["."])[0]
@@ -417,11 +800,40 @@ def main():
             print(f"  Coverage enabled — source: {source_dir}")
             print()
 
+        tiered = (args.tiered or config["runner"].get("tiered", False)) and selected is not None
+
         logger.info("Executing pytest run")
         start_time = time.time()
-        return_code, passed, failed, skipped = execute_command(cmd)
+        if not node_ids:
+            print("  Every selected test file is a cached pass — nothing to execute.")
+            results = RunResults(0)
+        elif tiered:
+            results, stages = _run_tiered(
+                selected, config, coverage_args, repo_root,
+                resume=args.resume, exact=exact,
+            )
+        else:
+            results = _execute(
+                node_ids, cmd, config, coverage_args, resume=args.resume,
+                repo_root=repo_root,
+            )
         duration = time.time() - start_time
 
+        if result_cache is not None:
+            stored = result_cache.store(selected, results)
+            result_cache.add_cached(results, cached_files)
+            if stored:
+                logger.info(f"Cached passing results for {stored} test files")
+
+        return_code = results.return_code
+        passed      = results.passed
+        failed      = results.failed
+        skipped     = results.skipped
+        # a shard's timings would make this node's history — and so its
+        # shard plan — differ from the other nodes'
+        if not shard:
+            record_durations(repo_root, results)
+
         logger.info(
             f"Execution finished in {duration:.2f}s "
             f"(passed={passed}, failed={failed}, skipped={skipped})"
@@ -435,7 +847,7 @@ def main():
             print("  ► Running diff-cover...")
             coverage_data = run_diff_cover(repo_root, compare_branch=compare_branch)
 
-        if baseline_time is None:
+        if baseline_time is None and node_ids:
             print("\n  No baseline recorded yet — saving this run as baseline.")
             cache["baseline_time"] = duration
             save_cache(repo_root, cache)
@@ -451,13 +863,14 @@ def main():
         if _is_ai_enabled(config) and failed > 0:
             print("\n  🤖 AI analyzing failures...")
             ai_analysis = _run_ai_postanalysis(
-                failed_tests  = [],
+                failed_tests  = results.failed_node_ids(),
                 changed_files = changed_files,
                 repo_root     = repo_root,
                 config        = config,
                 passed        = passed,
                 failed        = failed,
                 skipped       = skipped,
+                tracebacks    = results.tracebacks(),
             )
             if ai_analysis:
                 print()
@@ -498,6 +911,8 @@ def main():
             ai_confidence = ai_confidence,
             ai_analysis   = ai_analysis,
             coverage_data = coverage_data,
+            stages        = stages,
+            cached        = results.cached,
         )
 
         if config["ci"]["fail_on_test_failure"] and return_code != 0:
@@ -519,8 +934,10 @@ def main():
             return
 
         start_time = time.time()
-        return_code, passed, failed, skipped = execute_command(cmd)
-        duration = time.time() - start_time
+        results    = execute_command(cmd)
+        duration   = time.time() - start_time
+        passed, failed, skipped = results.passed, results.failed, results.skipped
+        record_durations(repo_root, results)
 
         cache                  = load_cache(repo_root) or {}
         cache["baseline_time"] = duration
@@ -529,5 +946,65 @@ def main():
         print(f"\n  ✅ Baseline recorded: {duration:.2f}s")
         print(f"  Passed: {passed} | Failed: {failed} | Skipped: {skipped}")
 
+    # ─────────────────────────────────────────────
+    # WATCH
+    # ─────────────────────────────────────────────
+
+    elif args.command == "watch":
+        from tselect.core.watch import WatchSession
+
+        if not GraphLoader(repo_root).exists():
+            print("No dependency graph found. Run: tselect build-graph")
+            return
+
+        _print_header("tselect — Watch Mode")
+        WatchSession(repo_root, config, run_tests=not args.no_run).run_forever()
+
+    # ─────────────────────────────────────────────
+    # SERVE
+    # ─────────────────────────────────────────────
+
+    elif args.command == "serve":
+        from tselect.core.daemon import SelectionDaemon
+
+        if not GraphLoader(repo_root).exists():
+            print("No dependency graph found. Run: tselect build-graph")
+            return
+
+        _print_header("tselect — Selection Daemon")
+        try:
+            SelectionDaemon(repo_root, config).serve()
+        except RuntimeError as e:
+            print(f"  ⚠️  {e}")
+
+    # ─────────────────────────────────────────────
+    # PLAN
+    # ─────────────────────────────────────────────
+
+    elif args.command == "plan":
+        graph_loader = GraphLoader(repo_root)
+        if not graph_loader.exists():
+            print("No dependency graph found. Run: tselect build-graph", file=sys.stderr)
+            raise SystemExit(1)
+
+        # selection progress and logs go to stderr — stdout is the JSON plan
+        for handler in logger.handlers:
+            handler.setStream(sys.stderr)
+        with contextlib.redirect_stdout(sys.stderr):
+            changed_files, _, _ = _resolve_changed_files(args.changed, ignore_patterns)
+            _, plan = _build_shard_plan(
+                changed_files, graph_loader.load(), repo_root, config, args.shards,
+                durations_file=args.durations,
+            )
+
+        text = json.dumps(plan, indent=2)
+        if args.output:
+            Path(args.output).write_text(text + "\n")
+            print(f"  Shard plan written to {args.output}  "
+                  f"({plan['total_tests']} tests across {args.shards} shards)",
+                  file=sys.stderr)
+        else:
+            print(text)
+
     else:
         parser.print_help()
\ No newline at end of file
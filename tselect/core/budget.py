@@ -0,0 +1,247 @@
+"""
+budget.py
+---------
+Time-budgeted selection — the best signal that fits a fixed CI slot.
+
+    tselect run --execute --budget 10m
+
+select_tests_from_graph() returns everything it finds. With a budget,
+each selected test CLASS becomes a knapsack item (classes with more
+than CHUNK_TESTS tests — CpuTests has thousands — are split into
+chunks, so a budget can take part of them):
+
+  cost  = sum of its tests' durations (.tselect_durations.json),
+          unknown tests cost the median known duration (1s if no history)
+
+  value = mode weight × symbol specificity × size factor
+            mode weight   — how much we trust the tier that selected it
+                            (self 1.0 … proximity 0.2)
+            specificity   — 1 / sqrt(test files sharing its matched symbol):
+                            a symbol hit by 2 test files says more than one
+                            hit by 40
+            size factor   — 1 + ln(test_count): more tests, more coverage,
+                            with diminishing returns (a class's later
+                            chunks are worth less than its first)
+
+0/1 knapsack by dynamic programming over the budget discretised into
+BUDGET_BUCKETS steps; huge selections fall back to greedy by value
+density. What was cut is reported with the share of total value left
+uncovered — the estimated risk of the budgeted run.
+"""
+
+import math
+import re
+from collections import defaultdict
+
+from tselect.core.sharding import estimate_costs, restrict_selection
+
+# trust in each selection tier — precise tiers first
+MODE_WEIGHTS = {
+    "self":      1.0,
+    "function":  0.9,
+    "re-export": 0.7,
+    "file":      0.4,
+    "proximity": 0.2,
+}
+DEFAULT_MODE_WEIGHT = 0.3
+
+# largest knapsack item — bigger classes are split into chunks
+CHUNK_TESTS = 50
+
+# resolution of the DP table — budget / BUDGET_BUCKETS seconds per step
+BUDGET_BUCKETS = 1000
+
+# items × buckets above this → greedy instead of DP
+MAX_DP_CELLS = 2_000_000
+
+_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600}
+
+
+def parse_budget(spec: str) -> float:
+    """
+    Parse a wall-clock budget → seconds.
+
+        "600" → 600   "90s" → 90   "10m" → 600   "1h30m" → 5400
+
+    Raises ValueError for anything else.
+    """
+    text = str(spec).strip().lower()
+    if re.fullmatch(r"\d+(\.\d+)?", text):
+        seconds = float(text)
+    else:
+        parts = re.findall(r"(\d+(?:\.\d+)?)([smh])", text)
+        if not parts or "".join(n + u for n, u in parts) != text:
+            raise ValueError(f"invalid budget '{spec}' — expected e.g. 90s, 10m, 1h30m")
+        seconds = sum(float(n) * _UNIT_SECONDS[u] for n, u in parts)
+
+    if seconds <= 0:
+        raise ValueError(f"invalid budget '{spec}' — must be positive")
+    return seconds
+
+
+def _symbol_specificity(selected: dict) -> dict:
+    """Per test file: 1/sqrt(files sharing its most specific matched symbol)."""
+    files_per_symbol = defaultdict(int)
+    for data in selected.values():
+        for sym in set(data.get("matched_symbols", [])):
+            files_per_symbol[sym] += 1
+
+    specificity = {}
+    for test_file, data in selected.items():
+        symbols = set(data.get("matched_symbols", []))
+        if not symbols:
+            specificity[test_file] = 1.0
+            continue
+        rarest = min(files_per_symbol[s] for s in symbols)
+        specificity[test_file] = 1.0 / math.sqrt(rarest)
+    return specificity
+
+
+def _size_factor(n: int) -> float:
+    return 1 + math.log(n) if n else 0.0
+
+
+def _build_items(selected: dict, durations: dict) -> list:
+    """One knapsack item per (test file, class) chunk of <= CHUNK_TESTS tests."""
+    all_ids     = [
+        nid
+        for data in selected.values()
+        for cls_data in data["classes"].values()
+        for nid in cls_data.get("node_ids", [])
+    ]
+    costs       = estimate_costs(all_ids, durations)
+    specificity = _symbol_specificity(selected)
+
+    items = []
+    for test_file, data in selected.items():
+        mode   = data.get("selection_mode", "unknown")
+        weight = MODE_WEIGHTS.get(mode, DEFAULT_MODE_WEIGHT)
+        for cls_name, cls_data in data["classes"].items():
+            ids = cls_data.get("node_ids", [])
+            for start in range(0, len(ids), CHUNK_TESTS):
+                chunk = ids[start:start + CHUNK_TESTS]
+                gain  = _size_factor(start + len(chunk)) - _size_factor(start)
+                items.append({
+                    "test_file": test_file,
+                    "class":     cls_name,
+                    "mode":      mode,
+                    "node_ids":  chunk,
+                    "tests":     len(chunk),
+                    "seconds":   sum(costs[n] for n in chunk),
+                    "value":     weight * specificity[test_file] * gain,
+                })
+
+    # deterministic order → deterministic tie-breaks
+    items.sort(key=lambda it: (it["test_file"], it["class"], it["node_ids"][0]))
+    return items
+
+
+def _knapsack(items: list, budget: float) -> set:
+    """Indices of the items kept. Exact DP when small enough, else greedy."""
+    step    = budget / BUDGET_BUCKETS
+    buckets = BUDGET_BUCKETS
+    weights = [max(1, math.ceil(it["seconds"] / step)) for it in items]
+
+    if len(items) * buckets > MAX_DP_CELLS:
+        order = sorted(
+            range(len(items)),
+            key=lambda i: (-items[i]["value"] / max(items[i]["seconds"], 1e-6), i),
+        )
+        kept, used = set(), 0.0
+        for i in order:
+            if used + items[i]["seconds"] <= budget:
+                kept.add(i)
+                used += items[i]["seconds"]
+        return kept
+
+    # best[c] = best value with capacity c; keep[i] = capacities where item i was taken
+    best = [0.0] * (buckets + 1)
+    keep = []
+    for i, it in enumerate(items):
+        w     = weights[i]
+        taken = set()
+        for c in range(buckets, w - 1, -1):
+            candidate = best[c - w] + it["value"]
+            if candidate > best[c]:
+                best[c] = candidate
+                taken.add(c)
+        keep.append(taken)
+
+    kept, c = set(), buckets
+    for i in range(len(items) - 1, -1, -1):
+        if c in keep[i]:
+            kept.add(i)
+            c -= weights[i]
+    return kept
+
+
+def apply_budget(selected: dict, budget_seconds: float, durations: dict = None) -> tuple:
+    """
+    Trim a select_tests_from_graph() result to fit budget_seconds.
+
+    Returns: (selected, report)
+        report = {
+            "budget_seconds":    600.0,
+            "kept_seconds":      584.2,
+            "kept_tests":        312,
+            "cut":               [{"test_file", "class", "mode", "tests", "seconds", "value"}],
+                                  ← per class, merged across its cut chunks
+            "cut_seconds":       1210.5,
+            "risk_uncovered":    0.18,    ← share of total value not run
+        }
+    """
+    items       = _build_items(selected, durations or {})
+    total_value = sum(it["value"] for it in items)
+
+    if sum(it["seconds"] for it in items) <= budget_seconds:
+        kept_idx = set(range(len(items)))
+    else:
+        kept_idx = _knapsack(items, budget_seconds)
+
+    kept = [it for i, it in enumerate(items) if i in kept_idx]
+    cut  = [it for i, it in enumerate(items) if i not in kept_idx]
+
+    keep_ids = {nid for it in kept for nid in it["node_ids"]}
+    narrowed = restrict_selection(selected, keep_ids)
+
+    cut_by_class = {}
+    for it in cut:
+        key = (it["test_file"], it["class"])
+        if key not in cut_by_class:
+            cut_by_class[key] = {k: v for k, v in it.items() if k != "node_ids"}
+        else:
+            merged             = cut_by_class[key]
+            merged["tests"]   += it["tests"]
+            merged["seconds"] += it["seconds"]
+            merged["value"]   += it["value"]
+
+    cut_value = sum(it["value"] for it in cut)
+    report    = {
+        "budget_seconds": budget_seconds,
+        "kept_seconds":   round(sum(it["seconds"] for it in kept), 2),
+        "kept_tests":     len(keep_ids),
+        "cut":            sorted(cut_by_class.values(), key=lambda it: -it["value"]),
+        "cut_seconds":    round(sum(it["seconds"] for it in cut), 2),
+        "risk_uncovered": round(cut_value / total_value, 4) if total_value else 0.0,
+    }
+    return narrowed, report
+
+
+def print_budget_report(report: dict, limit: int = 10) -> None:
+    budget = report["budget_seconds"]
+    print()
+    print(f"  ⏱  Budget {budget:.0f}s: keeping {report['kept_tests']} tests "
+          f"(~{report['kept_seconds']:.0f}s)")
+
+    if not report["cut"]:
+        print("     Whole selection fits — nothing cut.")
+        return
+
+    print(f"     Cut {len(report['cut'])} classes "
+          f"(~{report['cut_seconds']:.0f}s), highest value first:")
+    for it in report["cut"][:limit]:
+        print(f"       ✂  {it['test_file']}::{it['class']}  "
+              f"[{it['mode']}, {it['tests']} tests, ~{it['seconds']:.0f}s]")
+    if len(report["cut"]) > limit:
+        print(f"       ... and {len(report['cut']) - limit} more")
+    print(f"     Estimated uncovered risk: {report['risk_uncovered']:.0%} of selection value")
@@ -0,0 +1,228 @@
+"""
+daemon.py
+---------
+Long-running selection daemon — a hot in-memory graph for pre-commit
+hooks and editor integration.
+
+Every `tselect run` pays for Python startup, the CLI imports, json.load
+of the full graph and tree-sitter parser setup before selecting anything.
+`tselect serve` pays those once and answers selection requests over a
+Unix socket:
+
+    tselect serve                          → daemon (foreground)
+    tselect run --via-daemon [--execute]   → ask the daemon, fall back to
+                                             local selection if it is down
+
+Kept hot between requests:
+  - the dependency graph
+  - tree-sitter parsers (fn_diff._parser_cache)
+  - parsed definitions per source file (fn_diff._definitions_cache,
+    keyed by mtime + size so edited files are re-parsed)
+
+Reload: dependency_graph.json is stat()ed before every request. When its
+mtime changes the new graph is loaded completely and only then swapped
+in — a request is always served by one whole graph, old or new. A graph
+that fails to load (e.g. mid-write) keeps the old one in service.
+
+Protocol: one JSON line per connection, one JSON reply.
+    → {"op": "select", "changed_files": ["torch/optim/sgd.py"]}
+    ← {"ok": true, "selected": {...}, "total_tests": 42,
+       "output": "<selection log>", "elapsed_ms": 8.1, "built_at": ...}
+    → {"op": "ping"}      ← {"ok": true, "pid": 1234, "graph_mtime": ...}
+    → {"op": "shutdown"}  ← {"ok": true}
+
+Requests are served one at a time — selection is milliseconds, and the
+selection log is captured by redirecting stdout, which is process-wide.
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from tselect.core.graph_loader import GraphLoader
+from tselect.utils.logger import setup_logger
+
+logger = setup_logger()
+
+SOCKET_NAME = "tselect.sock"
+
+# AF_UNIX paths are limited to ~108 bytes — deeper repos use a temp path
+MAX_SOCKET_PATH = 100
+
+CLIENT_TIMEOUT = 30
+
+
+def socket_path(repo_root: Path) -> Path:
+    """Where the daemon for repo_root listens."""
+    path = Path(repo_root).resolve() / ".graph" / "tselect" / SOCKET_NAME
+    if len(str(path)) <= MAX_SOCKET_PATH:
+        return path
+    digest = hashlib.sha1(str(Path(repo_root).resolve()).encode()).hexdigest()[:12]
+    return Path(tempfile.gettempdir()) / f"tselect-{digest}.sock"
+
+
+# ─────────────────────────────────────────────
+# Server
+# ─────────────────────────────────────────────
+
+class SelectionDaemon:
+    def __init__(self, repo_root: Path, config: dict):
+        self.repo_root   = Path(repo_root)
+        self.config      = config
+        self.loader      = GraphLoader(self.repo_root)
+        self.graph       = None
+        self.graph_mtime = None
+        self.requests    = 0
+
+    def _refresh_graph(self) -> None:
+        """Swap in a new graph if dependency_graph.json changed on disk."""
+        try:
+            mtime = self.loader.graph_path.stat().st_mtime_ns
+        except OSError:
+            return
+        if mtime == self.graph_mtime:
+            return
+
+        t0 = time.time()
+        try:
+            graph = self.loader.load()
+        except Exception as e:
+            logger.warning(f"Graph reload failed, keeping previous graph: {e}")
+            return
+
+        # single reference assignment — requests never see a partial graph
+        self.graph, self.graph_mtime = graph, mtime
+        logger.info(f"Graph loaded in {time.time() - t0:.2f}s")
+
+    def handle(self, request: dict) -> dict:
+        op = request.get("op")
+
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid(), "graph_mtime": self.graph_mtime}
+
+        if op == "select":
+            from tselect.core.graph_selector import select_tests_from_graph
+
+            self._refresh_graph()
+            if self.graph is None:
+                return {"ok": False, "error": "no dependency graph — run 'tselect build-graph'"}
+
+            t0     = time.perf_counter()
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                selected, total_tests = select_tests_from_graph(
+                    request.get("changed_files", []), self.graph, self.repo_root,
+                    detect_noop=self.config.get("graph", {}).get("detect_noop", True),
+                )
+            elapsed_ms     = (time.perf_counter() - t0) * 1000
+            self.requests += 1
+
+            logger.info(f"Request {self.requests}: {len(selected)} test files "
+                        f"in {elapsed_ms:.1f} ms")
+            return {
+                "ok":          True,
+                "selected":    selected,
+                "total_tests": total_tests,
+                "output":      output.getvalue(),
+                "elapsed_ms":  elapsed_ms,
+                "built_at":    self.graph.get("built_at"),
+            }
+
+        return {"ok": False, "error": f"unknown op '{op}'"}
+
+    def serve(self) -> None:
+        path = socket_path(self.repo_root)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            if _ping(path) is not None:
+                raise RuntimeError(f"A tselect daemon is already serving {path}")
+            path.unlink()   # stale socket from a daemon that died
+
+        self._refresh_graph()
+
+        # warm tree-sitter parsers now rather than on the first request
+        from tselect.core.fn_diff import _get_parser
+        _get_parser("python")
+        _get_parser("cpp")
+
+        daemon = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                request = {}
+                try:
+                    request = json.loads(self.rfile.readline() or b"{}")
+                    reply   = (
+                        {"ok": True} if request.get("op") == "shutdown"
+                        else daemon.handle(request)
+                    )
+                except Exception as e:
+                    reply   = {"ok": False, "error": str(e)}
+                self.wfile.write(json.dumps(reply).encode() + b"\n")
+                if request.get("op") == "shutdown":
+                    # shutdown() blocks until serve_forever returns — call it off-thread
+                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+        server = socketserver.UnixStreamServer(str(path), _Handler)
+        print(f"  tselect daemon serving {self.repo_root}")
+        print(f"  socket: {path}   (Ctrl-C to stop)")
+        try:
+            server.serve_forever(poll_interval=0.2)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            print(f"\n  tselect daemon stopped after {self.requests} requests")
+
+
+# ─────────────────────────────────────────────
+# Client
+# ─────────────────────────────────────────────
+
+def _call(path: Path, request: dict, timeout: float = CLIENT_TIMEOUT) -> dict | None:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            chunks = []
+            while True:
+                chunk = sock.recv(1 << 16)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        return json.loads(b"".join(chunks) or b"null")
+    except (OSError, ValueError):
+        return None
+
+
+def _ping(path: Path) -> dict | None:
+    return _call(path, {"op": "ping"}, timeout=1)
+
+
+def request_selection(repo_root: Path, changed_files: list) -> dict | None:
+    """
+    Ask the daemon for a selection. Returns its reply, or None if no
+    daemon is running or it failed — callers fall back to local selection.
+    """
+    reply = _call(socket_path(repo_root), {
+        "op":            "select",
+        "changed_files": list(changed_files),
+    })
+    if not reply or not reply.get("ok"):
+        if reply:
+            logger.warning(f"tselect daemon error: {reply.get('error')}")
+        return None
+    return reply
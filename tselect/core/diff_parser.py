@@ -7,6 +7,24 @@ Supports PR mode (base...HEAD) and avoids incorrect fallbacks.
 
 Now delegates symbol extraction to fn_diff.py (tree-sitter based),
 which supports .py, .cpp, .cu, .cuh, .h, .hpp files.
+
+Changed .py symbols whose base and head versions are semantically
+identical (annotations, docstrings, comments, formatting only) are
+dropped; a file with nothing else left reports {NOOP_SYMBOL}.
+
+Both sides of each hunk are used: `+` lines map to symbols in the
+working tree, `-` lines to symbols in the merge-base blob (read through
+one persistent `git cat-file --batch`, git_adapter.GitBlobReader), so
+deleted functions and code moved out of a file are named too.
+
+Lines outside every definition are named by what they touch (a global,
+an import, `__all__` entries, a registration call — plus the functions
+that read it, fn_diff.module_level_symbols) instead of "__module__",
+which the selector can only expand to the whole file.
+
+Callers that pass a change_kinds dict also get how each symbol changed
+(signature / body / ... — see fn_diff.classify_symbols), which the
+selector uses to limit transitive expansion for body-only edits.
 """
 
 from typing import Optional
@@ -14,13 +32,29 @@ import re
 import subprocess
 from pathlib import Path
 
-from tselect.core.fn_diff import extract_symbols_at_lines
+from tselect.adapters.git_adapter import get_blob_reader
+from tselect.core.fn_diff import (
+    classify_symbols,
+    extract_symbols_at_lines,
+    extract_symbols_in_source,
+    find_noop_symbols,
+    is_noop_change,
+    module_level_symbols,
+    NOOP_SYMBOL,
+    PY_EXTENSIONS,
+)
 
 # Extensions we attempt function-level extraction for
 SUPPORTED_EXTENSIONS = {'.py', '.cpp', '.cu', '.cuh', '.h', '.hpp', '.cc', '.c'}
 
 
-def get_changed_functions(repo_root: Path, changed_files: list, base="upstream/main") -> dict:
+def get_changed_functions(
+    repo_root: Path,
+    changed_files: list,
+    base="upstream/main",
+    detect_noop: bool = True,
+    change_kinds: dict = None,
+) -> dict:
     """
     For each changed file, return which top-level functions/classes changed.
 
@@ -28,12 +62,21 @@ def get_changed_functions(repo_root: Path, changed_files: list, base="upstream/m
         {
             "torch/_inductor/scheduler.py": {"_fuse_nodes", "BaseScheduler"},
             "torch/csrc/jit/runtime/interpreter.cpp": {"InterpreterState::run"},
+            "torch/_inductor/codegen/simd.py": {"__noop__"},   # typing-only PR
+            "torch/optim/_functional.py": {"_removed_helper"}, # deleted at base side
         }
 
     If a file has no function-level info, returns {"__unknown__"}.
     Non-code / unsupported files return set() so the caller skips them.
+    detect_noop=False keeps annotation/docstring-only symbols (graph.detect_noop).
+
+    change_kinds: optional dict, filled in place for .py files that exist
+    at the merge-base:
+        {"torch/_inductor/scheduler.py": {"_fuse_nodes": "body", ...}}
+    Files without an entry (new files, git errors) are unclassified.
     """
-    result = {}
+    result      = {}
+    base_commit = _merge_base(repo_root, base)
 
     for cf in changed_files:
         rel = _normalize(cf, repo_root)
@@ -45,24 +88,107 @@ def get_changed_functions(repo_root: Path, changed_files: list, base="upstream/m
             result[rel] = set()
             continue
 
-        changed_lines = _get_changed_lines(repo_root, rel, base)
+        changed_lines, base_lines = _get_changed_ranges(repo_root, rel, base)
+        full_path   = repo_root / rel
+        base_source = _show_file(repo_root, base_commit, rel) if base_commit else None
 
-        if not changed_lines:
-            print(f"[WARN] No changed lines detected for {rel}")
-            result[rel] = {"__unknown__"}
-            continue
+        result[rel] = changed_symbols_between(
+            rel, full_path, base_source, changed_lines, base_lines,
+            detect_noop=detect_noop, change_kinds=change_kinds,
+        )
 
-        full_path = repo_root / rel
-        if not full_path.exists():
-            result[rel] = {"__unknown__"}
-            continue
+    return result
 
-        # Delegate to fn_diff (tree-sitter based, with ast fallback for .py)
-        symbols = extract_symbols_at_lines(full_path, changed_lines)
 
-        result[rel] = symbols if symbols else {"__unknown__"}
+def changed_symbols_between(
+    rel: str,
+    full_path: Path,
+    base_source: Optional[str],
+    changed_lines: set,
+    base_lines: set,
+    detect_noop: bool = True,
+    change_kinds: dict = None,
+) -> set:
+    """
+    Changed symbols of one file from its working-tree version at full_path
+    and a base version given as text — the merge-base blob here, the
+    previous in-memory snapshot in `tselect watch`.
 
-    return result
+    changed_lines / base_lines: 1-based lines of the `+` / `-` side of
+    each hunk. base_source None means the file is new. Same result and
+    change_kinds contract as get_changed_functions, for one file.
+    """
+    suffix      = Path(rel).suffix.lower()
+    head_source = None
+
+    if suffix in PY_EXTENSIONS and full_path.exists():
+        head_source = full_path.read_text(encoding="utf-8", errors="ignore")
+        if detect_noop and base_source is not None and is_noop_change(head_source, base_source):
+            return {NOOP_SYMBOL}
+
+    if not changed_lines and not base_lines:
+        print(f"[WARN] No changed lines detected for {rel}")
+        return {"__unknown__"}
+
+    # Delegate to fn_diff (tree-sitter based, with ast fallback for .py)
+    symbols = set()
+    if changed_lines:
+        symbols = (extract_symbols_at_lines(full_path, changed_lines)
+                   if full_path.exists() else {"__unknown__"})
+
+    # removed / moved-away code only exists at the base side
+    if base_lines and base_source is not None:
+        symbols |= extract_symbols_in_source(base_source, suffix, base_lines)
+    elif base_lines and not changed_lines:
+        symbols = {"__unknown__"}
+
+    if "__unknown__" in symbols:
+        return {"__unknown__"}
+
+    if detect_noop and base_source is not None and head_source is not None and symbols:
+        noop = find_noop_symbols(head_source, base_source, symbols)
+        if noop:
+            symbols = (symbols - noop) or {NOOP_SYMBOL}
+
+    if change_kinds is not None and base_source is not None and head_source is not None and symbols:
+        change_kinds[rel] = classify_symbols(head_source, base_source, symbols)
+
+    if "__module__" in symbols and suffix in PY_EXTENSIONS:
+        module_names = _resolve_module_level(
+            head_source, changed_lines, base_source, base_lines
+        )
+        if module_names:
+            symbols = (symbols - {"__module__"}) | module_names
+            if change_kinds is not None and rel in change_kinds:
+                kinds = change_kinds[rel]
+                kinds.pop("__module__", None)
+                for name in module_names:
+                    kinds.setdefault(name, "module")
+
+    return symbols if symbols else {"__unknown__"}
+
+
+def _resolve_module_level(
+    head_source: Optional[str],
+    head_lines: set,
+    base_source: Optional[str],
+    base_lines: set,
+) -> set:
+    """
+    Names the module-level lines of both sides touch (module_level_symbols),
+    or set() if either side can't be resolved — the caller keeps "__module__".
+    """
+    names = set()
+    for source, lines in ((head_source, head_lines), (base_source, base_lines)):
+        if not lines:
+            continue
+        if source is None:
+            return set()
+        side = module_level_symbols(source, lines)
+        if side is None:
+            return set()
+        names |= side
+    return names
 
 
 def _normalize(path_str: str, repo_root: Path) -> str:
@@ -72,10 +198,31 @@ def _normalize(path_str: str, repo_root: Path) -> str:
         return str(path_str).lstrip("./")
 
 
-def _get_changed_lines(repo_root: Path, rel_path: str, base: str) -> set:
+def _merge_base(repo_root: Path, base: str) -> Optional[str]:
+    """The commit `git diff base...HEAD` compares against, or None."""
+    try:
+        result = subprocess.run(
+            ["git", "merge-base", base, "HEAD"],
+            capture_output=True, text=True, cwd=str(repo_root), timeout=10,
+        )
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def _show_file(repo_root: Path, commit: str, rel_path: str) -> Optional[str]:
+    """File contents at commit, or None (new file, git error)."""
+    return get_blob_reader(repo_root).read(commit, rel_path)
+
+
+def _get_changed_ranges(repo_root: Path, rel_path: str, base: str) -> tuple:
     """
     Extract changed line numbers using git diff base...HEAD
-    Returns 1-based line numbers matching what tree-sitter/ast produce.
+    Returns (head_lines, base_lines) — 1-based line numbers matching what
+    tree-sitter/ast produce, for the `+` side and the `-` side of each
+    hunk. A pure deletion has base lines only.
     """
     try:
         result = subprocess.run(
@@ -89,23 +236,30 @@ def _get_changed_lines(repo_root: Path, rel_path: str, base: str) -> set:
 
     except Exception as e:
         print(f"[ERROR] git diff failed for {rel_path}: {e}")
-        return set()
+        return set(), set()
 
     if not diff_output.strip():
-        return set()
+        return set(), set()
 
     changed_lines = set()
+    base_lines    = set()
     hunk_pattern = re.compile(
-        r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@",
+        r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@",
         re.MULTILINE
     )
 
     for match in hunk_pattern.finditer(diff_output):
-        start = int(match.group(1))
-        count = int(match.group(2)) if match.group(2) is not None else 1
+        old_start = int(match.group(1))
+        old_count = int(match.group(2)) if match.group(2) is not None else 1
+        start     = int(match.group(3))
+        count     = int(match.group(4)) if match.group(4) is not None else 1
 
         if count > 0:
             for line_no in range(start, start + count):
                 changed_lines.add(line_no)
 
-    return changed_lines
\ No newline at end of file
+        if old_count > 0:
+            for line_no in range(old_start, old_start + old_count):
+                base_lines.add(line_no)
+
+    return changed_lines, base_lines
\ No newline at end of file
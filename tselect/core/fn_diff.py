@@ -31,9 +31,26 @@ except ImportError:
 # Cache parsers so we don't reinstantiate on every file
 _parser_cache: dict = {}
 
+# Definitions per parsed file, keyed by (path, mtime_ns, size, parser) —
+# a long-lived process (tselect serve) re-parses only files that changed
+_definitions_cache: dict = {}
+MAX_DEFINITIONS_CACHE = 4096
+
 CPP_EXTENSIONS = {'.cpp', '.cu', '.cuh', '.h', '.hpp', '.cc', '.c'}
 PY_EXTENSIONS  = {'.py'}
 
+# marker symbol: the file changed, but only annotations / docstrings /
+# comments / formatting — graph_selector skips it
+NOOP_SYMBOL = "__noop__"
+
+# leading parts of an op reference that name a namespace, not the op:
+# aten.add, torch.ops.aten.add, prims.add, torch.Tensor.add → "add"
+OP_NAMESPACES = {"torch", "ops", "aten", "prims", "_prims", "_refs", "refs",
+                 "nn", "functional", "F", "Tensor", "quantized", "_C"}
+
+# imports that only feed annotations — ignored by no-op detection
+_TYPING_MODULES = {"typing", "typing_extensions", "__future__"}
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Public API
 # ─────────────────────────────────────────────────────────────────────────────
@@ -156,12 +173,20 @@ def get_decorator_registry(file_path: Path) -> dict[str, str]:
         @register_op("mul")
         def mul_op(...): ...
 
+        @register_lowering([aten.sub, prims.sub], broadcast=True)
+        def sub_lowering(...): ...
+
     Returns:
         {
             "aten.add":  "add_lowering",
             "mul":       "mul_op",
+            "aten.sub":  "sub_lowering",
+            "prims.sub": "sub_lowering",
         }
 
+    List / tuple arguments register every element; keyword arguments
+    are options, not keys. normalize_op_key() maps keys to op names.
+
     Used by graph_builder to resolve decorator-wrapped registries.
     When a test calls aten.add, we now know it calls add_lowering.
     """
@@ -198,9 +223,13 @@ def get_decorator_registry(file_path: Path) -> dict[str, str]:
                             for arg in dec_child.children:
                                 if arg.type == 'argument_list':
                                     for a in arg.children:
-                                        text = a.text.decode('utf-8', errors='ignore').strip()
-                                        if text and text not in (',', '(', ')'):
-                                            dec_args.append(text)
+                                        if a.type == 'keyword_argument':
+                                            continue
+                                        items = a.children if a.type in ('list', 'tuple') else [a]
+                                        for item in items:
+                                            text = item.text.decode('utf-8', errors='ignore').strip()
+                                            if text and text not in (',', '(', ')', '[', ']'):
+                                                dec_args.append(text.strip('"\''))
 
             if fn_name and dec_args:
                 for arg in dec_args:
@@ -213,7 +242,11 @@ def get_decorator_registry(file_path: Path) -> dict[str, str]:
     return registry
 
 
-def classify_change(file_path: Path, changed_lines: set[int]) -> dict[str, str]:
+def classify_change(
+    file_path: Path,
+    changed_lines: set[int],
+    base_source: Optional[str] = None,
+) -> dict[str, str]:
     """
     Feature 13: Classify what KIND of change happened per function.
 
@@ -226,14 +259,29 @@ def classify_change(file_path: Path, changed_lines: set[int]) -> dict[str, str]:
                          → not in coverage map, BFS fallback
         "deleted"      — function was removed (no lines in new file)
                          → find all callers, definitely run their tests
+        "noop"         — only annotations, docstrings, comments or
+                         formatting changed (needs base_source)
+                         → runtime behavior identical, no tests needed
+
+    With base_source the kinds come from comparing both versions
+    (classify_symbols) instead of where the changed lines fall.
 
     Returns:
         {
             "SGD.step":        "body",
             "SGD.__init__":    "signature",
             "new_helper":      "new_function",
+            "SGD.zero_grad":   "noop",
         }
     """
+    if base_source is not None and file_path.suffix.lower() in PY_EXTENSIONS:
+        try:
+            head_source = file_path.read_text(encoding='utf-8', errors='ignore')
+        except OSError:
+            return {}
+        symbols = extract_symbols_at_lines(file_path, changed_lines)
+        return classify_symbols(head_source, base_source, symbols)
+
     if file_path.suffix.lower() not in PY_EXTENSIONS:
         return {sym: "body" for sym in extract_symbols_at_lines(file_path, changed_lines)}
 
@@ -268,37 +316,197 @@ def classify_change(file_path: Path, changed_lines: set[int]) -> dict[str, str]:
     if changed_lines - covered:
         result["__module__"] = "new_function"
 
+    if base_source is not None:
+        head_source = source_bytes.decode('utf-8', errors='ignore')
+        for name in find_noop_symbols(head_source, base_source, set(result)):
+            result[name] = "noop"
+
     return result
 
 
+def find_noop_symbols(head_source: str, base_source: str, symbols: set[str]) -> set[str]:
+    """
+    Feature 15: Which changed symbols are semantic no-ops.
+
+    A symbol is a no-op when its base and head definitions are identical
+    once type annotations, docstrings, comments and formatting are
+    stripped — e.g. every function touched by "Add typing to simd.py".
+    "__module__" compares module-level code (typing-only imports and
+    `if TYPE_CHECKING:` blocks ignored). Symbols new in head, or either
+    side failing to parse, are never no-ops.
+
+    Python only — returns set() for anything ast can't parse.
+    """
+    head = _semantic_fingerprints(head_source)
+    base = _semantic_fingerprints(base_source)
+    if head is None or base is None:
+        return set()
+    return {
+        sym for sym in symbols
+        if sym in head and sym in base and head[sym] == base[sym]
+    }
+
+
+def is_noop_change(head_source: str, base_source: str) -> bool:
+    """True if the whole file is semantically unchanged (see find_noop_symbols)."""
+    head = _semantic_fingerprints(head_source)
+    return head is not None and head == _semantic_fingerprints(base_source)
+
+
+def classify_symbols(head_source: str, base_source: str, symbols: set[str]) -> dict[str, str]:
+    """
+    Feature 16: classify_change kinds from the base and head sources.
+
+    A symbol's interface is what its callers and importers see:
+        function — decorators, parameters and defaults, sync / async
+        class    — decorators, bases, class-level statements and the
+                   names (not bodies) of its methods
+    Annotations and docstrings are ignored, as for no-op detection.
+
+        interface differs          → "signature"
+        only in head / only base   → "new_function" / "deleted"
+        same interface             → "body"   ("noop" if runtime-identical)
+        "__module__", module names → "module"   (globals, imports — see
+                                   module_level_symbols)
+
+    A method body edit also touches its class's line range; the class
+    keeps "body" as long as its own interface is unchanged. Returns {}
+    if either side fails to parse — callers treat unclassified symbols
+    as interface changes.
+    """
+    head = _interface_fingerprints(head_source)
+    base = _interface_fingerprints(base_source)
+    if head is None or base is None:
+        return {}
+
+    kinds = {}
+    for sym in symbols:
+        if sym == "__module__":
+            kinds[sym] = "module"
+        elif sym.startswith("__") and sym.endswith("__") and "." not in sym:
+            continue                                  # __unknown__, __noop__
+        elif sym not in base and sym not in head:
+            kinds[sym] = "module"                     # global / import, not a def
+        elif sym not in base:
+            kinds[sym] = "new_function"
+        elif sym not in head:
+            kinds[sym] = "deleted"
+        elif head[sym] != base[sym]:
+            kinds[sym] = "signature"
+        else:
+            kinds[sym] = "body"
+
+    for sym in find_noop_symbols(head_source, base_source, set(kinds)):
+        kinds[sym] = "noop"
+    return kinds
+
+
+def module_level_symbols(source: str, changed_lines: set[int]) -> Optional[set[str]]:
+    """
+    Feature 17: What module-level (outside any def) changed lines touch.
+
+    extract_symbols_at_lines reports such lines as "__module__", which
+    the selector can only expand to every symbol of the file. This names
+    them instead:
+        LR_DEFAULT = 0.01                 → {"LR_DEFAULT"}
+        from .utils import clip           → {"clip"}
+        __all__ = ["SGD", "Adam"]         → the entries on changed lines
+        register_op(add_impl)             → {"add_impl"} (module-defined
+                                            args, else the registrar)
+        @decorator line of a def          → the decorated def
+        if / try / with / for blocks      → every name bound inside
+    plus every definition (qualified like _ast_definitions) whose code
+    reads one of those names — changing LR_DEFAULT changes SGD.__init__
+    when it's a default there — and module-level assignments derived
+    from them.
+
+    Returns set() when no module-level statement is touched (lines only
+    inside defs, blank or comment lines), None when something can't be
+    resolved (star import, bare expression, assert, ...) — the caller
+    keeps "__module__". Python only.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError, RecursionError):
+        return None
+
+    touched = set()
+    for stmt in tree.body:
+        start = min([stmt.lineno] + [d.lineno for d in getattr(stmt, 'decorator_list', [])])
+        end   = getattr(stmt, 'end_lineno', stmt.lineno)
+        lines = {l for l in changed_lines if start <= l <= end}
+        if not lines:
+            continue
+        if isinstance(stmt, _DEFINITION_NODES):
+            if any(l < stmt.lineno for l in lines):       # decorator lines
+                touched.add(stmt.name)
+            continue
+        names = _module_stmt_names(stmt, lines, tree)
+        if names is None:
+            return None
+        touched |= names
+
+    if not touched:
+        return set()
+
+    # module-level assignments computed from a touched name: B = A * 2
+    changed = True
+    while changed:
+        changed = False
+        for stmt in tree.body:
+            if isinstance(stmt, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+                if _loaded_names(stmt) & touched:
+                    bound = _bound_names(stmt) - touched
+                    if bound:
+                        touched |= bound
+                        changed = True
+
+    return touched | _readers_of(tree, touched)
+
+
 def get_call_sites(file_path: Path) -> dict[str, set[str]]:
     """
     Feature 14: Extract what each function/method actually CALLS.
 
     Returns:
         {
-            "TestOptimCPU.test_sgd_momentum": {"SGD", "step", "zero_grad"},
-            "TestOptimCPU.test_adam":         {"Adam", "step"},
+            "TestOptimCPU.test_sgd_momentum": {"SGD", "step", "zero_grad", "SGD.step"},
+            "TestOptimCPU.test_adam":         {"Adam", "step", "Adam.step"},
+            "run_optimizer":                  {"SGD", "step", "SGD.step"},
         }
 
     This is stronger than import analysis — a test file may import SGD
     but only test_sgd_momentum actually CALLS it. test_adam never does.
 
-    Used by graph_builder._extract_method_level_references() to get
-    precise per-method symbol usage instead of file-level import tracking.
+    Keys are "Class.method" and, for module-level functions, "function".
+    Simple local type tracking adds the qualified method a call lands on:
+        opt = SGD(lr=0.1); opt.step()          → "SGD.step"
+        self.opt = SGD()  (any method) ... self.opt.step() → "SGD.step"
+        SGD().step()                           → "SGD.step"
+        self._prepare()   inside class Foo     → "Foo._prepare"
+    Attribute reads on a typed receiver count too (opt.lr → "SGD.lr").
+
+    Used by graph_builder to link test methods to the methods they invoke
+    and to build the source-side call graph. Python is parsed with ast,
+    which sees the assignments; tree-sitter is only the fallback for
+    files ast rejects.
     """
     if file_path.suffix.lower() not in PY_EXTENSIONS:
         return {}
 
+    sites = _ast_call_sites(file_path)
+    if sites is not None:
+        return sites
+
     parser = _get_parser('python')
     if not parser:
-        return _ast_call_sites(file_path)
+        return {}
 
     try:
         source_bytes = file_path.read_bytes()
         tree = parser.parse(source_bytes)
     except Exception:
-        return _ast_call_sites(file_path)
+        return {}
 
     return _ts_call_sites(tree.root_node)
 
@@ -347,6 +555,48 @@ def extract_symbols_at_lines(file_path: Path, changed_lines: set[int]) -> set[st
         return set()
 
 
+def extract_symbols_in_source(source: str, suffix: str, changed_lines: set[int]) -> set[str]:
+    """
+    extract_symbols_at_lines for source that isn't on disk — e.g. the
+    base-revision blob, to name functions a diff deleted or moved away.
+
+    Same parsers and naming as extract_symbols_at_lines; suffix picks
+    the language (".py", ".cpp", ...). Returns set() for no lines or an
+    unsupported suffix, {"__unknown__"} if the source can't be parsed.
+    """
+    if not changed_lines:
+        return set()
+
+    suffix = suffix.lower()
+    if suffix in PY_EXTENSIONS:
+        lang = 'python'
+    elif suffix in CPP_EXTENSIONS:
+        lang = 'cpp'
+    else:
+        return set()
+
+    parser = _get_parser(lang)
+    if parser:
+        try:
+            tree = parser.parse(source.encode('utf-8', errors='ignore'))
+        except Exception:
+            return {"__unknown__"}
+        definitions = _collect_definitions(tree.root_node, lang)
+    elif lang == 'python':
+        try:
+            tree = ast.parse(source)
+        except (SyntaxError, ValueError, RecursionError):
+            return {"__unknown__"}
+        definitions = [(start, end, name) for start, end, name, _ in _ast_definitions(tree)]
+    else:
+        return {"__unknown__"}
+
+    symbols, covered = _symbols_for_lines(definitions, changed_lines)
+    if changed_lines - covered:
+        symbols.add("__module__")
+    return symbols
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Parser setup
 # ─────────────────────────────────────────────────────────────────────────────
@@ -379,31 +629,45 @@ def _get_parser(lang_key: str) -> Optional[object]:
         return None
 
 
+def _definitions_key(file_path: Path, tag: str) -> Optional[tuple]:
+    try:
+        st = file_path.stat()
+    except OSError:
+        return None
+    return (str(file_path), st.st_mtime_ns, st.st_size, tag)
+
+
+def _remember_definitions(key: Optional[tuple], definitions: list) -> None:
+    if key is None:
+        return
+    if len(_definitions_cache) >= MAX_DEFINITIONS_CACHE:
+        _definitions_cache.clear()
+    _definitions_cache[key] = definitions
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Tree-sitter extraction
 # ─────────────────────────────────────────────────────────────────────────────
 
 def _parse_with_treesitter(parser, file_path: Path, changed_lines: set[int], lang: str) -> set[str]:
     """Parse the file with tree-sitter and map changed lines to symbol names."""
-    try:
-        source_bytes = file_path.read_bytes()
-        tree = parser.parse(source_bytes)
-    except Exception as e:
-        print(f"[WARN] tree-sitter failed to parse {file_path}: {e}")
-        if lang == 'python':
-            return _ast_fallback(file_path, changed_lines)
-        return {"__unknown__"}
+    key         = _definitions_key(file_path, lang)
+    definitions = _definitions_cache.get(key) if key else None
 
-    definitions = _collect_definitions(tree.root_node, lang)
+    if definitions is None:
+        try:
+            source_bytes = file_path.read_bytes()
+            tree = parser.parse(source_bytes)
+        except Exception as e:
+            print(f"[WARN] tree-sitter failed to parse {file_path}: {e}")
+            if lang == 'python':
+                return _ast_fallback(file_path, changed_lines)
+            return {"__unknown__"}
 
-    symbols      = set()
-    covered_lines = set()
+        definitions = _collect_definitions(tree.root_node, lang)
+        _remember_definitions(key, definitions)
 
-    for start_line, end_line, name in definitions:
-        for line in changed_lines:
-            if start_line <= line <= end_line:
-                symbols.add(name)
-                covered_lines.add(line)
+    symbols, covered_lines = _symbols_for_lines(definitions, changed_lines)
 
     uncovered = changed_lines - covered_lines
     if uncovered:
@@ -412,6 +676,24 @@ def _parse_with_treesitter(parser, file_path: Path, changed_lines: set[int], lan
     return symbols if symbols else {"__unknown__"}
 
 
+def _symbols_for_lines(definitions: list, changed_lines: set[int]) -> tuple:
+    """
+    (names of definitions containing a changed line, lines covered).
+
+    A line inside a method is attributed to "Class.method" only — the
+    enclosing "Class" means the class's own code (bases, attributes,
+    decorators) changed, so a method edit selects that method's tests.
+    """
+    symbols, covered = set(), set()
+    for line in changed_lines:
+        hits = {name for start, end, name in definitions if start <= line <= end}
+        if not hits:
+            continue
+        covered.add(line)
+        symbols |= {n for n in hits if not any(h.startswith(n + ".") for h in hits)}
+    return symbols, covered
+
+
 def _collect_definitions(
     node,
     lang: str,
@@ -632,7 +914,11 @@ def _ast_decorator_registry(file_path: Path) -> dict[str, str]:
         for dec in node.decorator_list:
             # @register_lowering(aten.add)  → Call node
             if isinstance(dec, ast.Call):
+                args = []
                 for arg in dec.args:
+                    # [aten.add, prims.add] → one key per element
+                    args.extend(arg.elts if isinstance(arg, (ast.List, ast.Tuple)) else [arg])
+                for arg in args:
                     # aten.add → Attribute node
                     if isinstance(arg, ast.Attribute):
                         key = f"{_ast_dotted(arg.value)}.{arg.attr}"
@@ -644,6 +930,26 @@ def _ast_decorator_registry(file_path: Path) -> dict[str, str]:
     return registry
 
 
+def normalize_op_key(key: str) -> Optional[str]:
+    """
+    Registry key or op reference → bare op name, so registrations and
+    mentions in tests meet on one spelling:
+
+        "aten.add" / "aten.add.Tensor" / "torch.ops.aten.add.default"  → "add"
+        "torch.add" / "torch.Tensor.add" / "aten::add" / "add"         → "add"
+
+    Leading namespaces (OP_NAMESPACES) are dropped and the next part is
+    the op; overload suffixes after it are ignored. None for keys that
+    aren't a plain dotted name (calls, subscripts, ...).
+    """
+    parts = key.strip().strip('"\'').replace("::", ".").split(".")
+    if not all(p.isidentifier() for p in parts):
+        return None
+    while len(parts) > 1 and parts[0] in OP_NAMESPACES:
+        parts = parts[1:]
+    return parts[0]
+
+
 def _ast_dotted(node) -> str:
     """Reconstruct dotted name from ast.Attribute chain."""
     if isinstance(node, ast.Name):
@@ -798,14 +1104,17 @@ def _ts_call_sites(root_node) -> dict[str, set[str]]:
     return result
 
 
-def _ast_call_sites(file_path: Path) -> dict[str, set[str]]:
-    """ast fallback for call site extraction — also extracts full dotted chains."""
+def _ast_call_sites(file_path: Path) -> Optional[dict[str, set[str]]]:
+    """
+    ast call site extraction — also extracts full dotted chains and
+    typed method calls (see get_call_sites). None if unparsable.
+    """
     result = {}
     try:
         source = file_path.read_text(encoding='utf-8', errors='ignore')
         tree   = ast.parse(source)
     except Exception:
-        return result
+        return None
 
     def _dotted(node) -> Optional[str]:
         """Reconstruct full dotted name from ast.Attribute chain."""
@@ -816,29 +1125,73 @@ def _ast_call_sites(file_path: Path) -> dict[str, set[str]]:
             return f"{val}.{node.attr}" if val else node.attr
         return None
 
+    def _local_types(scope, types: dict, self_attrs: bool = False) -> dict:
+        """`x = Foo(...)` / `with Foo(...) as x` → types["x"] = "Foo" (flow-insensitive)."""
+        for node in ast.walk(scope):
+            if isinstance(node, ast.Assign) and len(node.targets) == 1:
+                target, value = node.targets[0], node.value
+            elif isinstance(node, ast.AnnAssign) and node.value is not None:
+                target, value = node.target, node.value
+            elif isinstance(node, ast.withitem) and node.optional_vars is not None:
+                target, value = node.optional_vars, node.context_expr
+            else:
+                continue
+            if not isinstance(value, ast.Call):
+                continue
+            ctor = _dotted(value.func)
+            if not ctor:
+                continue
+            if isinstance(target, ast.Name) and not self_attrs:
+                types[target.id] = ctor
+            elif (self_attrs and isinstance(target, ast.Attribute)
+                    and isinstance(target.value, ast.Name) and target.value.id == "self"):
+                types[f"self.{target.attr}"] = ctor
+        return types
+
+    def _calls(fn, class_name: Optional[str], attr_types: dict) -> set[str]:
+        types = _local_types(fn, dict(attr_types))
+        calls = set()
+        for node in ast.walk(fn):
+            if isinstance(node, ast.Call):
+                if isinstance(node.func, ast.Name):
+                    calls.add(node.func.id)
+                elif isinstance(node.func, ast.Attribute):
+                    calls.add(node.func.attr)
+                    if isinstance(node.func.value, ast.Name):
+                        calls.add(node.func.value.id)
+                    # full dotted chain + all suffixes
+                    full = _dotted(node.func)
+                    if full:
+                        parts = full.split('.')
+                        for i in range(len(parts) - 1):  # min 2 parts
+                            calls.add('.'.join(parts[i:]))
+
+            # typed receiver: SGD().step, opt.step, self.opt.step, self._prepare
+            if isinstance(node, ast.Attribute) and not node.attr.startswith('__'):
+                recv = node.value
+                if isinstance(recv, ast.Call):
+                    owner = _dotted(recv.func)
+                elif isinstance(recv, ast.Name) and recv.id == "self" and class_name:
+                    owner = class_name
+                else:
+                    owner = types.get(_dotted(recv) or "")
+                if owner:
+                    calls.add(f"{owner}.{node.attr}")
+        return calls
+
     for class_node in ast.walk(tree):
         if not isinstance(class_node, ast.ClassDef):
             continue
+        attr_types = _local_types(class_node, {}, self_attrs=True)
         for method in class_node.body:
             if not isinstance(method, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 continue
-            calls = set()
-            for node in ast.walk(method):
-                if isinstance(node, ast.Call):
-                    if isinstance(node.func, ast.Name):
-                        calls.add(node.func.id)
-                    elif isinstance(node.func, ast.Attribute):
-                        calls.add(node.func.attr)
-                        if isinstance(node.func.value, ast.Name):
-                            calls.add(node.func.value.id)
-                        # full dotted chain + all suffixes
-                        full = _dotted(node.func)
-                        if full:
-                            parts = full.split('.')
-                            for i in range(len(parts) - 1):  # min 2 parts
-                                calls.add('.'.join(parts[i:]))
             key = f"{class_node.name}.{method.name}"
-            result[key] = calls
+            result[key] = _calls(method, class_node.name, attr_types)
+
+    for fn in tree.body:
+        if isinstance(fn, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            result[fn.name] = _calls(fn, None, {})
 
     return result
 
@@ -912,13 +1265,29 @@ def _ast_fallback(file_path: Path, changed_lines: set[int]) -> set[str]:
     Pure-stdlib fallback using ast.
     Preserves Class.method qualified naming to match graph keys.
     """
-    symbols = set()
-    try:
-        source = file_path.read_text(encoding='utf-8', errors='ignore')
-        tree   = ast.parse(source)
-    except Exception:
-        return {"__unknown__"}
+    key         = _definitions_key(file_path, 'ast')
+    definitions = _definitions_cache.get(key) if key else None
+    if definitions is None:
+        try:
+            source = file_path.read_text(encoding='utf-8', errors='ignore')
+            tree   = ast.parse(source)
+        except Exception:
+            return {"__unknown__"}
+        definitions = _ast_definitions(tree)
+        _remember_definitions(key, definitions)
+
+    symbols, covered = _symbols_for_lines(
+        [(start, end, name) for start, end, name, _ in definitions], changed_lines
+    )
 
+    if changed_lines - covered:
+        symbols.add("__module__")
+
+    return symbols or {"__unknown__"}
+
+
+def _ast_definitions(tree) -> list:
+    """(start, end, qualified_name, parent_class) for every class/function."""
     definitions = []
 
     def _walk(node, parent_class: Optional[str] = None):
@@ -936,15 +1305,323 @@ def _ast_fallback(file_path: Path, changed_lines: set[int]) -> set[str]:
                 _walk(child, parent_class=parent_class)
 
     _walk(tree)
+    return definitions
 
-    covered = set()
-    for start, end, name, _ in definitions:
-        for line in changed_lines:
-            if start <= line <= end:
-                symbols.add(name)
-                covered.add(line)
+# ─────────────────────────────────────────────────────────────────────────────
+# Feature 15: semantic no-op detection
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _strip_docstring(body: list) -> list:
+    if (body and isinstance(body[0], ast.Expr)
+            and isinstance(body[0].value, ast.Constant)
+            and isinstance(body[0].value.value, str)):
+        body = body[1:]
+    return body or [ast.Pass()]
+
+
+def _is_typing_only(node) -> bool:
+    """typing imports and `if TYPE_CHECKING:` blocks — annotation plumbing."""
+    if isinstance(node, ast.ImportFrom):
+        return (node.module or "").split(".")[0] in _TYPING_MODULES
+    if isinstance(node, ast.Import):
+        return all(a.name.split(".")[0] in _TYPING_MODULES for a in node.names)
+    if isinstance(node, ast.If) and not node.orelse:
+        return _ast_dotted(node.test).split(".")[-1] == "TYPE_CHECKING"
+    return False
+
+
+class _RuntimeNormalizer(ast.NodeTransformer):
+    """
+    Rewrite a tree to what affects runtime: annotations, docstrings and
+    typing-only imports go; formatting and comments are already gone in
+    the AST. Class-body annotations stay as a marker ("field",
+    "ClassVar", "InitVar") because dataclasses / NamedTuple / TypedDict
+    turn an annotated name into a field: `x = 3` → `x: int = 3` changes
+    __init__, `x: int` → `x: float` does not.
+    """
+
+    def __init__(self):
+        self.in_class = False
+
+    def _body(self, body: list, docstring: bool = True) -> list:
+        body = _strip_docstring(body) if docstring else body
+        out  = []
+        for stmt in body:
+            if _is_typing_only(stmt):
+                continue
+            new = self.visit(stmt)
+            if new is None:
+                continue
+            out.extend(new if isinstance(new, list) else [new])
+        return out or [ast.Pass()]
+
+    def visit_Module(self, node):
+        node.body = self._body(node.body)
+        return node
+
+    def visit_ClassDef(self, node):
+        node.decorator_list = [self.visit(d) for d in node.decorator_list]
+        node.bases          = [self.visit(b) for b in node.bases]
+        node.keywords       = [self.visit(k) for k in node.keywords]
+        outer, self.in_class = self.in_class, True
+        node.body = self._body(node.body)
+        self.in_class = outer
+        return node
+
+    def _visit_function(self, node):
+        node.returns      = None
+        node.type_comment = None
+        node.decorator_list = [self.visit(d) for d in node.decorator_list]
+        node.args         = self.visit(node.args)
+        outer, self.in_class = self.in_class, False
+        node.body = self._body(node.body)
+        self.in_class = outer
+        return node
+
+    visit_FunctionDef      = _visit_function
+    visit_AsyncFunctionDef = _visit_function
+
+    def visit_arg(self, node):
+        node.annotation   = None
+        node.type_comment = None
+        return node
+
+    def visit_AnnAssign(self, node):
+        if self.in_class:
+            # field declaration — keep that it is annotated, not the type
+            return ast.AnnAssign(
+                target     = self.visit(node.target),
+                annotation = ast.Constant(value=_field_marker(node.annotation)),
+                value      = self.visit(node.value) if node.value is not None else None,
+                simple     = node.simple,
+            )
+        if node.value is None:
+            return None                                           # pure annotation
+        return ast.Assign(targets=[self.visit(node.target)], value=self.visit(node.value))
+
+
+def _field_marker(annotation) -> str:
+    """What a class-body annotation means to dataclasses: a field or not."""
+    names = {
+        n.id if isinstance(n, ast.Name) else n.attr
+        for n in ast.walk(annotation)
+        if isinstance(n, (ast.Name, ast.Attribute))
+    }
+    for special in ("ClassVar", "InitVar"):
+        if special in names:
+            return special
+    return "field"
+
+
+def _semantic_fingerprints(source: str) -> Optional[dict[str, str]]:
+    """
+    {qualified name: normalized dump} for every class / function, plus
+    "__module__" for module-level code (definitions reduced to their
+    names). Naming matches _ast_definitions. None if unparsable.
+    """
+    try:
+        tree = _RuntimeNormalizer().visit(ast.parse(source))
+    except (SyntaxError, ValueError, RecursionError):
+        return None
+
+    prints: dict[str, list] = {}
+
+    def _walk(node, parent_class: Optional[str] = None):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.ClassDef):
+                prints.setdefault(child.name, []).append(ast.dump(child))
+                _walk(child, parent_class=child.name)
+            elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                name = f"{parent_class}.{child.name}" if parent_class else child.name
+                prints.setdefault(name, []).append(ast.dump(child))
+                _walk(child, parent_class=parent_class)
+            else:
+                _walk(child, parent_class=parent_class)
+
+    _walk(tree)
+
+    module_level = [
+        ast.dump(ast.Name(id=stmt.name)) if isinstance(
+            stmt, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+        ) else ast.dump(stmt)
+        for stmt in tree.body
+    ]
+    prints["__module__"] = module_level
+    return {name: "\n".join(dumps) for name, dumps in prints.items()}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Feature 16: interface fingerprints (signature vs body changes)
+# ─────────────────────────────────────────────────────────────────────────────
+
+_DEFINITION_NODES = (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+def _function_interface(node) -> str:
+    return "\n".join(
+        [type(node).__name__, ast.dump(node.args)]
+        + [ast.dump(d) for d in node.decorator_list]
+    )
 
-    if changed_lines - covered:
-        symbols.add("__module__")
 
-    return symbols or {"__unknown__"}
\ No newline at end of file
+def _class_interface(node) -> str:
+    members = [
+        ast.dump(ast.Name(id=stmt.name)) if isinstance(stmt, _DEFINITION_NODES)
+        else ast.dump(stmt)
+        for stmt in node.body
+    ]
+    return "\n".join(
+        [ast.dump(b) for b in node.bases]
+        + [ast.dump(k) for k in node.keywords]
+        + [ast.dump(d) for d in node.decorator_list]
+        + members
+    )
+
+
+def _interface_fingerprints(source: str) -> Optional[dict[str, str]]:
+    """
+    {qualified name: interface dump} for every class / function, on the
+    runtime-normalized tree (see _RuntimeNormalizer). Naming matches
+    _ast_definitions. None if unparsable.
+    """
+    try:
+        tree = _RuntimeNormalizer().visit(ast.parse(source))
+    except (SyntaxError, ValueError, RecursionError):
+        return None
+
+    prints: dict[str, list] = {}
+
+    def _walk(node, parent_class: Optional[str] = None):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.ClassDef):
+                prints.setdefault(child.name, []).append(_class_interface(child))
+                _walk(child, parent_class=child.name)
+            elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                name = f"{parent_class}.{child.name}" if parent_class else child.name
+                prints.setdefault(name, []).append(_function_interface(child))
+                _walk(child, parent_class=parent_class)
+            else:
+                _walk(child, parent_class=parent_class)
+
+    _walk(tree)
+    return {name: "\n".join(dumps) for name, dumps in prints.items()}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Feature 17: module-level change resolution
+# ─────────────────────────────────────────────────────────────────────────────
+
+_COMPOUND_NODES = (ast.If, ast.Try, ast.For, ast.AsyncFor, ast.While, ast.With, ast.AsyncWith)
+
+
+def _bound_names(node) -> set[str]:
+    """Module names a statement binds: assignment targets, imports, defs."""
+    names = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name) and isinstance(child.ctx, (ast.Store, ast.Del)):
+            names.add(child.id)
+        elif isinstance(child, (ast.Import, ast.ImportFrom)):
+            for alias in child.names:
+                if alias.name != "*":
+                    names.add(alias.asname or alias.name.split(".")[0])
+        elif isinstance(child, _DEFINITION_NODES):
+            names.add(child.name)
+    return names
+
+
+def _loaded_names(node) -> set[str]:
+    return {
+        child.id for child in ast.walk(node)
+        if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Load)
+    }
+
+
+def _dunder_all_entries(stmt, lines: set[int]) -> set[str]:
+    """String entries of an `__all__` list on the changed lines (all if none are)."""
+    entries = [
+        e for e in ast.walk(stmt.value)
+        if isinstance(e, ast.Constant) and isinstance(e.value, str)
+    ] if stmt.value is not None else []
+    on_lines = [e for e in entries if e.lineno in lines]
+    return {e.value for e in (on_lines or entries)}
+
+
+def _module_stmt_names(stmt, lines: set[int], tree) -> Optional[set[str]]:
+    """Names one module-level statement touches; None if unresolvable."""
+    if isinstance(stmt, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+        targets = stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+        if any(isinstance(t, ast.Name) and t.id == "__all__" for t in targets):
+            return _dunder_all_entries(stmt, lines)
+        names = set()
+        for target in targets:
+            if isinstance(target, (ast.Tuple, ast.List)):
+                names |= _bound_names(target)
+                continue
+            # config.x = 1 / lowerings[op] = fn → the module name being mutated
+            root = target
+            while isinstance(root, (ast.Attribute, ast.Subscript, ast.Starred)):
+                root = root.value
+            if isinstance(root, ast.Name):
+                names.add(root.id)
+        return names or None
+
+    if isinstance(stmt, (ast.Import, ast.ImportFrom)):
+        if any(alias.name == "*" for alias in stmt.names):
+            return None
+        aliases = [a for a in stmt.names if getattr(a, 'lineno', None) in lines] or stmt.names
+        return {a.asname or a.name.split(".")[0] for a in aliases}
+
+    if isinstance(stmt, ast.Expr):
+        value = stmt.value
+        if isinstance(value, ast.Constant) and isinstance(value.value, str):
+            return set()                                   # docstring
+        if isinstance(value, ast.Call):
+            defined = _bound_names(tree)
+            args    = {n for a in value.args + [k.value for k in value.keywords]
+                       for n in _loaded_names(a)}
+            func    = value.func
+            while isinstance(func, (ast.Attribute, ast.Call)):
+                func = func.value if isinstance(func, ast.Attribute) else func.func
+            registrar = {func.id} if isinstance(func, ast.Name) else set()
+            return (args & defined) or registrar or None
+        return None
+
+    if isinstance(stmt, ast.Delete):
+        return _bound_names(stmt) or None
+
+    if isinstance(stmt, (ast.Pass, ast.Global, ast.Nonlocal)):
+        return set()
+
+    if isinstance(stmt, _COMPOUND_NODES):
+        return _bound_names(stmt) or None
+
+    return None
+
+
+def _readers_of(tree, names: set[str]) -> set[str]:
+    """
+    Qualified definitions whose own code reads one of `names`: function
+    defaults, decorators and bodies; for classes only bases, decorators
+    and class-level statements (methods are separate definitions).
+    """
+    readers = set()
+
+    def _walk(node, parent_class: Optional[str] = None):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.ClassDef):
+                own = child.bases + child.keywords + child.decorator_list + [
+                    s for s in child.body if not isinstance(s, _DEFINITION_NODES)
+                ]
+                if any(_loaded_names(n) & names for n in own):
+                    readers.add(child.name)
+                _walk(child, parent_class=child.name)
+            elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                name = f"{parent_class}.{child.name}" if parent_class else child.name
+                if _loaded_names(child) & names:
+                    readers.add(name)
+                _walk(child, parent_class=parent_class)
+            else:
+                _walk(child, parent_class=parent_class)
+
+    _walk(tree)
+    return readers
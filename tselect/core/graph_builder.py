@@ -14,6 +14,7 @@ Three-phase build:
              (c) file_identifiers:       source file  → all identifiers used in it
 
   Phase 2: pytest --collect-only in batches → test inventory
+             (forked warm workers when runner.preload is configured)
 
   Phase 3: compute dynamic fanout threshold from distribution gap
 
@@ -33,6 +34,32 @@ Changes from 3.0 → 3.1 (tree-sitter upgrade):
     Python import statements
   - Test file parsing (_extract_symbol_references, _extract_method_level_references)
     stays ast-based — PyTorch test files are always .py
+
+Changes from 3.1 → 3.2 (call graph):
+  - call_graph: source function → source functions it calls, from
+    fn_diff.get_call_sites() resolved through each file's imports
+    "torch/optim/lr_scheduler.py::LRScheduler.step" → ["torch/optim/sgd.py::SGD.step"]
+    graph_selector follows it backwards: a change reaches the tests of
+    every caller.
+  - function_reverse_graph gains method keys: a test that calls
+    `opt = SGD(...); opt.step()` is linked to "sgd.py::SGD.step", not just
+    "sgd.py::SGD", so a change to SGD.step selects only the tests that
+    can reach step.
+  - op_registry: op name → handlers registered for it by decorator
+    (fn_diff.get_decorator_registry), e.g.
+    "add" → ["torch/_inductor/lowering.py::add_lowering"]
+    Test methods that mention aten.add, torch.add, torch.ops.aten.add.default
+    or the string "add" are linked to the handler in
+    function_reverse_graph, so lowering edits resolve at function level.
+
+Changes from 3.2 → 3.3 (qualified imports):
+  - file_imported_names: source file → the imported names it actually
+    uses, qualified by the file they come from (and, through re-exports,
+    the file that defines them)
+    "torch/optim/lr_scheduler.py" → ["torch/optim/optimizer.py::Optimizer", ...]
+    graph_selector's identifier-overlap guard checks these
+    (origin_file, symbol) pairs, so a change to `step` in one file no
+    longer overlaps every importer that happens to use some other `step`.
 """
 
 import ast
@@ -44,12 +71,27 @@ import time
 from collections import defaultdict
 from pathlib import Path
 
-from tselect.core.fn_diff import get_all_symbols, get_all_identifiers
+from tselect.core.fn_diff import (
+    get_all_symbols,
+    get_all_identifiers,
+    get_call_sites,
+    get_decorator_registry,
+    normalize_op_key,
+    OP_NAMESPACES,
+)
+from tselect.adapters.worker_pool import get_worker_pool
 
 SUPPORTED_LANGUAGES   = {"python"}
 COMING_SOON_LANGUAGES = {"java", "javascript", "typescript", "go", "cpp"}
 DEFAULT_HIGH_FANOUT_THRESHOLD = 30
 
+# `from pkg import X` chains followed to the file that defines X
+MAX_REEXPORT_HOPS = 5
+
+# calls whose bare string arguments name an op — getattr only when its
+# object is an op namespace: getattr(torch.ops.aten, "add")
+OP_LOOKUP_CALLS = {"getattr", "get_op", "lookup_op", "find_op", "OpInfo"}
+
 CPP_EXTENSIONS = {'.cpp', '.cu', '.cuh', '.h', '.hpp', '.cc', '.c'}
 PY_EXTENSIONS  = {'.py'}
 
@@ -58,6 +100,18 @@ class UnsupportedLanguageError(Exception):
     pass
 
 
+def _dotted_name(node):
+    """aten.add / torch.ops.aten.add.default → dotted string, None otherwise."""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
 class GraphBuilder:
     def __init__(self, layout, config: dict = None):
         self.layout       = layout
@@ -70,6 +124,7 @@ class GraphBuilder:
             self.config.get("graph", {}).get("collect_batch_size", 50)
             or getattr(layout, "collect_batch_size", 50)
         )
+        self.pool         = get_worker_pool(self.config, self.repo_root)
         self._validate_language()
 
     def _validate_language(self):
@@ -260,6 +315,248 @@ class GraphBuilder:
                             forward[rel].add(repo_rel)
                             break  # take first match only
 
+    # ─────────────────────────────────────────────
+    # PHASE 0b: Source call graph
+    # ─────────────────────────────────────────────
+
+    def _import_aliases(self, tree, rel: str, module_map: dict) -> dict:
+        """
+        local name → (source file, imported symbol or None for a module).
+        Relative imports are resolved against rel's package, so
+        `from .sgd import SGD` in torch/optim/__init__.py is followed.
+        """
+        package   = list(Path(rel).parent.parts)
+        alias_map = {}
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom) and (node.module or node.level):
+                module = node.module or ""
+                if node.level:
+                    base   = package[:len(package) - node.level + 1]
+                    module = ".".join(base + ([module] if module else []))
+                src_file = module_map.get(module)
+                for alias in node.names:
+                    if alias.name == "*":
+                        continue
+                    local     = alias.asname or alias.name
+                    child_src = module_map.get(f"{module}.{alias.name}" if module else alias.name)
+                    if child_src:
+                        alias_map[local] = (child_src, None)
+                    elif src_file:
+                        alias_map[local] = (src_file, alias.name)
+
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    src_file = module_map.get(alias.name)
+                    if src_file:
+                        local = alias.asname or alias.name.split(".")[-1]
+                        alias_map[local] = (src_file, None)
+        return alias_map
+
+    @staticmethod
+    def _resolve_call(name: str, rel, alias_map: dict, symbol_index: dict):
+        """
+        "SGD.step" / "optim.SGD" / "_helper" as seen in `rel` → the
+        "src_file::Qualified.name" it refers to, or None if it isn't a
+        definition in the repo (builtins, attributes of unknown objects).
+        Re-exports are followed to the defining file:
+            from torch.optim import SGD   → "torch/optim/sgd.py::SGD"
+        """
+        definitions = symbol_index["definitions"]
+        head, *rest = name.split(".")
+        if rel is not None and head in definitions.get(rel, ()):
+            src_file, qualified = rel, name
+        elif head in alias_map:
+            src_file, sym = alias_map[head]
+            qualified     = ".".join(([sym] if sym else []) + rest)
+        else:
+            return None
+
+        for _ in range(MAX_REEXPORT_HOPS):
+            if not qualified:
+                return None
+            if qualified in definitions.get(src_file, ()):
+                return f"{src_file}::{qualified}"
+            head, *rest = qualified.split(".")
+            reexport = symbol_index["aliases"].get(src_file, {}).get(head)
+            if not reexport:
+                return None
+            src_file, sym = reexport
+            qualified     = ".".join(([sym] if sym else []) + rest)
+        return None
+
+    @staticmethod
+    def _imported_uses(tree, rel: str, alias_map: dict) -> set:
+        """
+        (source file, symbol) for every import binding `rel` actually uses:
+            from .sgd import SGD; SGD(...)      → ("mypkg/optim/sgd.py", "SGD")
+            import mypkg.optim.sgd as s; s.SGD  → ("mypkg/optim/sgd.py", "SGD")
+        A package __init__ or a name listed in __all__ counts as used —
+        that is a re-export.
+        """
+        exported = set()
+        for node in tree.body:
+            if (
+                isinstance(node, ast.Assign)
+                and any(isinstance(t, ast.Name) and t.id == "__all__" for t in node.targets)
+                and isinstance(node.value, (ast.List, ast.Tuple))
+            ):
+                exported |= {
+                    elt.value for elt in node.value.elts
+                    if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+                }
+
+        reexports_all = Path(rel).name == "__init__.py"
+        uses          = set()
+        for local, (src_file, sym) in alias_map.items():
+            if sym and (reexports_all or local in exported):
+                uses.add((src_file, sym))
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name):
+                chain = node.id
+            elif isinstance(node, ast.Attribute):
+                chain = _dotted_name(node)
+            else:
+                continue
+            if not chain:
+                continue
+            head, *rest = chain.split(".")
+            if head not in alias_map:
+                continue
+            src_file, sym = alias_map[head]
+            if sym:
+                uses.add((src_file, sym))
+            elif rest:
+                uses.add((src_file, rest[0]))
+        return uses
+
+    def _build_call_graph(self, module_map: dict) -> tuple:
+        """
+        Caller → callee edges between functions of the repo's Python sources.
+
+        Returns (call_graph, symbol_index):
+            call_graph:   {"mypkg/train.py::run": ["mypkg/optim/sgd.py::SGD.step", ...]}
+            symbol_index: {"definitions": {"mypkg/optim/sgd.py": {"SGD", "SGD.step", ...}},
+                           "aliases":     {"mypkg/optim/__init__.py": {"SGD": (sgd.py, "SGD")}},
+                           "imported":    {"mypkg/train.py": ["mypkg/optim/sgd.py::SGD", ...]}}
+                          (also used to resolve test call sites)
+        """
+        definitions = {}
+        aliases     = {}
+        sites       = {}
+        uses        = {}
+        for src in self.source_files:
+            if src.suffix.lower() not in PY_EXTENSIONS:
+                continue
+            rel        = str(src.relative_to(self.repo_root))
+            calls      = get_call_sites(src)
+            sites[rel] = calls
+            definitions[rel] = (
+                set(calls)
+                | {name.split(".")[0] for name in calls}
+                | self._extract_public_symbols(src)
+            )
+            try:
+                tree = ast.parse(src.read_text(encoding="utf-8", errors="ignore"))
+            except Exception:
+                continue
+            aliases[rel] = self._import_aliases(tree, rel, module_map)
+            uses[rel]    = self._imported_uses(tree, rel, aliases[rel])
+
+        symbol_index = {"definitions": definitions, "aliases": aliases}
+
+        # imported names, qualified by the file they are imported from and,
+        # through re-exports, by the file that defines them
+        imported = {}
+        for rel, pairs in uses.items():
+            names = set()
+            for src_file, sym in pairs:
+                names.add(f"{src_file}::{sym}")
+                target = self._resolve_call(sym, None, {sym: (src_file, sym)}, symbol_index)
+                if target:
+                    names.add(target)
+            imported[rel] = sorted(names)
+        symbol_index["imported"] = imported
+
+        call_graph   = {}
+        for rel, calls in sites.items():
+            alias_map = aliases.get(rel, {})
+            for fn, names in calls.items():
+                caller  = f"{rel}::{fn}"
+                callees = set()
+                for name in names:
+                    callee = self._resolve_call(name, rel, alias_map, symbol_index)
+                    if callee and callee != caller:
+                        callees.add(callee)
+                if callees:
+                    call_graph[caller] = sorted(callees)
+
+        return call_graph, symbol_index
+
+    def _build_op_registry(self) -> dict:
+        """
+        op name → ["src_file::handler", ...] for every decorator
+        registration in the Python sources:
+            @register_lowering(aten.add)  in torch/_inductor/lowering.py
+            → {"add": ["torch/_inductor/lowering.py::add_lowering"]}
+        """
+        op_registry = defaultdict(set)
+        for src in self.source_files:
+            if src.suffix.lower() not in PY_EXTENSIONS:
+                continue
+            rel = str(src.relative_to(self.repo_root))
+            for key, handler in get_decorator_registry(src).items():
+                op = normalize_op_key(key)
+                if op:
+                    op_registry[op].add(f"{rel}::{handler}")
+        return {op: sorted(handlers) for op, handlers in op_registry.items()}
+
+    @staticmethod
+    def _op_mentions(node) -> set:
+        """
+        Op names a test method mentions: dotted references rooted in an op
+        namespace (aten.add, torch.add, torch.ops.aten.add.default),
+        strings in op form ("aten::add", "torch.ops.aten.add"), and bare
+        strings only as arguments of an op lookup (OP_LOOKUP_CALLS) —
+        "cpu", "mean" or "float32" elsewhere in a test are not op mentions.
+        """
+        def _op_string(value: str):
+            if len(value) > 64:
+                return None
+            if "::" in value or value.split(".")[0] in OP_NAMESPACES and "." in value:
+                return normalize_op_key(value)
+            return None
+
+        ops = set()
+        for child in ast.walk(node):
+            if isinstance(child, ast.Attribute):
+                dotted = _dotted_name(child)
+                if dotted and dotted.split(".")[0] in OP_NAMESPACES:
+                    op = normalize_op_key(dotted)
+                    if op and op not in OP_NAMESPACES:   # torch.ops.aten itself
+                        ops.add(op)
+            elif isinstance(child, ast.Constant) and isinstance(child.value, str):
+                op = _op_string(child.value)
+                if op:
+                    ops.add(op)
+            elif isinstance(child, ast.Call):
+                func = _dotted_name(child.func) or ""
+                if func.split(".")[-1] not in OP_LOOKUP_CALLS:
+                    continue
+                args = child.args
+                if func == "getattr":
+                    target = _dotted_name(args[0]) if args else None
+                    if not target or target.split(".")[0] not in OP_NAMESPACES:
+                        continue
+                    args = args[1:]
+                for arg in args:
+                    if (isinstance(arg, ast.Constant) and isinstance(arg.value, str)
+                            and len(arg.value) <= 64):
+                        op = normalize_op_key(arg.value)
+                        if op:
+                            ops.add(op)
+        return ops
+
     # ─────────────────────────────────────────────
     # TEST: extract symbol-level references (ast — tests are .py)
     # ─────────────────────────────────────────────
@@ -340,7 +637,7 @@ class GraphBuilder:
     # ─────────────────────────────────────────────
 
     def _extract_method_level_references(
-        self, test_path: Path, module_map: dict
+        self, test_path: Path, module_map: dict, symbol_index: dict = None
     ) -> dict:
         """
         Parse a test file and return which symbols each TEST METHOD references.
@@ -348,12 +645,23 @@ class GraphBuilder:
         Returns:
             {
                 "TestOptimCPU::test_sgd_momentum": {
-                    "torch/optim/sgd.py": {"SGD", "step"},
+                    "torch/optim/sgd.py": {"SGD", "SGD.step"},
                 },
             }
 
         This enables function_reverse_graph to map:
-            "sgd.py::SGD" → ["test_optim.py::TestOptimCPU::test_sgd_momentum"]
+            "sgd.py::SGD"      → ["test_optim.py::TestOptimCPU::test_sgd_momentum"]
+            "sgd.py::SGD.step" → ["test_optim.py::TestOptimCPU::test_sgd_momentum"]
+
+        With symbol_index (from _build_call_graph) the method's call sites
+        are resolved to the concrete source methods it invokes: typed
+        receivers (`opt = SGD(); opt.step()`) directly, and untyped ones
+        (`opt = make_optimizer(SGD); opt.step()`) through the classes
+        the method references.
+
+        Helpers the method calls in the same file (`self._run(opt)`,
+        module-level functions) are walked as part of the method, so a
+        test that reaches SGD.step through a helper is linked to it too.
         """
         method_references = {}
 
@@ -391,14 +699,18 @@ class GraphBuilder:
                         local = alias.asname or alias.name.split(".")[-1]
                         alias_map[local] = (src_file, None)
 
-        if not alias_map:
+        if not alias_map and not (symbol_index or {}).get("ops"):
             return method_references
 
-        # step 2: per-method symbol walk
-        for class_node in ast.walk(tree):
-            if not isinstance(class_node, ast.ClassDef):
-                continue
+        call_sites = get_call_sites(test_path) if symbol_index else {}
+        classes    = {n.name: n for n in ast.walk(tree) if isinstance(n, ast.ClassDef)}
+        functions  = {
+            n.name: n for n in tree.body
+            if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
+        }
 
+        # step 2: per-method symbol walk (helpers it calls included)
+        for class_node in classes.values():
             for method_node in class_node.body:
                 if not isinstance(method_node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                     continue
@@ -407,8 +719,11 @@ class GraphBuilder:
 
                 method_key = f"{class_node.name}::{method_node.name}"
                 refs       = defaultdict(set)
+                bodies     = self._with_test_helpers(
+                    method_node, class_node.name, classes, functions
+                )
 
-                for node in ast.walk(method_node):
+                for node in (n for _, body in bodies for n in ast.walk(body)):
                     if isinstance(node, ast.Name):
                         name = node.id
                         if name in alias_map:
@@ -423,16 +738,102 @@ class GraphBuilder:
                                 src_file, _ = alias_map[obj]
                                 refs[src_file].add(attr)
 
+                op_registry = (symbol_index or {}).get("ops")
+                if op_registry:
+                    for _, body in bodies:
+                        for op in self._op_mentions(body):
+                            for target in op_registry.get(op, ()):
+                                src_file, handler = target.split("::", 1)
+                                refs[src_file].add(handler)
+
+                if symbol_index:
+                    self._add_called_methods(
+                        refs,
+                        {name for key, _ in bodies for name in call_sites.get(key, ())},
+                        alias_map, symbol_index,
+                    )
+
                 if refs:
                     method_references[method_key] = dict(refs)
 
         return method_references
 
+    @staticmethod
+    def _with_test_helpers(method_node, class_name: str, classes: dict, functions: dict) -> list:
+        """
+        [(call-site key, node)] for a test method and the helpers it reaches
+        inside the test file — `self._run(opt)` (on its class or a base
+        class defined in the file) and module-level functions, followed
+        transitively — so `opt.step()` in a helper counts for the test.
+        """
+        def _method(cls_name: str, name: str, bases_seen=()):
+            cls = classes.get(cls_name)
+            if cls is None or cls_name in bases_seen:
+                return None
+            for node in cls.body:
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == name:
+                    return f"{cls_name}.{name}", node
+            for base in cls.bases:
+                if isinstance(base, ast.Name):
+                    found = _method(base.id, name, bases_seen + (cls_name,))
+                    if found:
+                        return found
+            return None
+
+        bodies   = [(f"{class_name}.{method_node.name}", method_node)]
+        seen     = {bodies[0][0]}
+        frontier = [method_node]
+        while frontier:
+            next_frontier = []
+            for body in frontier:
+                for node in ast.walk(body):
+                    if not isinstance(node, ast.Call):
+                        continue
+                    func  = node.func
+                    found = None
+                    if (isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name)
+                            and func.value.id == "self"):
+                        found = _method(class_name, func.attr)
+                    elif isinstance(func, ast.Name) and func.id in functions:
+                        found = (func.id, functions[func.id])
+                    if found and found[0] not in seen:
+                        seen.add(found[0])
+                        bodies.append(found)
+                        next_frontier.append(found[1])
+            frontier = next_frontier
+        return bodies
+
+    def _add_called_methods(
+        self, refs: dict, calls, alias_map: dict, symbol_index: dict
+    ) -> None:
+        """Add "Class.method" symbols a test method calls into refs (in place)."""
+        for name in calls:
+            target = self._resolve_call(name, None, alias_map, symbol_index)
+            if target:
+                src_file, qualified = target.split("::", 1)
+                refs[src_file].add(qualified)
+
+        # untyped receiver: `.step()` on something built from a referenced class
+        bare  = {name for name in calls if "." not in name}
+        found = []
+        for src_file, symbols in refs.items():
+            for sym in symbols:
+                if "." in sym:
+                    continue
+                for method in bare:
+                    target = self._resolve_call(
+                        f"{sym}.{method}", None, {sym: (src_file, sym)}, symbol_index
+                    )
+                    if target:
+                        found.append(target.split("::", 1))
+        for src_file, qualified in found:
+            refs[src_file].add(qualified)
+
     # ─────────────────────────────────────────────
     # PHASE 1: Build reverse graphs
     # ─────────────────────────────────────────────
 
-    def _build_reverse_graphs(self, module_map: dict) -> tuple:
+    def _build_reverse_graphs(self, module_map: dict, symbol_index: dict = None) -> tuple:
         """
         Build three graphs simultaneously.
 
@@ -459,7 +860,7 @@ class GraphBuilder:
             for src_file in file_refs:
                 file_reverse[src_file].add(rel_test)
 
-            method_refs = self._extract_method_level_references(test, module_map)
+            method_refs = self._extract_method_level_references(test, module_map, symbol_index)
             for method_key, src_refs in method_refs.items():
                 full_method_id = f"{rel_test}::{method_key}"
                 for src_file, symbols in src_refs.items():
@@ -489,12 +890,17 @@ class GraphBuilder:
     # ─────────────────────────────────────────────
 
     def _collect_batch(self, batch: list) -> str:
-        cmd = [
-            sys.executable, "-m", "pytest",
+        args = [
             "--collect-only", "-q", "--no-header",
             "--continue-on-collection-errors",
         ] + batch
 
+        if self.pool is not None:
+            _, _, output = self.pool.run(args, timeout=30)
+            return output
+
+        cmd = [sys.executable, "-m", "pytest"] + args
+
         try:
             result = subprocess.run(
                 cmd, capture_output=True, text=True,
@@ -616,10 +1022,24 @@ class GraphBuilder:
         print(f"    Done in {time.time() - t0:.2f}s  —  "
               f"{len(source_reverse_graph)} source files have dependents")
 
+        # Phase 0b: source call graph (caller → callee)
+        print("  Phase 0b: Building source call graph...")
+        t0 = time.time()
+        call_graph, symbol_index = self._build_call_graph(module_map)
+        op_registry = self._build_op_registry()
+        symbol_index["ops"] = op_registry
+        print(f"    Done in {time.time() - t0:.2f}s  —  "
+              f"{sum(len(v) for v in call_graph.values())} call edges "
+              f"from {len(call_graph)} functions, "
+              f"{len(op_registry)} registered ops, "
+              f"{len(symbol_index['imported'])} files with qualified imports")
+
         # Phase 1: test → source reverse graphs + file identifiers (tree-sitter)
         print("  Phase 1: Building file + function graph + identifier index (tree-sitter)...")
         t1 = time.time()
-        file_reverse, function_reverse, file_identifiers = self._build_reverse_graphs(module_map)
+        file_reverse, function_reverse, file_identifiers = self._build_reverse_graphs(
+            module_map, symbol_index
+        )
 
         elapsed1      = time.time() - t1
         total_f_edges = sum(len(v) for v in file_reverse.values())
@@ -638,8 +1058,12 @@ class GraphBuilder:
         print("  Phase 2: Building test inventory via pytest --collect-only...")
         t2 = time.time()
 
+        # tests linked only through op_registry mentions need an inventory too
         all_candidate_tests = sorted(set(
             tf for tests in file_reverse.values() for tf in tests
+        ) | set(
+            method_id.split("::", 1)[0]
+            for methods in function_reverse.values() for method_id in methods
         ))
         test_inventory = self._build_test_inventory(all_candidate_tests)
 
@@ -652,12 +1076,15 @@ class GraphBuilder:
               f"(computed from distribution gap)")
 
         return {
-            "schema_version":         "3.1",
+            "schema_version":         "3.3",
             "language":               self.language,
             "source_reverse_graph":   source_reverse_graph,
             "full_reverse_graph":     file_reverse,
             "function_reverse_graph": function_reverse,
+            "call_graph":             call_graph,
+            "op_registry":            op_registry,
             "file_identifiers":       file_identifiers,
+            "file_imported_names":    symbol_index["imported"],
             "fanout_threshold":       fanout_threshold,
             "test_inventory":         test_inventory,
             "built_at":               time.time(),
@@ -667,6 +1094,9 @@ class GraphBuilder:
         graph_dir  = self.repo_root / ".graph" / "tselect"
         graph_dir.mkdir(parents=True, exist_ok=True)
         graph_path = graph_dir / "dependency_graph.json"
-        with open(graph_path, "w") as f:
+        # write-then-rename: a running `tselect serve` never reads half a graph
+        tmp_path   = graph_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
             json.dump(graph_data, f, indent=2)
+        tmp_path.replace(graph_path)
         return graph_path
\ No newline at end of file
@@ -20,6 +20,11 @@ Selection strategy (in priority order):
       graph stores "SGD" (class level)
       fix: if "SGD.step" not found → strip method → try "SGD"
 
+    Call graph (schema 3.2): the tests of every function that calls a
+    changed symbol (call_graph, followed backwards up to CALLER_DEPTH
+    hops) are selected with it — a test reaches SGD.step through
+    train.run just as surely as by calling it.
+
   Tier 1b — Re-export routing:
     For transitive files that are DIRECT importers of the changed file,
     use the importer's function_reverse_graph entries with the changed
@@ -28,6 +33,11 @@ Selection strategy (in priority order):
   Tier 2 — File-level fallback:
     Used when function-level lookup returns empty.
 
+  Tiered execution:
+    split_by_tier() separates the high-precision tiers (self, function,
+    re-export) from the broad ones (file, proximity) so the CLI can run
+    the precise stage first and escalate only on demand.
+
   Transitive expansion (schema 3.0):
     BFS through source_reverse_graph.
     TWO stopping conditions (both must pass to follow an importer):
@@ -35,12 +45,23 @@ Selection strategy (in priority order):
          threshold from graph (dynamic, computed from distribution gap)
       2. Identifier overlap: importer uses at least one changed symbol
          if changed_symbols ∩ file_identifiers[importer] == empty → stop
+         Schema 3.3 compares (origin_file, symbol) pairs instead
+         (file_imported_names), so common names like `step`, `run` or
+         `forward` don't make every importer overlap.
     No depth counter — BFS runs until both guards stop everything.
+
+    Body-only changes (every changed symbol kept its interface — see
+    fn_diff.classify_symbols) expand less: an importer that calls the
+    changed function is selected but not expanded further, only pure
+    re-exporters are followed. Signature changes, deletions, new and
+    module-level code, and unclassified files keep full expansion.
 """
 
 from pathlib import Path
 from collections import defaultdict
 
+from tselect.core.fn_diff import NOOP_SYMBOL
+
 
 DEFAULT_HIGH_FANOUT_THRESHOLD = 30
 
@@ -57,6 +78,17 @@ NON_CODE_FILENAMES = {
 
 TEST_PATH_PREFIXES = ('test/', 'tests/', 'test\\', 'tests\\')
 
+# call_graph hops followed from a changed function to its callers
+CALLER_DEPTH = 3
+
+# selection_mode values grouped by how much we trust them
+PRECISE_MODES = ("self", "function", "re-export")
+BROAD_MODES   = ("file", "proximity")
+
+
+def _quiet(*args, **kwargs) -> None:
+    pass
+
 
 def _is_test_file(rel: str) -> bool:
     """
@@ -90,6 +122,8 @@ def _expand_transitively(
     file_identifiers: dict,
     changed_symbols: set,
     threshold: int = DEFAULT_HIGH_FANOUT_THRESHOLD,
+    body_only: bool = False,
+    imported_names: dict = None,
 ) -> set:
     """
     BFS through source_reverse_graph.
@@ -100,6 +134,18 @@ def _expand_transitively(
          (only applied when changed_symbols is non-empty and meaningful)
 
     No depth counter. BFS runs until guards stop everything.
+
+    imported_names (graph file_imported_names, schema 3.3): Guard 2 then
+    compares (origin_file, symbol) pairs — "sgd.py::SGD" — so an importer
+    that uses some other `step` or `run` doesn't overlap. Importers that
+    bind nothing from the file being expanded (C++ includes, untracked
+    import forms) fall back to the bare identifier check.
+
+    body_only: the interface is unchanged, so only code that calls the
+    changed functions can behave differently. An importer must also use
+    the called name ("SGD.step" → "step"); one that does is kept but
+    not expanded, one without identifiers (pure re-export) is followed.
+    Without file_identifiers: direct importers only.
     """
     visited  = {changed_file}
     frontier = {changed_file}
@@ -111,12 +157,27 @@ def _expand_transitively(
         if s not in ("__module__", "__imports__", "__all__", "__constant__"):
             base_symbols.add(s.split(".")[0])
 
+    called_names = set()
+    if body_only:
+        # a class only "changed" because a method did — callers name the method
+        called_names = {
+            s.rsplit(".", 1)[-1]
+            for s in changed_symbols
+            if not s.startswith("__")
+            and not any(o.startswith(s + ".") for o in changed_symbols)
+        }
+
     use_identifier_overlap = bool(base_symbols) and bool(file_identifiers)
+    use_qualified_overlap  = bool(base_symbols) and bool(imported_names)
 
     while frontier:
         next_frontier = set()
         for f in frontier:
             importers = set(source_reverse_graph.get(f, []))
+            # changed symbols as seen from importers of f: defined in the
+            # changed file, or re-exported by f
+            wanted = {f"{origin}::{sym}" for origin in (changed_file, f) for sym in base_symbols}
+            origins = (f"{changed_file}::", f"{f}::")
             for importer in importers:
                 if importer in visited:
                     continue
@@ -125,15 +186,26 @@ def _expand_transitively(
                 if len(file_reverse_graph.get(importer, [])) > threshold:
                     continue
 
-                # Guard 2: identifier overlap
-                if use_identifier_overlap:
-                    importer_ids = set(file_identifiers.get(importer, []))
-                    if importer_ids and not (base_symbols & importer_ids):
+                # Guard 2: identifier overlap — qualified where the importer's
+                # bindings from f are known, bare identifiers otherwise
+                importer_ids = set(file_identifiers.get(importer, [])) if use_identifier_overlap else set()
+                pairs = imported_names.get(importer) if use_qualified_overlap else None
+                if pairs and any(p.startswith(origins) for p in pairs):
+                    if wanted.isdisjoint(pairs):
                         continue
+                elif importer_ids and not (base_symbols & importer_ids):
+                    continue
+                if importer_ids and called_names and not (called_names & importer_ids):
+                    continue
 
-                next_frontier.add(importer)
                 visited.add(importer)
 
+                # body-only: callers are affected, their importers are not
+                if body_only and (importer_ids or not use_identifier_overlap):
+                    continue
+
+                next_frontier.add(importer)
+
         frontier = next_frontier
 
     return visited
@@ -144,11 +216,29 @@ def select_tests_from_graph(
     graph: dict,
     repo_root: Path,
     config: dict = None,
+    changed_functions: dict = None,
+    verbose: bool = True,
+    detect_noop: bool = None,
+    change_kinds: dict = None,
 ) -> tuple:
     """
     Main entry point. Returns (selected, total_methods).
+
+    changed_functions: precomputed {rel_path: symbols} — skips the per-file
+                       git diff (batch evaluation, tselect.api).
+    verbose:           False → no progress output (batch callers).
+    detect_noop:       skip files whose change is annotations / docstrings /
+                       comments / formatting only. None → config
+                       graph.detect_noop (default on).
+    change_kinds:      precomputed {rel_path: {symbol: kind}} (see
+                       diff_parser.get_changed_functions). Filled here
+                       when changed_functions is computed here; files
+                       without kinds get full transitive expansion.
     """
     config    = config or {}
+    log       = print if verbose else _quiet
+    if detect_noop is None:
+        detect_noop = config.get("graph", {}).get("detect_noop", True)
 
     # use dynamic threshold from graph if available, else config, else default
     threshold = (
@@ -159,24 +249,33 @@ def select_tests_from_graph(
 
     reverse_graph        = graph.get("full_reverse_graph", {})
     function_graph       = graph.get("function_reverse_graph", {})
+    call_graph           = graph.get("call_graph", {})
     test_inventory       = graph.get("test_inventory", {})
     source_reverse_graph = graph.get("source_reverse_graph", {})
     file_identifiers     = graph.get("file_identifiers", {})
+    imported_names       = graph.get("file_imported_names", {})
     has_function_graph   = bool(function_graph)
     has_transitive       = bool(source_reverse_graph)
 
     from tselect.core.diff_parser import get_changed_functions
 
-    changed_functions = {}
-    if has_function_graph:
-        try:
-            changed_functions = get_changed_functions(repo_root, changed_files)
-        except Exception:
-            changed_functions = {}
+    if changed_functions is None:
+        changed_functions = {}
+        change_kinds      = {}
+        if has_function_graph:
+            try:
+                changed_functions = get_changed_functions(
+                    repo_root, changed_files, detect_noop=detect_noop,
+                    change_kinds=change_kinds,
+                )
+            except Exception:
+                changed_functions = {}
+    change_kinds = change_kinds or {}
 
     selected_tests      = {}
     skipped_high_fanout = []
     skipped_non_code    = []
+    skipped_noop        = []
 
     for cf in changed_files:
         rel = _normalize(cf, repo_root)
@@ -194,11 +293,11 @@ def select_tests_from_graph(
                         "triggered_by":    [rel],
                         "matched_symbols": [],
                         "selection_mode":  "self",
-                        "classes":         dict(classes),
+                        "classes":         _copy_classes(classes),
                     }
-                print(f"    Self-select: {rel} (test file changed directly)")
+                log(f"    Self-select: {rel} (test file changed directly)")
             else:
-                print(f"    Self-select: {rel} (test file changed, not in inventory)")
+                log(f"    Self-select: {rel} (test file changed, not in inventory)")
             continue
 
         # Pre-flight 2: non-code file skip
@@ -210,18 +309,24 @@ def select_tests_from_graph(
         rel_symbols_changed = changed_functions.get(rel, set())
         symbols_changed     = rel_symbols_changed
 
+        # Pre-flight 3: runtime behavior can't have changed
+        if symbols_changed == {NOOP_SYMBOL} and detect_noop:
+            skipped_noop.append(rel)
+            continue
+
         if has_function_graph and symbols_changed not in (set(), {"__unknown__"}):
             function_selected = _function_level_select(
-                rel, symbols_changed, function_graph, test_inventory
+                rel, symbols_changed, function_graph, test_inventory, log, call_graph
             )
             if function_selected:
                 _merge_into_selected(selected_tests, function_selected)
-                print(f"    Function-level hit: {rel} → skipping transitive expansion")
+                log(f"    Function-level hit: {rel} → skipping transitive expansion")
                 continue
 
-            # function lookup empty (e.g. decorator-registered aten ops)
+            # function lookup empty (e.g. a registry handler no test
+            # mentions — see op_registry in graph_builder)
             # fall back to file-level — much better than BFS explosion
-            print(f"    [INFO] No function-level match for {rel} → file-level fallback")
+            log(f"    [INFO] No function-level match for {rel} → file-level fallback")
             file_level_tests = set(reverse_graph.get(rel, []))
             if file_level_tests:
                 _add_file_level_tests(
@@ -231,9 +336,10 @@ def select_tests_from_graph(
                 continue
 
         elif symbols_changed in (set(), {"__unknown__"}):
-            print(f"[WARN] No usable diff symbols for {rel} → skipping function-level")
+            log(f"[WARN] No usable diff symbols for {rel} → skipping function-level")
 
         # Only fallback case reaches here
+        body_only = _is_body_only(rel_symbols_changed, change_kinds.get(rel))
         if has_transitive:
             expanded = _expand_transitively(
                 changed_file=rel,
@@ -242,13 +348,16 @@ def select_tests_from_graph(
                 file_identifiers=file_identifiers,
                 changed_symbols=rel_symbols_changed,
                 threshold=threshold,
+                body_only=body_only,
+                imported_names=imported_names,
             )
         else:
             expanded = {rel}
 
         transitive_added = expanded - {rel}
         if transitive_added:
-            print(f"    Transitive: {rel} → also checking {len(transitive_added)} dependent source files")
+            scope = " (body-only: callers and re-exports)" if body_only else ""
+            log(f"    Transitive: {rel} → also checking {len(transitive_added)} dependent source files{scope}")
 
         direct_importers_of_rel = set(source_reverse_graph.get(rel, []))
 
@@ -267,17 +376,18 @@ def select_tests_from_graph(
                 if has_function_graph:
                     if symbols_changed not in (set(), {"__unknown__"}):
                         function_selected = _function_level_select(
-                            expanded_file, symbols_changed, function_graph, test_inventory
+                            expanded_file, symbols_changed, function_graph, test_inventory, log,
+                            call_graph,
                         )
                         if function_selected:
                             _merge_into_selected(selected_tests, function_selected)
                             continue
 
                     elif symbols_changed == {"__unknown__"}:
-                        print(f"[WARN] Low confidence diff for {rel} → shallow fallback")
+                        log(f"[WARN] Low confidence diff for {rel} → shallow fallback")
 
                     else:
-                        print(f"[WARN] No usable diff info for {rel} → skipping")
+                        log(f"[WARN] No usable diff info for {rel} → skipping")
                         continue
 
                 if not file_level_tests:
@@ -321,16 +431,22 @@ def select_tests_from_graph(
                 )
 
     if skipped_non_code:
-        print()
+        log()
         for f in skipped_non_code:
-            print(f"    Skipping non-code file: {f}")
+            log(f"    Skipping non-code file: {f}")
+
+    if skipped_noop:
+        log()
+        log("    No-op changes skipped (annotations / docstrings / comments / formatting only):")
+        for f in skipped_noop:
+            log(f"     {f}")
 
     if skipped_high_fanout:
-        print()
-        print("    High-fanout files skipped (infrastructure files):")
+        log()
+        log("    High-fanout files skipped (infrastructure files):")
         for f, count in skipped_high_fanout:
-            print(f"     {f}  ({count} test files depend on it)")
-        print()
+            log(f"     {f}  ({count} test files depend on it)")
+        log()
 
     total_methods = sum(
         cls_data["test_count"]
@@ -347,7 +463,7 @@ def select_tests_from_graph(
             f"{count} via {mode}"
             for mode, count in sorted(mode_counts.items())
         )
-        print(f"  Selection mode: {mode_str}")
+        log(f"  Selection mode: {mode_str}")
 
     return selected_tests, total_methods
 
@@ -360,6 +476,21 @@ def select_tests_from_graph(
 _DEVICE_SUFFIXES = ('_cpu', '_cuda', '_mps', '_xpu', '_npu', '_hpu')
 
 
+def _strip_device_suffix(method: str) -> str:
+    """test_foo_cuda → test_foo (base method name before device parametrize)."""
+    for suffix in _DEVICE_SUFFIXES:
+        if method.endswith(suffix):
+            return method[:-len(suffix)]
+    return method
+
+
+def _is_body_only(symbols: set, kinds: dict) -> bool:
+    """True if every changed symbol of a file kept its interface."""
+    if not symbols or not kinds:
+        return False
+    return all(kinds.get(s) == "body" for s in symbols)
+
+
 def _resolve_mixin_class(
     test_file: str,
     cls_name: str,
@@ -392,14 +523,7 @@ def _resolve_mixin_class(
             parts = nid.split("::")
             if len(parts) < 3:
                 continue
-            inv_method = parts[2]
-            # strip device suffix to get base method name
-            stripped = inv_method
-            for suffix in _DEVICE_SUFFIXES:
-                if inv_method.endswith(suffix):
-                    stripped = inv_method[:-len(suffix)]
-                    break
-            if stripped == method:
+            if _strip_device_suffix(parts[2]) == method:
                 matched_ids.append(nid)
 
         if matched_ids:
@@ -411,11 +535,45 @@ def _resolve_mixin_class(
     return resolved
 
 
+_reverse_call_cache: dict = {}
+
+
+def _reverse_call_graph(call_graph: dict) -> dict:
+    """callee → callers, built once per loaded graph (daemon, api sessions)."""
+    cached = _reverse_call_cache.get(id(call_graph))
+    if cached and cached[0] is call_graph:
+        return cached[1]
+    reverse = defaultdict(set)
+    for caller, callees in call_graph.items():
+        for callee in callees:
+            reverse[callee].add(caller)
+    _reverse_call_cache.clear()
+    _reverse_call_cache[id(call_graph)] = (call_graph, reverse)
+    return reverse
+
+
+def _callers_of(key: str, call_graph: dict, depth: int = CALLER_DEPTH) -> set:
+    """Functions that reach `key` ("src::sym") within `depth` calls."""
+    if not call_graph:
+        return set()
+    reverse  = _reverse_call_graph(call_graph)
+    visited  = set()
+    frontier = {key}
+    for _ in range(depth):
+        frontier = {c for f in frontier for c in reverse.get(f, ())} - visited - {key}
+        if not frontier:
+            break
+        visited |= frontier
+    return visited
+
+
 def _function_level_select(
     src_file: str,
     symbols_changed: set,
     function_graph: dict,
     test_inventory: dict,
+    log=print,
+    call_graph: dict = None,
 ) -> dict:
     """
     Look up changed symbols in function_reverse_graph.
@@ -429,7 +587,11 @@ def _function_level_select(
     Handles both — detects by checking if value contains "::" (method ID)
     or not (file path).
 
-    1a method key fix: SGD.step → try SGD if SGD.step not found.
+    Callers: tests of functions that call the symbol (call_graph) count
+    as hits for it.
+
+    1a method key fix: SGD.step → try SGD if SGD.step not found
+    (directly or through callers).
 
     Mixin resolution: CommonTemplate::test_X → CpuTests::test_X_cpu etc.
     """
@@ -451,14 +613,18 @@ def _function_level_select(
 
     for sym in symbols_changed:
         key        = f"{src_file}::{sym}"
-        graph_vals = function_graph.get(key, [])
+        graph_vals = list(function_graph.get(key, []))
+        for caller in sorted(_callers_of(key, call_graph)):
+            graph_vals.extend(function_graph.get(caller, []))
 
         # 1a: method key fix — SGD.step → try SGD
         effective_sym = sym
         if not graph_vals and "." in sym:
             class_name = sym.split(".")[0]
             class_key  = f"{src_file}::{class_name}"
-            graph_vals = function_graph.get(class_key, [])
+            graph_vals = list(function_graph.get(class_key, []))
+            for caller in sorted(_callers_of(class_key, call_graph)):
+                graph_vals.extend(function_graph.get(caller, []))
             if graph_vals:
                 effective_sym = class_name
 
@@ -500,8 +666,22 @@ def _function_level_select(
                             existing["test_count"] = len(existing["node_ids"])
                             
                 elif cls_name in classes:
-                    # class exists directly in inventory
-                    selected[test_file]["classes"][cls_name] = classes[cls_name]
+                    # class exists directly in inventory — take the node ids
+                    # of the matched method (and its device variants); the
+                    # whole class if the method wasn't collected. Always a
+                    # fresh list: the graph is shared across calls (daemon,
+                    # tselect.api sessions)
+                    inv_ids = classes[cls_name].get("node_ids", [])
+                    matched = [
+                        nid for nid in inv_ids
+                        if nid.count("::") >= 2 and _strip_device_suffix(nid.split("::")[2]) == method
+                    ] or inv_ids
+                    cls_sel = selected[test_file]["classes"].setdefault(
+                        cls_name, {"node_ids": [], "test_count": 0}
+                    )
+                    have = set(cls_sel["node_ids"])
+                    cls_sel["node_ids"].extend(nid for nid in matched if nid not in have)
+                    cls_sel["test_count"] = len(cls_sel["node_ids"])
                 else:
                     # not in inventory — use raw node_id as fallback
                     selected[test_file]["classes"][cls_name] = {
@@ -519,10 +699,10 @@ def _function_level_select(
                 found_any = True
                 selected[test_file]["triggered_by"]    = [src_file]
                 selected[test_file]["matched_symbols"].append(effective_sym)
-                selected[test_file]["classes"].update(classes)
+                selected[test_file]["classes"].update(_copy_classes(classes))
 
     if not found_any:
-        print(f"[WARN] No graph match for symbols in {src_file} → falling back to module-level")
+        log(f"[WARN] No graph match for symbols in {src_file} → falling back to module-level")
 
         module_symbols = {
             key.split("::", 1)[1]
@@ -536,6 +716,8 @@ def _function_level_select(
                 module_symbols,
                 function_graph,
                 test_inventory,
+                log,
+                call_graph,
             )
 
         return {}
@@ -605,9 +787,9 @@ def _reexport_level_select(
 
                 if resolved:
                     for real_cls, cls_data in resolved.items():
-                        selected[test_file]["classes"][real_cls] = cls_data
+                        selected[test_file]["classes"][real_cls] = _copy_class(cls_data)
                 elif cls_name in (classes or {}):
-                    selected[test_file]["classes"][cls_name] = classes[cls_name]
+                    selected[test_file]["classes"][cls_name] = _copy_class(classes[cls_name])
                 else:
                     selected[test_file]["classes"][cls_name] = {
                         "node_ids":   [node_id],
@@ -623,7 +805,7 @@ def _reexport_level_select(
                 found_any = True
                 selected[test_file]["triggered_by"]    = [original_trigger]
                 selected[test_file]["matched_symbols"].append(sym)
-                selected[test_file]["classes"].update(classes)
+                selected[test_file]["classes"].update(_copy_classes(classes))
 
     if not found_any:
         return {}
@@ -650,13 +832,27 @@ def _add_file_level_tests(
                 "triggered_by":    [trigger],
                 "matched_symbols": [],
                 "selection_mode":  mode,
-                "classes":         dict(classes),
+                "classes":         _copy_classes(classes),
             }
         else:
             if trigger not in selected_tests[test_file]["triggered_by"]:
                 selected_tests[test_file]["triggered_by"].append(trigger)
 
 
+def _copy_class(cls_data: dict) -> dict:
+    """A class entry the caller may extend — inventory lists stay untouched."""
+    return {**cls_data, "node_ids": list(cls_data.get("node_ids", []))}
+
+
+def _copy_classes(classes: dict) -> dict:
+    """
+    Copy of an inventory {class: {"node_ids": [...], ...}} mapping down to
+    the node id lists — the graph is shared across calls (daemon,
+    tselect.api sessions) and selections extend these lists in place.
+    """
+    return {name: _copy_class(data) for name, data in classes.items()}
+
+
 def _merge_into_selected(selected_tests: dict, new_selections: dict) -> None:
     for test_file, data in new_selections.items():
         if test_file not in selected_tests:
@@ -668,14 +864,26 @@ def _merge_into_selected(selected_tests: dict, new_selections: dict) -> None:
             selected_tests[test_file]["matched_symbols"] = sorted(set(
                 selected_tests[test_file]["matched_symbols"] + data["matched_symbols"]
             ))
-            # ← NEW: don't downgrade existing class data
-            # keep whichever has more tests (self-select > function-level)
+            # class entries may hold only the matched methods — union the
+            # node ids so two triggers selecting different methods keep both
             for cls_name, cls_data in data["classes"].items():
                 existing = selected_tests[test_file]["classes"].get(cls_name)
                 if existing is None:
                     selected_tests[test_file]["classes"][cls_name] = cls_data
-                elif cls_data["test_count"] > existing["test_count"]:
-                    selected_tests[test_file]["classes"][cls_name] = cls_data
+                    continue
+                node_ids = list(dict.fromkeys(
+                    existing.get("node_ids", []) + cls_data.get("node_ids", [])
+                ))
+                if not node_ids:
+                    # no node ids to union — keep whichever counts more tests
+                    if cls_data.get("test_count", 0) > existing.get("test_count", 0):
+                        selected_tests[test_file]["classes"][cls_name] = cls_data
+                    continue
+                selected_tests[test_file]["classes"][cls_name] = {
+                    **existing,
+                    "node_ids":   node_ids,
+                    "test_count": len(node_ids),
+                }
 
 def _proximity_fallback(rel: str, test_inventory: dict, dir_mapping: list) -> set:
     if dir_mapping:
@@ -709,6 +917,26 @@ def get_pytest_node_ids(selected: dict) -> list:
     return sorted(set(node_ids))
 
 
+def split_by_tier(selected: dict) -> tuple:
+    """
+    Split a selection into (precise, broad) by selection_mode.
+
+    precise: self, function, re-export  → stage 1, cheap and high signal
+    broad:   file, proximity            → stage 2, the safety net
+
+    A test file keeps the mode it was first selected with, so the two
+    halves never share a test file. Unknown modes go to broad.
+    """
+    precise = {}
+    broad   = {}
+    for test_file, data in selected.items():
+        if data.get("selection_mode") in PRECISE_MODES:
+            precise[test_file] = data
+        else:
+            broad[test_file] = data
+    return precise, broad
+
+
 def get_summary_info(selected: dict) -> tuple:
     selected_classes = []
     class_test_count = {}
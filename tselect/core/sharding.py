@@ -0,0 +1,97 @@
+"""
+sharding.py
+-----------
+Deterministic cross-node sharding of a selection.
+
+Every CI node computes the same selection from the same graph and
+changeset, then the same plan — so each node can run its own slice
+without any coordination:
+
+    tselect run --execute --shard 2/4     → node 2 of 4
+    tselect plan --shards 4               → JSON plan for external schedulers
+
+Balancing: longest-processing-time-first (LPT) bin packing.
+  - cost of a node ID = duration history (.tselect_durations.json)
+  - unknown node IDs cost the median known duration (1s if no history)
+  - ties broken by node ID and shard index → identical on every node
+    as long as they share the same duration history
+"""
+
+import heapq
+import statistics
+
+DEFAULT_TEST_SECONDS = 1.0
+
+
+def parse_shard(spec: str) -> tuple[int, int]:
+    """
+    Parse "i/N" (1-based) → (i, N).
+
+    Raises ValueError for anything else, e.g. "0/4", "5/4", "two/4".
+    """
+    try:
+        index, total = (int(part) for part in spec.split("/"))
+    except Exception:
+        raise ValueError(f"invalid shard '{spec}' — expected i/N, e.g. 2/4")
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(f"invalid shard '{spec}' — need 1 <= i <= N")
+    return index, total
+
+
+def estimate_costs(node_ids: list, durations: dict) -> dict:
+    """Seconds per node ID — history when known, else median/default."""
+    known   = [durations[n] for n in node_ids if n in durations]
+    default = statistics.median(known) if known else DEFAULT_TEST_SECONDS
+    return {n: durations.get(n, default) for n in node_ids}
+
+
+def plan_shards(node_ids: list, num_shards: int, durations: dict = None) -> list:
+    """
+    Split node IDs into num_shards balanced shards (LPT).
+
+    Returns:
+        [
+            {"index": 1, "node_ids": [...], "estimated_seconds": 412.3},
+            {"index": 2, "node_ids": [...], "estimated_seconds": 409.8},
+        ]
+    """
+    num_shards = max(1, int(num_shards))
+    costs      = estimate_costs(sorted(set(node_ids)), durations or {})
+
+    # heap of (load, shard_index) → least-loaded shard, lowest index on ties
+    heap   = [(0.0, i) for i in range(num_shards)]
+    shards = [[] for _ in range(num_shards)]
+    loads  = [0.0] * num_shards
+
+    for nid in sorted(costs, key=lambda n: (-costs[n], n)):
+        load, idx = heapq.heappop(heap)
+        shards[idx].append(nid)
+        loads[idx] = load + costs[nid]
+        heapq.heappush(heap, (loads[idx], idx))
+
+    return [
+        {
+            "index":             i + 1,
+            "node_ids":          sorted(shards[i]),
+            "estimated_seconds": round(loads[i], 2),
+        }
+        for i in range(num_shards)
+    ]
+
+
+def restrict_selection(selected: dict, node_ids: list) -> dict:
+    """
+    Keep only the given node IDs in a select_tests_from_graph() result.
+    Classes and test files left empty are dropped.
+    """
+    keep     = set(node_ids)
+    narrowed = {}
+    for test_file, data in selected.items():
+        classes = {}
+        for cls_name, cls_data in data["classes"].items():
+            ids = [nid for nid in cls_data.get("node_ids", []) if nid in keep]
+            if ids:
+                classes[cls_name] = {**cls_data, "node_ids": ids, "test_count": len(ids)}
+        if classes:
+            narrowed[test_file] = {**data, "classes": classes}
+    return narrowed
@@ -0,0 +1,372 @@
+"""
+watch.py
+--------
+`tselect watch` — re-select and re-run on every save.
+
+    tselect watch             → watch source_dirs + test_dirs, run affected tests
+    tselect watch --no-run    → only print what would run
+
+Loop:
+  1. Wait for file events — inotify (inotify_simple, if installed) or
+     mtime polling — then debounce: keep collecting until the tree has
+     been quiet for DEBOUNCE_SECONDS, so an editor's save burst or a
+     `git checkout` is one cycle
+  2. Diff each saved file against the in-memory snapshot of its previous
+     contents (first save of a file: against git HEAD) → changed lines on
+     both sides → changed symbols and change kinds through the same path
+     as `tselect run` (diff_parser.changed_symbols_between): deleted code
+     is named from the snapshot, module-level edits resolve to the names
+     they touch, annotation / docstring / formatting-only edits select
+     nothing
+  3. select_tests_from_graph() on the graph loaded once at start
+     (reloaded when dependency_graph.json changes)
+  4. Run exactly those node ids in a forked warm pytest worker
+     (runner.preload imported once in the watcher process)
+
+A saved file already loaded in the watcher (a module in sys.modules,
+e.g. part of runner.preload) would be stale in forked workers — runs fall back to
+a fresh subprocess from then on, and the watcher says so.
+"""
+
+import difflib
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from tselect.core.diff_parser import SUPPORTED_EXTENSIONS, changed_symbols_between
+from tselect.core.fn_diff import NOOP_SYMBOL
+from tselect.core.graph_loader import GraphLoader
+from tselect.core.graph_selector import (
+    select_tests_from_graph,
+    get_pytest_node_ids,
+    _is_test_file,
+)
+from tselect.utils.logger import setup_logger
+
+logger = setup_logger()
+
+_INOTIFY_AVAILABLE = False
+try:
+    from inotify_simple import INotify, flags as _iflags
+    _INOTIFY_AVAILABLE = True
+except ImportError:
+    pass
+
+# quiet period that ends one burst of edits
+DEBOUNCE_SECONDS = 0.3
+
+# mtime scan interval when inotify is unavailable
+POLL_INTERVAL = 0.5
+
+# per-cycle pytest timeout — a hung test must not wedge the watcher
+RUN_TIMEOUT = 600
+
+# failure traceback lines printed per failed test
+TRACEBACK_LINES = 6
+
+
+# ─────────────────────────────────────────────
+# File watching
+# ─────────────────────────────────────────────
+
+class _PollingBackend:
+    def __init__(self, roots: list, accept):
+        self.roots  = roots
+        self.accept = accept
+        self.mtimes = self._scan()
+
+    def _scan(self) -> dict:
+        mtimes = {}
+        for root in self.roots:
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [d for d in dirnames if self.accept(Path(dirpath) / d, is_dir=True)]
+                for name in filenames:
+                    path = Path(dirpath) / name
+                    if not self.accept(path):
+                        continue
+                    try:
+                        mtimes[path] = os.stat(path).st_mtime_ns
+                    except OSError:
+                        pass
+        return mtimes
+
+    def changes(self, timeout: float) -> set:
+        time.sleep(timeout)
+        current     = self._scan()
+        changed     = {p for p, m in current.items() if self.mtimes.get(p) != m}
+        changed    |= set(self.mtimes) - set(current)
+        self.mtimes = current
+        return changed
+
+
+class _InotifyBackend:
+    def __init__(self, roots: list, accept):
+        self.accept   = accept
+        self.inotify  = INotify()
+        self.mask     = (_iflags.CLOSE_WRITE | _iflags.MOVED_TO | _iflags.CREATE
+                         | _iflags.DELETE | _iflags.MOVED_FROM)
+        self.dirs     = {}
+        for root in roots:
+            self._add_tree(Path(root))
+
+    def _add_tree(self, root: Path) -> None:
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = [d for d in dirnames if self.accept(Path(dirpath) / d, is_dir=True)]
+            try:
+                wd = self.inotify.add_watch(dirpath, self.mask)
+                self.dirs[wd] = Path(dirpath)
+            except OSError:
+                pass
+
+    def changes(self, timeout: float) -> set:
+        changed = set()
+        for event in self.inotify.read(timeout=int(timeout * 1000)):
+            parent = self.dirs.get(event.wd)
+            if parent is None or not event.name:
+                continue
+            path = parent / event.name
+            if event.mask & _iflags.ISDIR:
+                if event.mask & (_iflags.CREATE | _iflags.MOVED_TO) and self.accept(path, is_dir=True):
+                    self._add_tree(path)
+                continue
+            if self.accept(path):
+                changed.add(path)
+        return changed
+
+
+class FileWatcher:
+    def __init__(self, roots: list, ignore_dirs: list = None):
+        ignore = set(ignore_dirs or [])
+
+        def accept(path: Path, is_dir: bool = False) -> bool:
+            if path.name in ignore or path.name.startswith("."):
+                return False
+            return is_dir or path.suffix.lower() in SUPPORTED_EXTENSIONS
+
+        roots        = [str(r) for r in roots if Path(r).is_dir()]
+        self.backend = (
+            _InotifyBackend(roots, accept) if _INOTIFY_AVAILABLE
+            else _PollingBackend(roots, accept)
+        )
+        self.kind    = "inotify" if _INOTIFY_AVAILABLE else "polling"
+
+    def wait(self) -> set:
+        """Block until files change, then debounce. Returns changed paths."""
+        changed = set()
+        while not changed:
+            changed = self.backend.changes(POLL_INTERVAL)
+
+        while True:
+            more = self.backend.changes(DEBOUNCE_SECONDS)
+            if not more:
+                return changed
+            changed |= more
+
+
+# ─────────────────────────────────────────────
+# Watch session
+# ─────────────────────────────────────────────
+
+class WatchSession:
+    def __init__(self, repo_root: Path, config: dict, run_tests: bool = True):
+        from tselect.adapters.worker_pool import WarmWorkerPool
+
+        self.repo_root   = Path(repo_root).resolve()
+        self.config      = config
+        self.run_tests   = run_tests
+        self.loader      = GraphLoader(self.repo_root)
+        self.graph       = self.loader.load()
+        self.graph_mtime = self.loader.graph_path.stat().st_mtime_ns
+        self.snapshot    = {}   # rel → text at last cycle
+        self.pool        = None
+        self.pool_stale  = False
+        self.cycles      = 0
+        self.detect_noop = config.get("graph", {}).get("detect_noop", True)
+
+        if run_tests and hasattr(os, "fork"):
+            self.pool = WarmWorkerPool(config.get("runner", {}).get("preload") or [], self.repo_root)
+            self.pool.start()
+
+    def roots(self) -> list:
+        repo    = self.config.get("repo", {})
+        dirs    = (repo.get("source_dirs") or []) + (repo.get("test_dirs") or [])
+        return [self.repo_root / d for d in dirs] or [self.repo_root]
+
+    # ── changed symbols ─────────────────────────────────────────────────────
+
+    def _previous_text(self, rel: str):
+        """Snapshot text, else git HEAD's, else None (new file)."""
+        if rel in self.snapshot:
+            return self.snapshot[rel]
+        result = subprocess.run(
+            ["git", "show", f"HEAD:{rel}"],
+            capture_output=True, text=True, cwd=str(self.repo_root),
+        )
+        return result.stdout if result.returncode == 0 else None
+
+    def changed_functions(self, paths: set, change_kinds: dict = None) -> dict:
+        """
+        {rel: changed symbols} for the saved files that really changed.
+        change_kinds is filled in place, as by get_changed_functions.
+        """
+        changed = {}
+        for path in sorted(paths):
+            rel  = str(Path(path).resolve().relative_to(self.repo_root))
+            full = self.repo_root / rel
+            old  = self._previous_text(rel)
+
+            if full.exists():
+                new = full.read_text(encoding="utf-8", errors="ignore")
+                self.snapshot[rel] = new
+            else:
+                new = ""
+                self.snapshot.pop(rel, None)
+                if old is None:
+                    continue
+
+            if new == old:
+                continue
+
+            head_lines, base_lines = _changed_ranges(old or "", new)
+            changed[rel] = changed_symbols_between(
+                rel, full, old, head_lines, base_lines,
+                detect_noop=self.detect_noop, change_kinds=change_kinds,
+            )
+        return changed
+
+    # ── one cycle ───────────────────────────────────────────────────────────
+
+    def _refresh_graph(self) -> None:
+        try:
+            mtime = self.loader.graph_path.stat().st_mtime_ns
+        except OSError:
+            return
+        if mtime != self.graph_mtime:
+            try:
+                self.graph, self.graph_mtime = self.loader.load(), mtime
+                print("  ↻ Dependency graph changed — reloaded")
+            except Exception as e:
+                logger.warning(f"Graph reload failed, keeping previous graph: {e}")
+
+    def cycle(self, paths: set) -> None:
+        t0      = time.time()
+        kinds   = {}
+        changed = self.changed_functions(paths, kinds)
+        if not changed:
+            return
+
+        self.cycles += 1
+        self._refresh_graph()
+
+        print()
+        print(f"  ⟳ {time.strftime('%H:%M:%S')}  cycle {self.cycles}")
+        for rel, symbols in changed.items():
+            shown = ", ".join(sorted(s for s in symbols if not s.startswith("__"))) or (
+                "no-op" if symbols == {NOOP_SYMBOL} else "module"
+            )
+            print(f"     • {rel}  ({shown})")
+
+        selected, _ = select_tests_from_graph(
+            list(changed), self.graph, self.repo_root, self.config,
+            changed_functions = changed,
+            verbose           = False,
+            change_kinds      = kinds,
+        )
+        node_ids = get_pytest_node_ids(selected)
+
+        # a saved test file not (yet) in the inventory still runs as a whole
+        for rel in changed:
+            if _is_test_file(rel) and rel not in selected and (self.repo_root / rel).exists():
+                node_ids.append(rel)
+
+        if not node_ids:
+            print(f"     → no affected tests  ({(time.time() - t0) * 1000:.0f} ms)")
+            return
+
+        print(f"     → {len(node_ids)} tests in "
+              f"{len({n.split('::')[0] for n in node_ids})} files  "
+              f"(selected in {(time.time() - t0) * 1000:.0f} ms)")
+
+        if self.run_tests:
+            self._run(node_ids, changed)
+
+    def _run(self, node_ids: list, changed: dict) -> None:
+        from tselect.adapters.pytest_adapter import execute_node_ids
+
+        if self.pool is not None and not self.pool_stale:
+            loaded = _loaded_files()
+            stale  = [rel for rel in changed if (self.repo_root / rel).resolve() in loaded]
+            if stale:
+                self.pool_stale = True
+                print(f"     ⚠️  {stale[0]} is preloaded in the warm worker — "
+                      f"using fresh subprocesses until watch restarts")
+
+        pool = None if self.pool_stale else self.pool
+        t0   = time.time()
+        results = execute_node_ids(
+            node_ids,
+            pool       = pool,
+            timeout    = RUN_TIMEOUT,
+            extra_args = self.config.get("runner", {}).get("extra_args", []),
+        )
+        elapsed = time.time() - t0
+
+        failed = results.failed_node_ids()
+        if not failed and results.return_code in (0, 5):
+            print(f"     ✔ {results.passed} passed, {results.skipped} skipped in {elapsed:.1f}s")
+            return
+
+        print(f"     ✖ {results.failed} failed, {results.passed} passed in {elapsed:.1f}s")
+        tracebacks = results.tracebacks()
+        for nid in failed:
+            print(f"        FAILED {nid}")
+            for line in tracebacks.get(nid, "").strip().splitlines()[-TRACEBACK_LINES:]:
+                print(f"          {line}")
+
+    # ── loop ────────────────────────────────────────────────────────────────
+
+    def run_forever(self) -> None:
+        watcher = FileWatcher(
+            self.roots(),
+            ignore_dirs=self.config.get("graph", {}).get("ignore_dirs", []),
+        )
+        print(f"  Watching {', '.join(str(r.relative_to(self.repo_root)) or '.' for r in self.roots())}"
+              f"  ({watcher.kind}, Ctrl-C to stop)")
+        try:
+            while True:
+                self.cycle(watcher.wait())
+        except KeyboardInterrupt:
+            print(f"\n  Stopped after {self.cycles} cycles")
+
+
+def _changed_ranges(old: str, new: str) -> tuple:
+    """
+    (new_lines, old_lines) — 1-based line numbers each side of the edit
+    touches, like the `+` / `-` sides of a git hunk.
+    """
+    old_lines = old.splitlines()
+    new_lines = new.splitlines()
+    head, base = set(), set()
+    matcher   = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        head.update(range(j1 + 1, j2 + 1))
+        base.update(range(i1 + 1, i2 + 1))
+    return head, base
+
+
+def _loaded_files() -> set:
+    """Resolved source paths of every module loaded in this process."""
+    files = set()
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None)
+        if not path:
+            continue
+        try:
+            files.add(Path(path).resolve())
+        except (OSError, RuntimeError):
+            pass
+    return files
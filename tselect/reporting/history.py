@@ -0,0 +1,71 @@
+"""
+reporting/history.py
+--------------------
+Per-test duration history, recorded after every executed run except
+CI shards (their timings would make the nodes' shard plans diverge).
+
+Stored in .tselect_durations.json at the repo root:
+    {
+        "test/inductor/test_torchinductor.py::CpuTests::test_add_cpu": 1.84,
+        ...
+    }
+
+Keys are inventory-style node IDs (parametrization stripped), matching
+what graph_selector returns — parametrized variants are summed.
+Values are an exponential moving average so one slow run doesn't
+dominate. Used to balance CI shards and to estimate test cost.
+"""
+
+import json
+from pathlib import Path
+
+DURATIONS_FILE = ".tselect_durations.json"
+
+# weight of the newest run in the moving average
+EMA_ALPHA = 0.5
+
+
+def base_node_id(nodeid: str) -> str:
+    """Strip parametrization: test_x.py::C::test_y[a-b] → test_x.py::C::test_y"""
+    return nodeid.split("[", 1)[0]
+
+
+def load_durations(repo_root: Path, path: Path = None) -> dict:
+    """History at repo_root, or at path (a pinned file shared by CI shards)."""
+    path = Path(path) if path else Path(repo_root) / DURATIONS_FILE
+    if not path.exists():
+        return {}
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def record_durations(repo_root: Path, results) -> int:
+    """
+    Merge a RunResults' per-test durations into the history file.
+    Returns the number of node IDs updated.
+    """
+    run = {}
+    for nodeid, seconds in results.durations().items():
+        key      = base_node_id(nodeid)
+        run[key] = run.get(key, 0.0) + seconds
+
+    if not run:
+        return 0
+
+    history = load_durations(repo_root)
+    for key, seconds in run.items():
+        old          = history.get(key)
+        history[key] = round(
+            seconds if old is None else EMA_ALPHA * seconds + (1 - EMA_ALPHA) * old,
+            4,
+        )
+
+    path = Path(repo_root) / DURATIONS_FILE
+    tmp  = path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(history, f, indent=2, sort_keys=True)
+    tmp.replace(path)
+    return len(run)
@@ -0,0 +1,221 @@
+"""
+reporting/result_cache.py
+-------------------------
+Bazel-style test result reuse.
+
+A rebase or re-push with unrelated changes re-selects tests whose inputs
+have not changed at all. Each selected test file gets a fingerprint over:
+
+  - content hash of the test file and every conftest.py above it
+  - content hashes of every source file it reaches — forward through
+    full_reverse_graph (test → sources) and source_reverse_graph
+    (source → the sources it imports / #includes)
+  - the selected node IDs for that file (a different selection is a
+    different run)
+  - Python version + runner.extra_args + installed distributions
+    (name==version, so a torch upgrade invalidates everything)
+
+Not covered: environment variables, data files, dynamic imports — which
+is why runner.result_cache is opt-in.
+
+If a passing result with the same fingerprint is cached, the file is not
+run and its tests are reported as "cached-pass". Only files whose tests
+ALL passed are stored — failures are always re-run.
+
+Cache: one small JSON file per fingerprint under .tselect/results/,
+bounded by runner.result_cache_size with LRU eviction (a hit touches
+the entry's mtime; the oldest mtimes are evicted first).
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+RESULT_CACHE_DIR = Path(".tselect") / "results"
+
+DEFAULT_MAX_ENTRIES = 5000
+
+CACHED_OUTCOME = "cached-pass"
+
+
+def _installed_distributions() -> str:
+    """Hash of every installed distribution's name==version."""
+    from importlib import metadata
+
+    pins = sorted({
+        f"{dist.metadata['Name']}=={dist.version}"
+        for dist in metadata.distributions()
+        if dist.metadata["Name"]
+    })
+    return hashlib.sha256("\n".join(pins).encode()).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, repo_root: Path, graph: dict, config: dict):
+        runner           = config.get("runner", {})
+        self.repo_root   = Path(repo_root)
+        self.dir         = self.repo_root / RESULT_CACHE_DIR
+        self.max_entries = int(runner.get("result_cache_size") or DEFAULT_MAX_ENTRIES)
+        self.environment = json.dumps([
+            sys.version,
+            list(runner.get("extra_args") or []),
+            _installed_distributions(),
+        ])
+
+        # test file → sources it imports directly
+        self._test_deps = defaultdict(set)
+        for src, tests in graph.get("full_reverse_graph", {}).items():
+            for test_file in tests:
+                self._test_deps[test_file].add(src)
+
+        # source → sources it imports
+        self._source_deps = defaultdict(set)
+        for src, importers in graph.get("source_reverse_graph", {}).items():
+            for importer in importers:
+                self._source_deps[importer].add(src)
+
+        self._hashes = {}
+
+    # ─────────────────────────────────────────────
+    # Fingerprints
+    # ─────────────────────────────────────────────
+
+    def _file_hash(self, rel: str) -> str:
+        if rel not in self._hashes:
+            try:
+                data = (self.repo_root / rel).read_bytes()
+                self._hashes[rel] = hashlib.sha1(data).hexdigest()
+            except OSError:
+                self._hashes[rel] = "missing"
+        return self._hashes[rel]
+
+    def _closure(self, test_file: str) -> set:
+        """Every file whose content can change this test file's outcome."""
+        seen     = {test_file}
+        frontier = list(self._test_deps.get(test_file, ()))
+        while frontier:
+            src = frontier.pop()
+            if src in seen:
+                continue
+            seen.add(src)
+            frontier.extend(self._source_deps.get(src, ()))
+
+        # conftest.py files from the test's directory up to the repo root
+        parent = Path(test_file).parent
+        while True:
+            conftest = parent / "conftest.py"
+            if (self.repo_root / conftest).exists():
+                seen.add(str(conftest))
+            if parent == parent.parent:
+                break
+            parent = parent.parent
+        return seen
+
+    def fingerprint(self, test_file: str, node_ids: list) -> str:
+        h = hashlib.sha1(self.environment.encode())
+        for rel in sorted(self._closure(test_file)):
+            h.update(f"{rel}:{self._file_hash(rel)}\n".encode())
+        for nid in sorted(node_ids):
+            h.update(f"{nid}\n".encode())
+        return h.hexdigest()
+
+    def _file_node_ids(self, data: dict) -> list:
+        return [
+            nid
+            for cls_data in data["classes"].values()
+            for nid in cls_data.get("node_ids", [])
+        ]
+
+    # ─────────────────────────────────────────────
+    # Lookup / store
+    # ─────────────────────────────────────────────
+
+    def partition(self, selected: dict) -> tuple:
+        """
+        Split a selection into (to_run, cached).
+
+        cached = {test_file: [node ids that passed last time]}
+        """
+        to_run, cached = {}, {}
+        for test_file, data in selected.items():
+            entry = self._load(self.fingerprint(test_file, self._file_node_ids(data)))
+            if entry is not None:
+                cached[test_file] = entry["passed"]
+            else:
+                to_run[test_file] = data
+        return to_run, cached
+
+    def add_cached(self, results, cached: dict) -> None:
+        """Report reused files as cached-pass records in a RunResults."""
+        for node_ids in cached.values():
+            for nid in node_ids:
+                results.add({"nodeid": nid, "outcome": CACHED_OUTCOME, "duration": 0.0})
+
+    def store(self, selected: dict, results) -> int:
+        """
+        Cache every executed test file whose tests all passed.
+        Returns the number of files stored.
+        """
+        by_file = defaultdict(list)
+        for rec in results.records.values():
+            by_file[rec.nodeid.split("::", 1)[0]].append(rec)
+
+        broken = {nid.split("::", 1)[0] for nid in results.crashed}
+        broken.update(nid.split("::", 1)[0] for nid in results.collection_errors)
+
+        stored = 0
+        for test_file, data in selected.items():
+            records = by_file.get(test_file)
+            if not records or test_file in broken:
+                continue
+            if any(r.outcome in ("failed", "error") for r in records):
+                continue
+            if any(r.outcome == CACHED_OUTCOME for r in records):
+                continue
+            self._save(
+                self.fingerprint(test_file, self._file_node_ids(data)),
+                {
+                    "test_file": test_file,
+                    "passed":    sorted(r.nodeid for r in records),
+                    "stored_at": time.time(),
+                },
+            )
+            stored += 1
+
+        if stored:
+            self._evict()
+        return stored
+
+    def _load(self, fp: str) -> dict | None:
+        path = self.dir / f"{fp}.json"
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+            os.utime(path)   # LRU: a hit makes the entry young again
+            return entry
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _save(self, fp: str, entry: dict) -> None:
+        self.dir.mkdir(parents=True, exist_ok=True)
+        path = self.dir / f"{fp}.json"
+        tmp  = path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(entry, f)
+        tmp.replace(path)
+
+    def _evict(self) -> None:
+        entries = list(self.dir.glob("*.json"))
+        excess  = len(entries) - self.max_entries
+        if excess <= 0:
+            return
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for path in entries[:excess]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
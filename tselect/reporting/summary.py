@@ -95,6 +95,25 @@ def _print_audit(ai_decisions: list, W: int = 70) -> None:
     print()
 
 
+def _print_stages(stages: list, W: int = 70) -> None:
+    """Print one line per tiered stage — timings and results kept separate."""
+    print("  " + "─" * (W - 4))
+    print("  Stages")
+    print("  " + "─" * (W - 4))
+    for st in stages:
+        tiers = ", ".join(st["tiers"])
+        head  = f"  {st['name']:<8} {tiers:<26} {st['test_files']:>3} files"
+        if st["status"] == "skipped":
+            print(f"{head}   skipped — {st['reason']}")
+            continue
+        icon = "✔" if st["failed"] == 0 and st["return_code"] in (0, 5) else "✖"
+        mode = "  (background)" if st["status"] == "background" else ""
+        print(f"{head}  {st['duration']:>7.2f}s  {icon} "
+              f"{st['passed']} passed, {st['failed']} failed, "
+              f"{st['skipped']} skipped{mode}")
+    print()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # SUMMARY 1 — AI SELECTION REPORT
 # ─────────────────────────────────────────────────────────────────────────────
@@ -154,10 +173,14 @@ def generate_summary(
     ai_confidence = None,
     ai_analysis   = None,
     coverage_data = None,
+    stages        = None,
+    cached        = 0,
 ) -> None:
     """
     Printed after pytest finishes.
     All existing sections unchanged.
+    Stages section only printed for tiered runs (--tiered).
+    cached: tests reused from the result cache (cached-pass), not executed.
     Coverage section added at the bottom — only printed when --coverage used.
     """
 
@@ -208,8 +231,14 @@ def generate_summary(
               f"({ai_removed} removed, {ai_percent:.0f}% filtered out)")
     print(f"  Executed : {executed}")
     print(f"  Passed   : {passed}   Failed : {failed}   Skipped : {skipped}")
+    if cached:
+        print(f"  Cached   : {cached}   (cached-pass — inputs unchanged, not re-run)")
     print()
 
+    # ── tiered stages ───────────────────────────────────────────────────────
+    if stages:
+        _print_stages(stages, W)
+
     # ── selection audit ─────────────────────────────────────────────────────
     if ai_decisions:
         _print_audit(ai_decisions, W)
@@ -225,6 +254,14 @@ def generate_summary(
         print(f"  Explanation: {ai_analysis.get('explanation', '—')}")
         print(f"  Fix        : {ai_analysis.get('suggested_fix', '—')}")
         print()
+        clusters = ai_analysis.get("clusters", [])
+        if len(clusters) > 1:
+            print(f"  Failure clusters ({len(clusters)})")
+            for c in clusters:
+                print(f"    {c['size']:>4} × {_short_reason(c['description'], 55)}")
+                if c["analysis"]:
+                    print(f"           → {_short_reason(c['analysis'].get('failure_pattern', '—'), 55)}")
+            print()
 
     # ── insights ────────────────────────────────────────────────────────────
     print("  " + "─" * (W - 4))
@@ -26,6 +26,7 @@ DEFAULTS = {
     "graph": {
         "rebuild_after_days":  7,
         "collect_batch_size":  50,
+        "detect_noop":         True,   # skip annotation/docstring/formatting-only changes
         "ignore_dirs": [
             ".git", "__pycache__", ".venv", "node_modules",
             "build", "dist", ".tox", ".eggs", "*.egg-info",
@@ -33,6 +34,14 @@ DEFAULTS = {
     },
     "runner": {
         "extra_args": [],
+        "tiered":     False,       # run precise tiers first, broad tiers on demand
+        "stage2":     "on_pass",   # on_pass | background
+        "batch_size":    0,        # >0 → crash-isolating subprocess batches
+        "batch_timeout": 900,      # seconds per batch before it counts as hung
+        "preload":       [],       # e.g. [torch, torch._inductor] → warm forked workers
+        "budget":        None,     # e.g. "10m" → knapsack-trim selection to fit
+        "result_cache":      False,  # opt-in: reuse passes whose dependency fingerprint is unchanged
+        "result_cache_size": 5000,   # cached test files kept (LRU)
         "ignore_changed_patterns": [
             "*.json", "*.yaml", "*.yml", "*.csv", "*.db",
             "*.md", "*.txt", "*.lock", "*.toml", "*.cfg",
@@ -50,10 +59,32 @@ DEFAULTS = {
     },
     "ai": {
         "enabled":              True,
+        "provider":             "groq", # groq | local (offline rule-based stand-in)
         "groq_api_key":         "",     # set via tselect init or manually in yaml
         "model":                "llama-3.3-70b-versatile",
         "timeout":              15,
+        "max_retries":          2,      # transient errors (connection, 429, 5xx), jittered backoff
+        "retry_backoff":        0.5,    # seconds, doubled per attempt
+        "breaker_threshold":    3,      # consecutive failures → skip AI for the rest of the run
+        "breaker_cooldown":     300,    # seconds before one trial call is let through
         "confidence_threshold": 0.75,
+        "max_concurrency":      8,      # pre-filter requests in flight
+        "requests_per_minute":  30,     # token bucket — match the provider's limit
+        "deadline":             30,     # seconds; unanswered candidates are kept
+        "gate_tiers":           ["file", "proximity", "re-export"],  # null → send every tier
+        "token_budget":         60000,  # estimated prompt tokens per run; 0 → unlimited
+        "batch_size":           1,      # >1 → pack this many candidates per request
+        "batch_max_tokens":     6000,   # estimated prompt tokens per batched request
+        "cache":                True,   # reuse parsed decisions for identical prompts
+        "cache_ttl_hours":      168,
+        "cache_size":           2000,   # entries, least recently used evicted
+        "local": {                      # provider: local — latency / error injection
+            "latency":      0.2,
+            "jitter":       0.05,
+            "error_rate":   0.0,
+            "timeout_rate": 0.0,
+            "seed":         0,
+        },
     },
 }
 